@@ -0,0 +1,76 @@
+"""
+Measures time which the main process spends on getting a long list of submissions
+as objects or as Columns.
+
+Objects are decoded from JSON (de_json) or loaded from what another process could
+send back (pickle and to_bytes), Columns are made in process or by a process pool
+(decode_executor), where only JSON dumps of chunks and joining of parts are made by
+the main process. Best time of several runs is printed, gc is enabled.
+
+Usage: python benchmarks/decoding.py [number of submissions] [workers]
+"""
+
+import os
+import pickle
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from codeforces_api import json_backend  # noqa: E402
+from codeforces_api.columnar import to_columns  # noqa: E402
+from codeforces_api.parallel import _DecodingPool  # noqa: E402
+from codeforces_api.serialization import from_bytes, to_bytes  # noqa: E402
+from codeforces_api.types import Submission, _Interner  # noqa: E402
+from peak_rss import submission  # noqa: E402
+
+RUNS = 3
+
+
+def best(function, clock=time.perf_counter):
+    times = []
+    for _ in range(RUNS):
+        start = clock()
+        function()
+        times.append(clock() - start)
+    return min(times)
+
+
+def report(name, seconds, size=None):
+    size = "" if size is None else "%8.1f MB" % (size / 1000 / 1000)
+    print("%-36s %8.2f s%s" % (name, seconds, size))
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    workers = int(sys.argv[2]) if len(sys.argv) > 2 else 4
+    body = json_backend.dumps([submission(index) for index in range(count)])
+    print("%d submissions, JSON backend %s" % (count, json_backend.get_json_backend()))
+    report("JSON loads", best(lambda: json_backend.loads(body)), len(body))
+    result = json_backend.loads(body)
+
+    report("JSON dumps (sent to workers)", best(lambda: json_backend.dumps(result)))
+    report("de_json", best(lambda: [Submission.de_json(obj) for obj in result]))
+    objs = [Submission.de_json(obj) for obj in result]
+    data = pickle.dumps(objs, protocol=5)
+    report("pickle.loads", best(lambda: pickle.loads(data)), len(data))
+    data = to_bytes(objs)
+    report("from_bytes", best(lambda: from_bytes(data)), len(data))
+
+    interner = _Interner()
+    objs = [Submission.de_json(obj, interner) for obj in result]
+    data = pickle.dumps(objs, protocol=5)
+    report("pickle.loads, interned", best(lambda: pickle.loads(data)), len(data))
+
+    report("to_columns in process", best(lambda: to_columns(Submission, result)))
+    with ProcessPoolExecutor(workers) as executor:
+        pool = _DecodingPool(executor)
+        pool.to_columns(Submission, result)
+        # CPU time of the main process only, chunks are made by workers.
+        seconds = best(lambda: pool.to_columns(Submission, result), time.process_time)
+        report("to_columns by %d workers, main" % workers, seconds)
+
+
+if __name__ == "__main__":
+    main()
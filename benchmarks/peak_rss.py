@@ -0,0 +1,202 @@
+"""
+Measures peak memory (RSS) of API methods for large responses.
+
+Each method is called in a separate process with a synthetic response, which is
+served from a file by a requests adapter, so codeforces.com isn't used. Peak RSS
+above the one before the call is printed for raw results and for objects, it
+includes the returned result.
+
+Usage: python benchmarks/peak_rss.py [scale]
+"""
+
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+
+import requests
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from codeforces_api import CodeforcesApi  # noqa: E402
+
+VERDICTS = ("OK", "WRONG_ANSWER", "TIME_LIMIT_EXCEEDED", "RUNTIME_ERROR")
+
+# Measured methods and names of results which are returned for them.
+METHODS = (
+    ("contest_status", "contest_status"),
+    ("stream_contest_status", "contest_status"),
+    ("contest_standings", "contest_standings"),
+    ("contest_rating_changes", "contest_rating_changes"),
+)
+
+
+def submission(identifier):
+    return {
+        "id": identifier,
+        "contestId": 1,
+        "creationTimeSeconds": 1000 + identifier,
+        "relativeTimeSeconds": identifier,
+        "problem": {
+            "contestId": 1,
+            "index": "ABCDEFG"[identifier % 7],
+            "name": "Problem",
+            "type": "PROGRAMMING",
+            "points": 500.0,
+            "tags": ["math", "greedy"],
+        },
+        "author": {
+            "contestId": 1,
+            "members": [{"handle": "user%d" % (identifier % 5000)}],
+            "participantType": "CONTESTANT",
+            "ghost": False,
+            "startTimeSeconds": 1000,
+        },
+        "programmingLanguage": "GNU C++17",
+        "verdict": VERDICTS[identifier % 4],
+        "testset": "TESTS",
+        "passedTestCount": identifier % 30,
+        "timeConsumedMillis": 15,
+        "memoryConsumedBytes": 262144,
+    }
+
+
+def ranklist_row(rank):
+    return {
+        "party": {
+            "contestId": 1,
+            "members": [{"handle": "user%d" % rank}],
+            "participantType": "CONTESTANT",
+            "ghost": False,
+            "room": rank % 100,
+            "startTimeSeconds": 1000,
+        },
+        "rank": rank,
+        "points": 1000.0,
+        "penalty": 0,
+        "successfulHackCount": 0,
+        "unsuccessfulHackCount": 0,
+        "problemResults": [
+            {
+                "points": 500.0,
+                "rejectedAttemptCount": 0,
+                "type": "FINAL",
+                "bestSubmissionTimeSeconds": 600,
+            }
+            for _ in range(7)
+        ],
+    }
+
+
+def rating_change(rank):
+    return {
+        "contestId": 1,
+        "contestName": "Codeforces Round",
+        "handle": "user%d" % rank,
+        "rank": rank,
+        "ratingUpdateTimeSeconds": 5000,
+        "oldRating": 1500,
+        "newRating": 1500 + rank % 100,
+    }
+
+
+def results(scale):
+    contest = {
+        "id": 1,
+        "name": "Codeforces Round",
+        "type": "CF",
+        "phase": "FINISHED",
+        "frozen": False,
+        "durationSeconds": 7200,
+    }
+    problems = [submission(index)["problem"] for index in range(7)]
+    return {
+        "contest_status": [submission(index) for index in range(70000 * scale)],
+        "contest_standings": {
+            "contest": contest,
+            "problems": problems,
+            "rows": [ranklist_row(rank) for rank in range(1, 20000 * scale)],
+        },
+        "contest_rating_changes": [
+            rating_change(rank) for rank in range(1, 30000 * scale)
+        ],
+    }
+
+
+class FileAdapter(requests.adapters.BaseAdapter):
+    """
+    Returns the same response from the file for all requests.
+    """
+
+    def __init__(self, path):
+        super().__init__()
+        self.path = path
+
+    def send(self, request, **kwargs):
+        response = requests.Response()
+        response.status_code = 200
+        response.headers["Content-Type"] = "application/json"
+        response.raw = open(self.path, "rb")
+        response.request = request
+        response.url = request.url
+        return response
+
+    def close(self):
+        pass
+
+
+def peak_rss():
+    # ru_maxrss is in kilobytes on Linux and in bytes on macOS.
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / 1024 if sys.platform != "darwin" else peak / 1024 / 1024
+
+
+def measure(method, path, raw):
+    api = CodeforcesApi()
+    api.session.mount("https://codeforces.com/", FileAdapter(path))
+    before = peak_rss()
+    result = getattr(api, method)(1, raw=raw)
+    if method.startswith("stream_"):
+        result = list(result)
+    print(round(peak_rss() - before, 1))
+    return result
+
+
+def write_bodies(directory, scale):
+    for method, result in results(scale).items():
+        with open(os.path.join(directory, method + ".json"), "w") as body:
+            json.dump({"status": "OK", "result": result}, body)
+
+
+def run(*arguments):
+    return subprocess.check_output(
+        [sys.executable, __file__] + list(arguments), text=True
+    ).strip()
+
+
+def main():
+    # Every step is run in a new process, which peak RSS isn't affected by
+    # previous ones (it's inherited by child processes).
+    if sys.argv[1:2] == ["--write"]:
+        write_bodies(sys.argv[2], int(sys.argv[3]))
+        return
+    if sys.argv[1:2] == ["--measure"]:
+        measure(sys.argv[2], sys.argv[3], sys.argv[4] == "raw")
+        return
+    scale = sys.argv[1] if len(sys.argv) > 1 else "1"
+    print("%-24s %10s %12s %12s" % ("method", "body, MiB", "raw, MiB", "objects, MiB"))
+    with tempfile.TemporaryDirectory() as directory:
+        run("--write", directory, scale)
+        for method, name in METHODS:
+            path = os.path.join(directory, name + ".json")
+            peaks = [
+                run("--measure", method, path, kind) for kind in ("raw", "objects")
+            ]
+            size = os.path.getsize(path) / 1024 / 1024
+            print("%-24s %10.1f %12s %12s" % (method, size, *peaks))
+
+
+if __name__ == "__main__":
+    main()
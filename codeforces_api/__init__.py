@@ -15,8 +15,61 @@ You should have received a copy of the GNU General Public License
 along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 
-__all__ = ["CodeforcesApi", "CodeforcesApiRequestMaker", "CodeforcesParser"]
+__all__ = [
+    "AsyncCodeforcesApi",
+    "AsyncUserInfoBatcher",
+    "Cache",
+    "CodeforcesApi",
+    "CodeforcesApiError",
+    "CodeforcesApiRequestMaker",
+    "CodeforcesParser",
+    "CodeforcesResponseError",
+    "CodeforcesTimeoutError",
+    "CodeforcesUnavailableError",
+    "Columns",
+    "Deadline",
+    "DictionaryColumn",
+    "FileRateLimiter",
+    "HandleNotFoundError",
+    "MemoryCache",
+    "RateLimiter",
+    "RetryPolicy",
+    "SQLiteCache",
+    "Transport",
+    "UserInfoBatcher",
+    "from_bytes",
+    "from_pickle",
+    "get_json_backend",
+    "set_json_backend",
+    "to_bytes",
+    "to_dataframe",
+    "to_pickle",
+    "to_records",
+]
 from codeforces_api.api_request_maker import CodeforcesApiRequestMaker
 from codeforces_api.api_requests import CodeforcesApi
+from codeforces_api.async_api_requests import AsyncCodeforcesApi
+from codeforces_api.batching import AsyncUserInfoBatcher, UserInfoBatcher
+from codeforces_api.cache import Cache, MemoryCache, SQLiteCache
+from codeforces_api.columnar import Columns, DictionaryColumn
+from codeforces_api.deadline import Deadline
+from codeforces_api.exceptions import (
+    CodeforcesApiError,
+    CodeforcesResponseError,
+    CodeforcesTimeoutError,
+    CodeforcesUnavailableError,
+    HandleNotFoundError,
+)
+from codeforces_api.export import to_dataframe, to_records
+from codeforces_api.json_backend import get_json_backend, set_json_backend
 from codeforces_api.parse_methods import CodeforcesParser
+from codeforces_api.rate_limiter import FileRateLimiter, RateLimiter
+from codeforces_api.retry import RetryPolicy
+from codeforces_api.serialization import (
+    from_bytes,
+    from_pickle,
+    to_bytes,
+    to_pickle,
+)
+from codeforces_api.transport import Transport
 from codeforces_api.types import *
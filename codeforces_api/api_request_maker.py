@@ -16,13 +16,30 @@ along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 
 import collections
+import email.utils
 import hashlib
-import json
-import random
+import re
+import secrets
 import time
 
 import urllib
 
+from codeforces_api import json_backend
+from codeforces_api.exceptions import (
+    CodeforcesApiError,
+    CodeforcesResponseError,
+    CodeforcesUnavailableError,
+    HandleNotFoundError,
+)
+
+_HANDLE_NOT_FOUND = re.compile(r"User with handle (\S+) not found")
+
+# Size of chunks in which body of the response is read.
+BODY_CHUNK_SIZE = 64 * 1024
+
+# Maximal number of bytes of the body which are included in error messages.
+ERROR_SNIPPET_SIZE = 512
+
 
 class CodeforcesApiRequestMaker:
 
@@ -36,16 +53,16 @@ class CodeforcesApiRequestMaker:
         """
         Initializes main variables: api_key, secret, random (default is between 1
         and 1000000 unless specified)
+
+        By default every request is signed with a new random number, random_number
+        makes all requests use the given one.
         """
 
         if random_number == 1000000:
-            random_number = random.randint(100000, 999999)
+            random_number = _random_number()
             self.assigned_rand = True
-        elif random_number < 100000 and random_number > 999999:
-            raise Exception(
-                "The non-6-digit number passed as random_number for API Signature",
-                random_number,
-            )
+        else:
+            _check_random_number(random_number, "API Signature")
         if api_key is None and secret is None:
             self.anonymous = True
         else:
@@ -57,59 +74,164 @@ class CodeforcesApiRequestMaker:
     def generate_request(self, method_name, **fields):
         """
         Generates request URL and data for API.
+
+        Signature is computed only from arguments and local variables, so requests
+        can be generated from many threads at the same time.
         """
         request_url = "https://codeforces.com/api/" + str(method_name)
         if not self.anonymous:
-            # Renew Rand
-            if not self.assigned_rand:
-                self.renew_rand()
+            # Every request gets its own random number unless it was specified.
+            rand = _random_number() if self.assigned_rand else self._rand
 
             current_time = time.time()
             fields["apiKey"] = str(self._api_key)
             fields["time"] = str(int(current_time))
-            api_signature = str(self._rand) + "/" + method_name + "?"
+            api_signature = str(rand) + "/" + method_name + "?"
             fields = collections.OrderedDict(sorted(fields.items()))
             api_signature += urllib.parse.urlencode(fields, safe=";")
             api_signature += "#" + str(self._secret)
             hashed_signature = hashlib.sha512(api_signature.encode("utf-8"))
-            fields["apiSig"] = str(self._rand) + str(hashed_signature.hexdigest())
+            fields["apiSig"] = str(rand) + str(hashed_signature.hexdigest())
         return {"request_url": request_url, "data": fields}
 
-    def check_return_code(self, response):
+    def check_return_code(self, response, status_code=200, retry_after=None):
         """
         Checks if a returned response is OK.
 
         If not OK Exception will be raised will additional info.
         """
         if response["status"] != "OK":
-            raise Exception(
+            comment = response.get("comment")
+            error = CodeforcesApiError
+            extra = {}
+            match = _HANDLE_NOT_FOUND.search(comment or "")
+            if match is not None:
+                error = HandleNotFoundError
+                extra["handle"] = match.group(1)
+            raise error(
                 "Request returned not OK status",
                 response["status"],
-                response["comment"],
+                comment,
+                status_code=status_code,
+                comment=comment,
+                retry_after=retry_after,
+                **extra
             )
 
     def renew_rand(self, random_number=1000000):
         """
         It's recommended that you renew your apiSig for each request
         default is between 100000 and 1000000 unless specified)
+
+        Random numbers are renewed for each request unless a number was specified,
+        given random_number is used for all following requests.
         """
         if random_number == 1000000:
-            random_number = random.randint(100000, 999999)
-        elif random_number < 100000 and random_number > 999999:
-            raise Exception(
-                "The non-6-digit number passed as random_number for renew_rand",
-                random_number,
-            )
+            random_number = _random_number()
+        else:
+            _check_random_number(random_number, "renew_rand")
+            self.assigned_rand = False
+        self._rand = random_number
+
+    def get_response(self, request, deadline=None):
+        """
+        Returns result of the request made with requests library.
+
+        Body is read once into a buffer (request should be made with stream=True to
+        avoid another copy) and the response is closed before parsing.
+
+        deadline (a Deadline) is checked after each chunk of the body.
+        """
+        with request:
+            status_code, headers = request.status_code, request.headers
+            content = _read_body(request.iter_content(BODY_CHUNK_SIZE), deadline)
+        return self.parse_response(status_code, content, headers)
+
+    def parse_response(self, status_code, content, headers=None):
+        """
+        Checks status code and body of the response and returns its result.
 
-    def get_response(self, request):
-        if request.status_code != 200:
-            raise Exception("Server returned status code: " + str(request.status_code))
+        content is a raw body of the response (bytes or bytearray), so it can be used
+        with any HTTP client. Only the first ERROR_SNIPPET_SIZE bytes of it are
+        included in error messages.
+        """
+        retry_after = None
+        if headers is not None:
+            retry_after = _parse_retry_after(headers.get("Retry-After"))
+        if status_code == 502:
+            raise CodeforcesUnavailableError(
+                "Codeforces is unavailable now.",
+                status_code=status_code,
+                retry_after=retry_after,
+            )
         try:
-            response = request.json()
-            self.check_return_code(response)
-            return response["result"]
-        except json.decoder.JSONDecodeError as error:
-            raise ValueError(
+            response = json_backend.loads(content)
+        except json_backend.DecodeError as error:
+            if status_code != 200:
+                raise CodeforcesApiError(
+                    "Server returned status code: " + str(status_code),
+                    status_code=status_code,
+                    retry_after=retry_after,
+                )
+            raise CodeforcesResponseError(
                 "A lot of users, try to reduce the number of users in the list.\nError: %s.\nResponse text: %s"
-                % (str(error), request.text)
+                % (str(error), _snippet(content)),
+                status_code=status_code,
+            )
+        if status_code != 200 and response.get("status") != "FAILED":
+            raise CodeforcesApiError(
+                "Server returned status code: " + str(status_code),
+                status_code=status_code,
+                retry_after=retry_after,
             )
+        self.check_return_code(response, status_code, retry_after)
+        return response["result"]
+
+
+def _random_number():
+    return secrets.randbelow(900000) + 100000
+
+
+def _check_random_number(random_number, purpose):
+    if random_number < 100000 or random_number > 999999:
+        raise Exception(
+            "The non-6-digit number passed as random_number for " + purpose,
+            random_number,
+        )
+
+
+def _read_body(chunks, deadline=None):
+    """
+    Returns bytearray with all chunks, which are appended without keeping them and
+    joining at the end.
+    """
+    body = bytearray()
+    for chunk in chunks:
+        body += chunk
+        if deadline is not None:
+            deadline.check()
+    return body
+
+
+def _snippet(content):
+    snippet = bytes(content[:ERROR_SNIPPET_SIZE]).decode("utf-8", errors="replace")
+    if len(content) > ERROR_SNIPPET_SIZE:
+        snippet += "..."
+    return snippet
+
+
+def _parse_retry_after(value):
+    """
+    Returns number of seconds from Retry-After header, which can be a date as well.
+    """
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        date = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, date.timestamp() - time.time())
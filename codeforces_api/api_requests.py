@@ -15,9 +15,27 @@ You should have received a copy of the GNU General Public License
 along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 
-import requests
+import concurrent.futures
+import functools
+import time
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
 
 from codeforces_api.api_request_maker import CodeforcesApiRequestMaker
+from codeforces_api.cache import CONTEST_METHODS
+from codeforces_api.columnar import to_columns
+from codeforces_api.deadline import _deadline, _remaining
+from codeforces_api.exceptions import (
+    CodeforcesApiError,
+    CodeforcesResponseError,
+    CodeforcesTimeoutError,
+    HandleNotFoundError,
+)
+from codeforces_api.json_stream import STREAM_CHUNK_SIZE, JSONArrayStream
+from codeforces_api.parallel import DECODE_CHUNK_SIZE, _DecodingPool
+from codeforces_api.retry import NETWORK_ERRORS
+from codeforces_api.single_flight import SingleFlight
+from codeforces_api.transport import Transport
 from codeforces_api.types import (
     BlogEntry,
     Comment,
@@ -30,103 +48,744 @@ from codeforces_api.types import (
     RecentAction,
     Submission,
     User,
+    _Interner,
+    _lazy_type,
+    _projection,
 )
 
+# Gym contests have ids starting from this number.
+GYM_MIN_ID = 100000
+
+# Maximal number of handles in one request.
+MAX_HANDLES = 10000
+
+# Statuses of responses to too large requests, their chunks of handles are bisected.
+OVERSIZED_STATUSES = (413, 414)
+
+
+def _decoder(cls, lazy=False, raw=False, fields=None, interner=None):
+    """
+    Returns function which makes result for JSON object of type cls: the object
+    itself if raw, named tuple with given fields or object of type cls.
+
+    Objects which repeat are shared if interner is given (and objects aren't lazy).
+    """
+    if raw:
+        return _unchanged
+    if fields is not None:
+        return _projection(cls, _fields_key(fields))
+    if lazy:
+        return _lazy_type(cls).de_json
+    if interner is not None:
+        return functools.partial(cls.de_json, interner=interner)
+    return cls.de_json
+
+
+def _unchanged(obj):
+    return obj
+
+
+def _fields_key(fields):
+    if isinstance(fields, str):
+        return (fields,)
+    return tuple(fields)
+
+
+def _parser(shape, cls, raw=False, fields=None, columnar=False):
+    """
+    Returns function which parses result of the call, None if raw result is needed.
+
+    shape is "list" for list of objects of type cls, "object" for one object,
+    "standings" and "problemset" for results of contest.standings (cls is used for
+    rows) and problemset.problems (cls is used for problems).
+
+    List of objects (or rows) is returned as Columns if columnar is set.
+
+    Long lists are made Columns in chunks by pool (_DecodingPool) if it's given,
+    long lists of objects are decoded in process with a warning.
+    """
+    if raw:
+        return None
+    if fields is not None:
+        fields = _fields_key(fields)
+        # Unknown fields are reported before the request.
+        _projection(cls, fields)
+    return _make_parser(shape, cls, fields, columnar)
+
+
+@functools.lru_cache(maxsize=None)
+def _make_parser(shape, cls, fields, columnar):
+    def parse(result, lazy=False, intern=False, pool=None):
+        interner = _Interner() if intern else None
+        decode = _decoder(cls, lazy, fields=fields, interner=interner)
+        if shape == "list":
+            if columnar:
+                if pool is not None and pool.accepts(result):
+                    return pool.to_columns(cls, result)
+                return to_columns(cls, result)
+            if pool is not None and pool.accepts(result):
+                pool.warn_in_process()
+            return [decode(obj) for obj in result]
+        if shape == "object":
+            return decode(result)
+        if shape == "standings":
+            if columnar and pool is not None and pool.accepts(result["rows"]):
+                rows = pool.to_columns(cls, result["rows"], result["problems"])
+            elif columnar:
+                rows = to_columns(cls, result["rows"], result["problems"])
+            else:
+                if pool is not None and pool.accepts(result["rows"]):
+                    pool.warn_in_process()
+                rows = [decode(row) for row in result["rows"]]
+            return {
+                "contest": _decoder(Contest, lazy)(result["contest"]),
+                "problems": [
+                    _decoder(Problem, lazy, interner=interner)(problem)
+                    for problem in result["problems"]
+                ],
+                "rows": rows,
+            }
+        if pool is not None and pool.accepts(result["problems"]):
+            pool.warn_in_process()
+        return {
+            "problems": [decode(problem) for problem in result["problems"]],
+            "problem_statistics": [
+                _decoder(ProblemStatistic, lazy)(problem_statistic)
+                for problem_statistic in result["problemStatistics"]
+            ],
+        }
+
+    return parse
+
+
+def _join_handles(handles):
+    return "".join(str(handle) + ";" for handle in handles)
+
+
+def _split_handles(handles, chunk_size):
+    return [
+        handles[start : start + chunk_size]
+        for start in range(0, max(len(handles), 1), chunk_size)
+    ]
+
+
+def _is_chunk_error(error):
+    """
+    Checks if request for a chunk of handles failed because of a missing handle or
+    size of the request: response can't be parsed, its status is 413 or 414, or it's
+    400 without comment (e.g. too long URL of GET request).
+    """
+    if isinstance(error, (HandleNotFoundError, CodeforcesResponseError)):
+        return True
+    if error.status_code in OVERSIZED_STATUSES:
+        return True
+    return error.status_code == 400 and error.comment is None
+
+
+def _split_failed_chunk(chunk, error, skip_missing):
+    """
+    Returns parts of the failed chunk which should be requested again.
+
+    Missing handle is removed if it's known, otherwise chunk is bisected.
+    """
+    if isinstance(error, HandleNotFoundError):
+        if not skip_missing:
+            raise error
+        missing = str(error.handle).lower()
+        rest = [handle for handle in chunk if str(handle).lower() != missing]
+        if len(rest) < len(chunk):
+            return [rest] if rest else []
+        if len(chunk) == 1:
+            return []
+    elif len(chunk) == 1:
+        raise error
+    middle = len(chunk) // 2
+    return [chunk[:middle], chunk[middle:]]
+
+
+def _merge_chunks(method, results):
+    """
+    Merges results of requests for chunks of handles in the order of chunks.
+    """
+    if method != "contest.standings":
+        return [obj for result in results for obj in result]
+    merged = dict(results[0])
+    merged["rows"] = [row for result in results for row in result["rows"]]
+    return merged
+
+
+def _join_chunk_results(method, chunk_results):
+    """
+    Returns list of results of all chunks.
+
+    chunk_results contains list of results or CodeforcesTimeoutError for each chunk,
+    if some chunk wasn't received, CodeforcesTimeoutError is raised with merged
+    results of received ones as partial.
+    """
+    results = []
+    timeout = None
+    for chunk_result in chunk_results:
+        if isinstance(chunk_result, CodeforcesTimeoutError):
+            timeout = chunk_result
+        else:
+            results.extend(chunk_result)
+    if timeout is not None:
+        partial = _merge_chunks(method, results) if results else None
+        raise CodeforcesTimeoutError(*timeout.args, partial=partial) from timeout
+    return results
+
+
+def _retry_delay(retry_policy, error, attempt, deadline):
+    """
+    Returns number of seconds to wait before the next attempt or None if error should
+    be raised.
+
+    CodeforcesTimeoutError is raised instead of error if the next attempt can't be
+    made before deadline or error is a network timeout after the deadline.
+    """
+    retry = retry_policy is not None and retry_policy.should_retry(error, attempt)
+    if deadline is None:
+        return retry_policy.delay(error, attempt) if retry else None
+    if not retry:
+        if deadline.expired() and isinstance(error, NETWORK_ERRORS):
+            raise CodeforcesTimeoutError("Deadline of the call is exceeded.") from error
+        return None
+    delay = retry_policy.delay(error, attempt)
+    if delay >= deadline.remaining():
+        raise CodeforcesTimeoutError(
+            "There is no time left for the next attempt before the deadline."
+        ) from error
+    return delay
+
+
+def _skip_shifted(page, last_id):
+    """
+    Skips submissions which were yielded on the previous page.
+
+    New submissions shift pages, because they are sorted from the newest ones.
+    """
+    if last_id is None:
+        return page
+    return [obj for obj in page if obj["id"] < last_id]
+
 
 class CodeforcesApi(CodeforcesApiRequestMaker):
     """
     Class for using official API requests.
+
+    Methods which return objects accept raw and fields arguments. raw=True returns
+    result from codeforces.com as is. fields is a list of attributes (nested ones are
+    separated by dots, e.g. "problem.index"), named tuples with only these attributes
+    are returned instead of objects.
+
+    contest_status, user_status, problemset_recent_status, contest_standings (for
+    rows) and contest_rating_changes accept columnar=True, which returns Columns
+    with arrays of values of every field instead of list of objects.
+
+    All methods accept timeout: number of seconds or a Deadline, which can be shared
+    by several calls. Waiting for rate limit, all retries and responses should fit
+    into it (for iter_* and stream_* methods the whole iteration), otherwise
+    CodeforcesTimeoutError is raised. user_info and contest_standings with handles
+    return results of received chunks of handles as its partial attribute.
     """
 
     session = None
     method = None
-
-    def _make_request(self, method, **payload):
+    rate_limiter = None
+    retry_policy = None
+    cache = None
+    single_flight = None
+    handles_chunk_size = 10000
+    chunk_workers = 4
+    lazy = False
+    intern = False
+    _decoding_pool = None
+    _finished_contests = None
+    transport = None
+    _owns_transport = False
+
+    def _make_request(self, method, deadline=None, **payload):
         """
         Making request to codeforces.com
 
         Uses different methods (POST or GET) but be aware of 413 error when using GET.
+
+        Results are taken from cache and stored to it if cache is set.
+
+        deadline is a Deadline for the request with all retries or None.
+        """
+        if self.cache is None or not self.cache.cacheable(method):
+            return self._fetch(method, deadline, **payload)
+        key = self._cache_key(method, payload)
+        result = self.cache.get(key)
+        if result is None:
+            result = self._fetch(method, deadline, **payload)
+            ttl = self._cache_ttl(method, payload, result, deadline)
+            if ttl != 0:
+                self.cache.set(key, result, ttl)
+        return result
+
+    def _cache_ttl(self, method, payload, result, deadline=None):
+        """
+        Returns time to live for result, contest methods depend on the contest phase.
+
+        If the phase can't be received, the default time to live of method is used.
+        """
+        if method not in CONTEST_METHODS:
+            return self.cache.ttl(method)
+        if method == "contest.standings":
+            phase = result["contest"]["phase"]
+        else:
+            try:
+                phase = self._contest_phase(int(payload["contestId"]), deadline)
+            except (CodeforcesApiError,) + NETWORK_ERRORS:
+                # Result is received, so failed lookup of the phase isn't raised.
+                phase = None
+        return self.cache.contest_ttl(method, phase, result)
+
+    def _contest_phase(self, contest_id, deadline=None):
+        """
+        Returns phase of the contest from cached contest list or None if it's unknown.
+        """
+        if contest_id in self._finished_contests:
+            return "FINISHED"
+        contests = self._make_request(
+            "contest.list", deadline, **{"gym": str(contest_id >= GYM_MIN_ID).lower()}
+        )
+        return self._find_contest_phase(contests, contest_id)
+
+    def _find_contest_phase(self, contests, contest_id):
+        for contest in contests:
+            if contest["phase"] == "FINISHED":
+                self._finished_contests.add(contest["id"])
+            if contest["id"] == contest_id:
+                return contest["phase"]
+        return None
+
+    def _cache_key(self, method, payload):
+        """
+        Returns cache key for request: method with sorted unsigned parameters.
+
+        Results of authorized requests are stored separately for each api_key.
+        """
+        key = method + "?" + urllib.parse.urlencode(sorted(payload.items()), True)
+        if not self.anonymous:
+            key += "#" + str(self._api_key)
+        return key
+
+    def _fetch(self, method, deadline=None, **payload):
+        """
+        Making request, transient failures are retried according to retry_policy.
+        """
+        return self._retrying(lambda: self._send(method, deadline, **payload), deadline)
+
+    def _retrying(self, function, deadline=None):
+        """
+        Returns function(), which is called again on transient failures.
+
+        Failure is raised as CodeforcesTimeoutError if there is no time for the next
+        attempt before deadline or it's a network timeout after the deadline.
+        """
+        attempt = 1
+        while True:
+            try:
+                return function()
+            except CodeforcesTimeoutError:
+                raise
+            except Exception as error:
+                delay = _retry_delay(self.retry_policy, error, attempt, deadline)
+                if delay is None:
+                    raise
+                time.sleep(delay)
+            attempt += 1
+
+    def _send(self, method, deadline=None, **payload):
+        """
+        Making single attempt of the request.
         """
+        self._wait_for_rate_limit(deadline)
         request_data = self.generate_request(method, **payload)
         request = self.session.request(
-            self.method, request_data["request_url"], data=request_data["data"]
+            self.method,
+            request_data["request_url"],
+            data=request_data["data"],
+            stream=True,
+            **self.transport.request_options(deadline)
+        )
+        return self.get_response(request, deadline)
+
+    def _send_stream(self, method, payload, deadline=None):
+        """
+        Making single attempt of the request, which body will be read in chunks.
+        """
+        self._wait_for_rate_limit(deadline)
+        request_data = self.generate_request(method, **payload)
+        request = self.session.request(
+            self.method,
+            request_data["request_url"],
+            data=request_data["data"],
+            stream=True,
+            **self.transport.request_options(deadline)
+        )
+        if request.status_code != 200:
+            with request:
+                self.get_response(request, deadline)
+        return request
+
+    def _wait_for_rate_limit(self, deadline):
+        """
+        Waits until the request is allowed by rate_limiter, CodeforcesTimeoutError is
+        raised if it isn't allowed before deadline.
+        """
+        if deadline is not None:
+            deadline.check()
+        if self.rate_limiter is not None and not self.rate_limiter.acquire(
+            _remaining(deadline)
+        ):
+            raise CodeforcesTimeoutError(
+                "Rate limit doesn't allow the request before the deadline."
+            )
+
+    def _stream(
+        self,
+        cls,
+        method,
+        payload,
+        key="result",
+        raw=False,
+        fields=None,
+        deadline=None,
+    ):
+        """
+        Yields objects of type cls from the array with given key while the response
+        is downloaded, raw and fields are the same as for other methods.
+
+        Results aren't cached, transient failures are retried only until the response
+        is received.
+        """
+        decode = _decoder(cls, self.lazy, raw, fields, self._interner())
+        request = self._retrying(
+            lambda: self._send_stream(method, payload, deadline), deadline
+        )
+        with request:
+            stream = JSONArrayStream(key)
+            for chunk in request.iter_content(STREAM_CHUNK_SIZE):
+                if deadline is not None:
+                    deadline.check()
+                for obj in stream.feed(chunk):
+                    yield decode(obj)
+            document = stream.close()
+        if document is not None:
+            self.check_return_code(document, request.status_code)
+            raise CodeforcesResponseError("There is no %s in the response." % key)
+
+    def _call(self, parse, method, deadline=None, **payload):
+        """
+        Making request and parsing its result with parse function.
+
+        If parse is None, result is returned as is.
+
+        Identical calls made at the same time share one request if single_flight is set.
+        """
+        return self._coalesced(
+            (parse, self._cache_key(method, payload)),
+            lambda: self._parse(parse, self._make_request(method, deadline, **payload)),
+            deadline,
         )
-        if request.status_code == 502:
-            raise SystemError("Codeforces is unavailable now.")
-        return self.get_response(request)
 
-    def __init__(self, api_key=None, secret=None, random_number=1000000, method="POST"):
+    def _call_chunked(
+        self, parse, method, handles, skip_missing=False, deadline=None, **payload
+    ):
+        """
+        Making requests for handles split into chunks and parsing merged result.
+
+        Chunks are requested concurrently, chunk which fails because of its size or
+        missing handle (if skip_missing) is bisected and requested again.
+
+        If not all chunks are received before deadline, CodeforcesTimeoutError is
+        raised with parsed result of received ones as partial.
+        """
+
+        def call():
+            try:
+                result = self._request_chunks(
+                    method, handles, skip_missing, payload, deadline
+                )
+            except CodeforcesTimeoutError as error:
+                if error.partial is not None:
+                    error.partial = self._parse(parse, error.partial)
+                raise
+            return self._parse(parse, result)
+
+        key = (parse, self._cache_key(method, payload), tuple(handles), skip_missing)
+        return self._coalesced(key, call, deadline)
+
+    def _request_chunks(self, method, handles, skip_missing, payload, deadline=None):
+        def fetch(chunk):
+            try:
+                return self._fetch_chunk(method, chunk, skip_missing, payload, deadline)
+            except CodeforcesTimeoutError as error:
+                return error
+
+        chunks = _split_handles(handles, self.handles_chunk_size)
+        if len(chunks) == 1:
+            results = [fetch(chunks[0])]
+        else:
+            with ThreadPoolExecutor(self.chunk_workers) as executor:
+                results = list(executor.map(fetch, chunks))
+        results = _join_chunk_results(method, results)
+        if not results and method == "contest.standings":
+            # All handles are missing, so only contest and problems are needed.
+            result = self._make_request(method, deadline, **dict(payload, count="1"))
+            # Result may be stored in cache, so it isn't changed.
+            results = [dict(result, rows=[])]
+        return _merge_chunks(method, results)
+
+    def _fetch_chunk(self, method, chunk, skip_missing, payload, deadline=None):
+        """
+        Returns list of results for the chunk, several if it was bisected.
+        """
+        try:
+            return [
+                self._make_request(
+                    method, deadline, **dict(payload, handles=_join_handles(chunk))
+                )
+            ]
+        except CodeforcesApiError as error:
+            if not _is_chunk_error(error):
+                raise
+            parts = _split_failed_chunk(chunk, error, skip_missing)
+        results = []
+        for part in parts:
+            results.extend(
+                self._fetch_chunk(method, part, skip_missing, payload, deadline)
+            )
+        return results
+
+    def _iter_pages(
+        self,
+        cls,
+        method,
+        payload,
+        page_size,
+        prefetch,
+        rows_key=None,
+        raw=False,
+        fields=None,
+        deadline=None,
+    ):
+        """
+        Yields objects of type cls requesting them with from and count parameters.
+
+        rows_key is the key of the list in the result if result isn't a list, raw and
+        fields are the same as for other methods.
+        """
+        decode = _decoder(cls, self.lazy, raw, fields, self._interner())
+
+        def fetch(start):
+            page = self._make_request(
+                method,
+                deadline,
+                **dict(payload, **{"from": str(start), "count": str(page_size)})
+            )
+            return page if rows_key is None else page[rows_key]
+
+        executor = ThreadPoolExecutor(1) if prefetch else None
+        try:
+            start = 1
+            page = fetch(start)
+            last_id = None
+            while True:
+                following = None
+                if len(page) == page_size and executor is not None:
+                    following = executor.submit(fetch, start + page_size)
+                for obj in _skip_shifted(page, last_id):
+                    yield decode(obj)
+                if len(page) < page_size:
+                    return
+                if cls is Submission and page:
+                    last_id = page[-1]["id"]
+                start += page_size
+                page = fetch(start) if following is None else following.result()
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=False)
+
+    def _coalesced(self, key, function, deadline=None):
+        """
+        Returns function(), which is shared by identical calls if single_flight is set.
+
+        Identical call which is already running is awaited until deadline.
+        """
+        if self.single_flight is None:
+            return function()
+        try:
+            return self.single_flight.do(key, function, _remaining(deadline))
+        except CodeforcesTimeoutError:
+            raise
+        except concurrent.futures.TimeoutError:
+            if deadline is None:
+                raise
+            raise CodeforcesTimeoutError(
+                "Identical call didn't finish before the deadline."
+            ) from None
+
+    def _interner(self):
+        return _Interner() if self.intern else None
+
+    def _parse(self, parse, result):
+        if parse is None:
+            return result
+        return parse(result, self.lazy, self.intern, self._decoding_pool)
+
+    def _create_session(self):
+        return self.transport.session
+
+    def _create_single_flight(self):
+        return SingleFlight()
+
+    def __init__(
+        self,
+        api_key=None,
+        secret=None,
+        random_number=1000000,
+        method="POST",
+        rate_limiter=None,
+        retry_policy=None,
+        cache=None,
+        single_flight=False,
+        handles_chunk_size=10000,
+        chunk_workers=4,
+        lazy=False,
+        intern=False,
+        decode_executor=None,
+        decode_chunk_size=DECODE_CHUNK_SIZE,
+        transport=None,
+    ):
         """
         Initializing class. All we will need is a session to optimize performance.
+
+        rate_limiter is a RateLimiter, share one between clients to keep all of them
+        under the Codeforces call limit.
+
+        retry_policy is a RetryPolicy for transient failures, by default requests
+        aren't retried.
+
+        cache is a MemoryCache or SQLiteCache for results of requests.
+
+        single_flight is used for sharing one request and its parsed result between
+        identical calls made at the same time from different threads.
+
+        handles_chunk_size is the maximal number of handles in one request (up to
+        10000), longer lists are split and requested by chunk_workers threads.
+
+        lazy makes returned objects keep JSON and decode each attribute (including
+        nested objects) only when it's accessed for the first time.
+
+        intern makes objects which repeat in one response (problems, members, equal
+        parties) and values like verdict shared, so don't change returned objects.
+
+        decode_executor is an executor (usually ProcessPoolExecutor, it may be shared
+        between clients) for making columnar results longer than decode_chunk_size
+        in chunks of that size. It's used only with columnar=True: lists of objects
+        (e.g. contest_list(gym=True)) are decoded in process, which is faster than
+        sending objects back from other processes, and RuntimeWarning is issued
+        when such list is longer than decode_chunk_size.
+
+        transport is a Transport with connection pool, timeouts and proxies, share one
+        between clients to share connections. By default client makes its own one.
         """
         super().__init__(api_key, secret, random_number)
-        self.session = requests.Session()
+        self.rate_limiter = rate_limiter
+        self.retry_policy = retry_policy
+        self.cache = cache
+        self._finished_contests = set()
+        if handles_chunk_size < 1 or handles_chunk_size > MAX_HANDLES:
+            raise OverflowError(
+                "handles_chunk_size should be between 1 and %d" % MAX_HANDLES
+            )
+        self.handles_chunk_size = handles_chunk_size
+        self.chunk_workers = chunk_workers
+        self.lazy = lazy
+        self.intern = intern
+        if decode_executor is not None:
+            self._decoding_pool = _DecodingPool(decode_executor, decode_chunk_size)
+        if single_flight:
+            self.single_flight = self._create_single_flight()
+        self._owns_transport = transport is None
+        self.transport = Transport() if transport is None else transport
+        self.session = self._create_session()
         if method == "POST" or method == "GET":
             self.method = method
         else:
             raise ValueError("method should be POST or GET")
 
-    def blog_entry_comments(self, blog_entry_id):
+    def blog_entry_comments(self, blog_entry_id, raw=False, fields=None, timeout=None):
         """
         Get blogEntry.comments for blog, blog_entry_id required.
 
         Returns parsed response from codeforces.com.
         """
-        return [
-            Comment.de_json(comment)
-            for comment in self._make_request(
-                "blogEntry.comments", **{"blogEntryId": str(blog_entry_id)}
-            )
-        ]
+        return self._call(
+            _parser("list", Comment, raw, fields),
+            "blogEntry.comments",
+            deadline=_deadline(timeout),
+            **{"blogEntryId": str(blog_entry_id)}
+        )
 
-    def blog_entry_view(self, blog_entry_id):
+    def blog_entry_view(self, blog_entry_id, raw=False, fields=None, timeout=None):
         """
         Get blogEntry.view for blog, blog_entry_id required.
 
         Returns parsed response from codeforces.com.
         """
-        return BlogEntry.de_json(
-            self._make_request("blogEntry.view", **{"blogEntryId": str(blog_entry_id)})
+        return self._call(
+            _parser("object", BlogEntry, raw, fields),
+            "blogEntry.view",
+            deadline=_deadline(timeout),
+            **{"blogEntryId": str(blog_entry_id)}
         )
 
-    def contest_hacks(self, contest_id):
+    def contest_hacks(self, contest_id, raw=False, fields=None, timeout=None):
         """
         Get contest.hacks for contest, contest_id required.
 
         Returns parsed response from codeforces.com.
         """
-        return [
-            Hack.de_json(hack)
-            for hack in self._make_request(
-                "contest.hacks", **{"contestId": str(contest_id)}
-            )
-        ]
+        return self._call(
+            _parser("list", Hack, raw, fields),
+            "contest.hacks",
+            deadline=_deadline(timeout),
+            **{"contestId": str(contest_id)}
+        )
 
-    def contest_list(self, gym=False):
+    def contest_list(self, gym=False, raw=False, fields=None, timeout=None):
         """
         Get all contests you can get all gym by gym parameter.
 
         Returns parsed response from codeforces.com
         """
-        return [
-            Contest.de_json(contest)
-            for contest in self._make_request(
-                "contest.list", **{"gym": str(gym).lower()}
-            )
-        ]
+        return self._call(
+            _parser("list", Contest, raw, fields),
+            "contest.list",
+            deadline=_deadline(timeout),
+            **{"gym": str(gym).lower()}
+        )
 
-    def contest_rating_changes(self, contest_id):
+    def contest_rating_changes(
+        self, contest_id, raw=False, fields=None, columnar=False, timeout=None
+    ):
         """
         Get contest.ratingChanges for the contest, contest_id required.
 
         Returns parsed response from codeforces.com.
         """
-        return [
-            RatingChange.de_json(rating_change)
-            for rating_change in self._make_request(
-                "contest.ratingChanges", **{"contestId": str(contest_id)}
-            )
-        ]
+        return self._call(
+            _parser("list", RatingChange, raw, fields, columnar),
+            "contest.ratingChanges",
+            deadline=_deadline(timeout),
+            **{"contestId": str(contest_id)}
+        )
 
     def contest_standings(
         self,
@@ -136,6 +795,11 @@ class CodeforcesApi(CodeforcesApiRequestMaker):
         handles=[""],
         room=-1,
         show_unofficial=False,
+        skip_missing=False,
+        raw=False,
+        fields=None,
+        columnar=False,
+        timeout=None,
     ):
         """
         Get contest.standings for contest, contest_id required.
@@ -144,48 +808,57 @@ class CodeforcesApi(CodeforcesApiRequestMaker):
 
         count defines how many submits will be returned.
 
-        handles should be a list of handles to get (max 10000).
+        handles should be a list of handles to get, long lists are split into chunks
+        of handles_chunk_size handles and rows are returned in the order of chunks.
 
         room is the number of the room which is needed.
 
         show_unofficial is used for adding or removing not official participants.
 
+        skip_missing is used for skipping handles of not existing users instead of
+        raising HandleNotFoundError.
+
         Returns parsed response from codeforces.com.
         """
         if not isinstance(handles, list):
             raise TypeError("Handles should be a list")
-        if len(handles) > 10000:
-            raise OverflowError(
-                "Max count of handles should be less or equal to 10000."
-            )
         parameters = {
             "contestId": str(contest_id),
             "showUnofficial": str(show_unofficial).lower(),
         }
         if start != -1:
-            parameters["start"] = str(start)
+            parameters["from"] = str(start)
         if count != -1:
             parameters["count"] = str(count)
-        if handles != [""]:
-            handles_str = ""
-            for handle in handles:
-                handles_str += str(handle) + ";"
-            parameters["handles"] = handles_str
         if room != -1:
             parameters["room"] = str(room)
-        response = self._make_request("contest.standings", **parameters)
-        result = {
-            "contest": Contest.de_json(response["contest"]),
-            "problems": [],
-            "rows": [],
-        }
-        for problem in response["problems"]:
-            result["problems"].append(Problem.de_json(problem))
-        for row in response["rows"]:
-            result["rows"].append(RanklistRow.de_json(row))
-        return result
+        if handles != [""]:
+            return self._call_chunked(
+                _parser("standings", RanklistRow, raw, fields, columnar),
+                "contest.standings",
+                handles,
+                skip_missing,
+                deadline=_deadline(timeout),
+                **parameters
+            )
+        return self._call(
+            _parser("standings", RanklistRow, raw, fields, columnar),
+            "contest.standings",
+            deadline=_deadline(timeout),
+            **parameters
+        )
 
-    def contest_status(self, contest_id, handle="", start=-1, count=-1):
+    def contest_status(
+        self,
+        contest_id,
+        handle="",
+        start=-1,
+        count=-1,
+        raw=False,
+        fields=None,
+        columnar=False,
+        timeout=None,
+    ):
         """
         Get contest.status for contest, contest_id required.
 
@@ -203,15 +876,19 @@ class CodeforcesApi(CodeforcesApiRequestMaker):
         if handle != "":
             parameters["handle"] = handle
         if start != -1:
-            parameters["start"] = str(start)
+            parameters["from"] = str(start)
         if count != -1:
             parameters["count"] = str(count)
-        return [
-            Submission.de_json(submission)
-            for submission in self._make_request("contest.status", **parameters)
-        ]
+        return self._call(
+            _parser("list", Submission, raw, fields, columnar),
+            "contest.status",
+            deadline=_deadline(timeout),
+            **parameters
+        )
 
-    def problemset_problems(self, tags=[""], problemset_name=""):
+    def problemset_problems(
+        self, tags=[""], problemset_name="", raw=False, fields=None, timeout=None
+    ):
         """
         Get problemset.problems.
 
@@ -228,17 +905,22 @@ class CodeforcesApi(CodeforcesApiRequestMaker):
             parameters["tags"] = tags
         if problemset_name != "":
             parameters["problemsetName"] = problemset_name
-        result = {"problems": [], "problem_statistics": []}
-        response = self._make_request("problemset.problems", **parameters)
-        for problem in response["problems"]:
-            result["problems"].append(Problem.de_json(problem))
-        for problem_statistic in response["problemStatistics"]:
-            result["problem_statistics"].append(
-                ProblemStatistic.de_json(problem_statistic)
-            )
-        return result
+        return self._call(
+            _parser("problemset", Problem, raw, fields),
+            "problemset.problems",
+            deadline=_deadline(timeout),
+            **parameters
+        )
 
-    def problemset_recent_status(self, count, problemset_name=""):
+    def problemset_recent_status(
+        self,
+        count,
+        problemset_name="",
+        raw=False,
+        fields=None,
+        columnar=False,
+        timeout=None,
+    ):
         """
         Get problemset.recentStatus.
 
@@ -257,14 +939,14 @@ class CodeforcesApi(CodeforcesApiRequestMaker):
         }
         if problemset_name != "":
             parameters["problemsetName"] = problemset_name
-        return [
-            Submission.de_json(submission)
-            for submission in self._make_request(
-                "problemset.recentStatus", **parameters
-            )
-        ]
+        return self._call(
+            _parser("list", Submission, raw, fields, columnar),
+            "problemset.recentStatus",
+            deadline=_deadline(timeout),
+            **parameters
+        )
 
-    def recent_actions(self, max_count=100):
+    def recent_actions(self, max_count=100, raw=False, fields=None, timeout=None):
         """
         Get recentActions.
 
@@ -276,14 +958,14 @@ class CodeforcesApi(CodeforcesApiRequestMaker):
         """
         if max_count > 100:
             raise OverflowError("Max_count should be less or equal to 1000")
-        return [
-            RecentAction.de_json(recent_action)
-            for recent_action in self._make_request(
-                "recentActions", **{"maxCount": str(max_count)}
-            )
-        ]
+        return self._call(
+            _parser("list", RecentAction, raw, fields),
+            "recentActions",
+            deadline=_deadline(timeout),
+            **{"maxCount": str(max_count)}
+        )
 
-    def user_blog_entries(self, handle):
+    def user_blog_entries(self, handle, raw=False, fields=None, timeout=None):
         """
         Get user.blogEntries.
 
@@ -293,14 +975,14 @@ class CodeforcesApi(CodeforcesApiRequestMaker):
         """
         if handle == "":
             raise TypeError("Handle should not be empty")
-        return [
-            BlogEntry.de_json(blog_entry)
-            for blog_entry in self._make_request(
-                "user.blogEntries", **{"handle": str(handle)}
-            )
-        ]
+        return self._call(
+            _parser("list", BlogEntry, raw, fields),
+            "user.blogEntries",
+            deadline=_deadline(timeout),
+            **{"handle": str(handle)}
+        )
 
-    def user_friends(self, only_online=False):
+    def user_friends(self, only_online=False, timeout=None):
         """
         Get user.friends.
 
@@ -312,31 +994,38 @@ class CodeforcesApi(CodeforcesApiRequestMaker):
         """
         if self.anonymous:
             raise TypeError("Auth is required.")
-        return self._make_request(
-            "user.friends", **{"onlyOnline": str(only_online).lower()}
+        return self._call(
+            None,
+            "user.friends",
+            deadline=_deadline(timeout),
+            **{"onlyOnline": str(only_online).lower()}
         )
 
-    def user_info(self, handles):
+    def user_info(
+        self, handles, skip_missing=False, raw=False, fields=None, timeout=None
+    ):
         """
         Get user.info.
 
-        handles should be a list of users, up to 10000.
+        handles should be a list of users, long lists are split into chunks of
+        handles_chunk_size handles, which are requested concurrently.
+
+        skip_missing is used for skipping handles of not existing users instead of
+        raising HandleNotFoundError.
 
         Returns parsed response from codeforces.com.
         """
         if not isinstance(handles, list):
             raise TypeError("Handles should be a list")
-        if len(handles) > 10000:
-            raise OverflowError("Max count of handles should be less or equal to 10000")
-        handles_str = ""
-        for handle in handles:
-            handles_str += str(handle) + ";"
-        return [
-            User.de_json(user)
-            for user in self._make_request("user.info", **{"handles": handles_str})
-        ]
-
-    def user_rated_list(self, active_only=False):
+        return self._call_chunked(
+            _parser("list", User, raw, fields),
+            "user.info",
+            handles,
+            skip_missing,
+            deadline=_deadline(timeout),
+        )
+
+    def user_rated_list(self, active_only=False, raw=False, fields=None, timeout=None):
         """
         Get user.ratedList.
 
@@ -344,14 +1033,14 @@ class CodeforcesApi(CodeforcesApiRequestMaker):
 
         Returns parsed response from codeforces.com.
         """
-        return [
-            User.de_json(user)
-            for user in self._make_request(
-                "user.ratedList", **{"activeOnly": str(active_only).lower()}
-            )
-        ]
+        return self._call(
+            _parser("list", User, raw, fields),
+            "user.ratedList",
+            deadline=_deadline(timeout),
+            **{"activeOnly": str(active_only).lower()}
+        )
 
-    def user_rating(self, handle):
+    def user_rating(self, handle, raw=False, fields=None, timeout=None):
         """
         Get user.rating.
 
@@ -359,14 +1048,23 @@ class CodeforcesApi(CodeforcesApiRequestMaker):
 
         Returns parsed response from codeforces.com.
         """
-        return [
-            RatingChange.de_json(rating_change)
-            for rating_change in self._make_request(
-                "user.rating", **{"handle": str(handle)}
-            )
-        ]
+        return self._call(
+            _parser("list", RatingChange, raw, fields),
+            "user.rating",
+            deadline=_deadline(timeout),
+            **{"handle": str(handle)}
+        )
 
-    def user_status(self, handle, start=-1, count=-1):
+    def user_status(
+        self,
+        handle,
+        start=-1,
+        count=-1,
+        raw=False,
+        fields=None,
+        columnar=False,
+        timeout=None,
+    ):
         """
         Get user.status.
 
@@ -385,7 +1083,251 @@ class CodeforcesApi(CodeforcesApiRequestMaker):
             parameters["from"] = str(start)
         if count != -1:
             parameters["count"] = str(count)
-        return [
-            Submission.de_json(submission)
-            for submission in self._make_request("user.status", **parameters)
-        ]
+        return self._call(
+            _parser("list", Submission, raw, fields, columnar),
+            "user.status",
+            deadline=_deadline(timeout),
+            **parameters
+        )
+
+    def iter_user_status(
+        self,
+        handle,
+        page_size=1000,
+        prefetch=True,
+        raw=False,
+        fields=None,
+        timeout=None,
+    ):
+        """
+        Iterate over user.status page by page.
+
+        handle is required.
+
+        page_size is the number of attempts requested at once.
+
+        prefetch is used for requesting the next page while the current one is used.
+
+        Yields parsed submissions from codeforces.com.
+        """
+        return self._iter_pages(
+            Submission,
+            "user.status",
+            {"handle": str(handle)},
+            page_size,
+            prefetch,
+            raw=raw,
+            fields=fields,
+            deadline=_deadline(timeout),
+        )
+
+    def iter_contest_status(
+        self,
+        contest_id,
+        handle="",
+        page_size=1000,
+        prefetch=True,
+        raw=False,
+        fields=None,
+        timeout=None,
+    ):
+        """
+        Iterate over contest.status page by page, contest_id required.
+
+        handle is used for specifying a user.
+
+        page_size is the number of submits requested at once.
+
+        prefetch is used for requesting the next page while the current one is used.
+
+        Yields parsed submissions from codeforces.com.
+        """
+        parameters = {"contestId": str(contest_id)}
+        if handle != "":
+            parameters["handle"] = handle
+        return self._iter_pages(
+            Submission,
+            "contest.status",
+            parameters,
+            page_size,
+            prefetch,
+            raw=raw,
+            fields=fields,
+            deadline=_deadline(timeout),
+        )
+
+    def iter_contest_standings(
+        self,
+        contest_id,
+        page_size=1000,
+        room=-1,
+        show_unofficial=False,
+        prefetch=True,
+        raw=False,
+        fields=None,
+        timeout=None,
+    ):
+        """
+        Iterate over rows of contest.standings page by page, contest_id required.
+
+        page_size is the number of rows requested at once.
+
+        room is the number of the room which is needed.
+
+        show_unofficial is used for adding or removing not official participants.
+
+        prefetch is used for requesting the next page while the current one is used.
+
+        Yields parsed ranklist rows from codeforces.com.
+        """
+        parameters = {
+            "contestId": str(contest_id),
+            "showUnofficial": str(show_unofficial).lower(),
+        }
+        if room != -1:
+            parameters["room"] = str(room)
+        return self._iter_pages(
+            RanklistRow,
+            "contest.standings",
+            parameters,
+            page_size,
+            prefetch,
+            "rows",
+            raw,
+            fields,
+            deadline=_deadline(timeout),
+        )
+
+    def stream_contest_list(self, gym=False, raw=False, fields=None, timeout=None):
+        """
+        Stream all contests, you can get all gym by gym parameter.
+
+        Yields parsed contests while the response is downloaded.
+        """
+        return self._stream(
+            Contest,
+            "contest.list",
+            {"gym": str(gym).lower()},
+            raw=raw,
+            fields=fields,
+            deadline=_deadline(timeout),
+        )
+
+    def stream_contest_status(
+        self,
+        contest_id,
+        handle="",
+        start=-1,
+        count=-1,
+        raw=False,
+        fields=None,
+        timeout=None,
+    ):
+        """
+        Stream contest.status for contest, contest_id required.
+
+        Parameters are the same as for contest_status.
+
+        Yields parsed submissions while the response is downloaded.
+        """
+        parameters = {"contestId": str(contest_id)}
+        if handle != "":
+            parameters["handle"] = handle
+        if start != -1:
+            parameters["from"] = str(start)
+        if count != -1:
+            parameters["count"] = str(count)
+        return self._stream(
+            Submission,
+            "contest.status",
+            parameters,
+            raw=raw,
+            fields=fields,
+            deadline=_deadline(timeout),
+        )
+
+    def stream_problemset_problems(
+        self, tags=[""], problemset_name="", raw=False, fields=None, timeout=None
+    ):
+        """
+        Stream problems of problemset.problems, statistics aren't returned.
+
+        Parameters are the same as for problemset_problems.
+
+        Yields parsed problems while the response is downloaded.
+        """
+        if not isinstance(tags, list):
+            raise TypeError("Tags should be a list")
+        parameters = {}
+        if tags != [""]:
+            parameters["tags"] = tags
+        if problemset_name != "":
+            parameters["problemsetName"] = problemset_name
+        return self._stream(
+            Problem,
+            "problemset.problems",
+            parameters,
+            "problems",
+            raw,
+            fields,
+            deadline=_deadline(timeout),
+        )
+
+    def stream_user_rated_list(
+        self, active_only=False, raw=False, fields=None, timeout=None
+    ):
+        """
+        Stream user.ratedList.
+
+        active_only is used to show only users, which participated last month.
+
+        Yields parsed users while the response is downloaded.
+        """
+        return self._stream(
+            User,
+            "user.ratedList",
+            {"activeOnly": str(active_only).lower()},
+            raw=raw,
+            fields=fields,
+            deadline=_deadline(timeout),
+        )
+
+    def stream_user_status(
+        self, handle, start=-1, count=-1, raw=False, fields=None, timeout=None
+    ):
+        """
+        Stream user.status.
+
+        Parameters are the same as for user_status.
+
+        Yields parsed submissions while the response is downloaded.
+        """
+        parameters = {
+            "handle": str(handle),
+        }
+        if start != -1:
+            parameters["from"] = str(start)
+        if count != -1:
+            parameters["count"] = str(count)
+        return self._stream(
+            Submission,
+            "user.status",
+            parameters,
+            raw=raw,
+            fields=fields,
+            deadline=_deadline(timeout),
+        )
+
+    def close(self):
+        """
+        Closes pooled connections if transport was made by this client, shared
+        transport should be closed by its owner.
+        """
+        if self._owns_transport:
+            self.transport.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
@@ -0,0 +1,514 @@
+"""
+The main class for the API requests made from asyncio code.
+Copyright (C) 2021 Vadim Vergasov
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import asyncio
+import contextlib
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+from codeforces_api.api_request_maker import BODY_CHUNK_SIZE
+from codeforces_api.api_requests import (
+    GYM_MIN_ID,
+    CodeforcesApi,
+    _decoder,
+    _is_chunk_error,
+    _join_chunk_results,
+    _join_handles,
+    _merge_chunks,
+    _retry_delay,
+    _skip_shifted,
+    _split_failed_chunk,
+    _split_handles,
+)
+from codeforces_api.cache import CONTEST_METHODS
+from codeforces_api.deadline import _remaining
+from codeforces_api.exceptions import (
+    CodeforcesApiError,
+    CodeforcesResponseError,
+    CodeforcesTimeoutError,
+)
+from codeforces_api.json_stream import STREAM_CHUNK_SIZE, JSONArrayStream
+from codeforces_api.retry import NETWORK_ERRORS
+from codeforces_api.single_flight import AsyncSingleFlight
+from codeforces_api.transport import Transport
+from codeforces_api.types import Submission
+
+
+class AsyncCodeforcesApi(CodeforcesApi):
+    """
+    Class for using official API requests with asyncio.
+
+    It has the same methods as CodeforcesApi, but all of them return awaitables
+    and iter_* methods return asynchronous iterators.
+    aiohttp is required, install it with: pip install CodeforcesApiPy[async]
+    """
+
+    max_connections = 100
+    max_concurrency = None
+    _semaphore = None
+
+    def __init__(self, *args, max_connections=100, max_concurrency=None, **kwargs):
+        """
+        Initializing class, takes the same arguments as CodeforcesApi.
+
+        Handle chunks are requested concurrently, so chunk_workers isn't used.
+
+        max_connections is the size of the connection pool of transport made by
+        default, pool of shared transport has its own pool_maxsize.
+
+        max_concurrency limits number of requests which are made at the same time,
+        default is max_connections.
+
+        With decode_executor results are parsed in the default executor of the loop,
+        so the loop isn't blocked while chunks are made by decode_executor.
+        """
+        if aiohttp is None:
+            raise ImportError(
+                "aiohttp is required for AsyncCodeforcesApi, "
+                "install it with: pip install CodeforcesApiPy[async]"
+            )
+        if kwargs.get("transport") is None:
+            kwargs["transport"] = Transport(pool_maxsize=max_connections)
+            super().__init__(*args, **kwargs)
+            self._owns_transport = True
+        else:
+            super().__init__(*args, **kwargs)
+        self.max_connections = max_connections
+        if max_concurrency is None:
+            max_concurrency = max_connections
+        self.max_concurrency = max_concurrency
+
+    def _create_session(self):
+        # aiohttp session should be created inside of the running event loop.
+        return None
+
+    def _create_single_flight(self):
+        return AsyncSingleFlight()
+
+    async def _parse(self, parse, result):
+        if parse is None or self._decoding_pool is None:
+            return super()._parse(parse, result)
+        return await asyncio.get_running_loop().run_in_executor(
+            None, super()._parse, parse, result
+        )
+
+    def _get_session(self):
+        if self.session is None or self.session.closed:
+            self.session = self.transport.async_session()
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self.session
+
+    async def _make_request(self, method, deadline=None, **payload):
+        """
+        Making request to codeforces.com
+
+        Uses different methods (POST or GET) but be aware of 413 error when using GET.
+
+        Results are taken from cache and stored to it if cache is set.
+
+        deadline is a Deadline for the request with all retries or None.
+        """
+        if self.cache is None or not self.cache.cacheable(method):
+            return await self._fetch(method, deadline, **payload)
+        key = self._cache_key(method, payload)
+        result = self.cache.get(key)
+        if result is None:
+            result = await self._fetch(method, deadline, **payload)
+            ttl = await self._cache_ttl(method, payload, result, deadline)
+            if ttl != 0:
+                self.cache.set(key, result, ttl)
+        return result
+
+    async def _cache_ttl(self, method, payload, result, deadline=None):
+        """
+        Returns time to live for result, contest methods depend on the contest phase.
+
+        If the phase can't be received, the default time to live of method is used.
+        """
+        if method not in CONTEST_METHODS:
+            return self.cache.ttl(method)
+        if method == "contest.standings":
+            phase = result["contest"]["phase"]
+        else:
+            try:
+                phase = await self._contest_phase(int(payload["contestId"]), deadline)
+            except (CodeforcesApiError,) + NETWORK_ERRORS:
+                # Result is received, so failed lookup of the phase isn't raised.
+                phase = None
+        return self.cache.contest_ttl(method, phase, result)
+
+    async def _contest_phase(self, contest_id, deadline=None):
+        """
+        Returns phase of the contest from cached contest list or None if it's unknown.
+        """
+        if contest_id in self._finished_contests:
+            return "FINISHED"
+        contests = await self._make_request(
+            "contest.list", deadline, **{"gym": str(contest_id >= GYM_MIN_ID).lower()}
+        )
+        return self._find_contest_phase(contests, contest_id)
+
+    async def _fetch(self, method, deadline=None, **payload):
+        """
+        Making request, transient failures are retried according to retry_policy.
+        """
+        return await self._retrying(
+            lambda: self._send(method, deadline, **payload), deadline
+        )
+
+    async def _retrying(self, coroutine_function, deadline=None):
+        """
+        Returns result of coroutine_function(), which is called again on transient
+        failures.
+
+        Failure is raised as CodeforcesTimeoutError if there is no time for the next
+        attempt before deadline or it's a network timeout after the deadline.
+        """
+        attempt = 1
+        while True:
+            try:
+                return await coroutine_function()
+            except CodeforcesTimeoutError:
+                raise
+            except Exception as error:
+                delay = _retry_delay(self.retry_policy, error, attempt, deadline)
+                if delay is None:
+                    raise
+                await asyncio.sleep(delay)
+            attempt += 1
+
+    async def _send(self, method, deadline=None, **payload):
+        """
+        Making single attempt of the request.
+        """
+        await self._wait_for_rate_limit(deadline)
+        request_data = self.generate_request(method, **payload)
+        session = self._get_session()
+        async with _acquired(self._semaphore, deadline):
+            async with session.request(
+                self.method,
+                request_data["request_url"],
+                data=_form_data(request_data["data"]),
+                **self.transport.async_request_options(deadline)
+            ) as request:
+                content = await _read_body(request)
+        return self.parse_response(request.status, content, request.headers)
+
+    async def _send_stream(self, method, payload, deadline=None):
+        """
+        Making single attempt of the request, which body will be read in chunks.
+        """
+        await self._wait_for_rate_limit(deadline)
+        request_data = self.generate_request(method, **payload)
+        request = await self._get_session().request(
+            self.method,
+            request_data["request_url"],
+            data=_form_data(request_data["data"]),
+            **self.transport.async_request_options(deadline)
+        )
+        if request.status != 200:
+            async with request:
+                content = await _read_body(request)
+            self.parse_response(request.status, content, request.headers)
+        return request
+
+    async def _wait_for_rate_limit(self, deadline):
+        """
+        Waits until the request is allowed by rate_limiter, CodeforcesTimeoutError is
+        raised if it isn't allowed before deadline.
+        """
+        if deadline is not None:
+            deadline.check()
+        if self.rate_limiter is not None:
+            delay = self.rate_limiter.reserve(_remaining(deadline))
+            if delay is None:
+                raise CodeforcesTimeoutError(
+                    "Rate limit doesn't allow the request before the deadline."
+                )
+            await asyncio.sleep(delay)
+
+    async def _stream(
+        self,
+        cls,
+        method,
+        payload,
+        key="result",
+        raw=False,
+        fields=None,
+        deadline=None,
+    ):
+        """
+        Yields objects of type cls from the array with given key while the response
+        is downloaded, raw and fields are the same as for other methods.
+
+        Results aren't cached, transient failures are retried only until the response
+        is received.
+        """
+        decode = _decoder(cls, self.lazy, raw, fields, self._interner())
+        self._get_session()
+        async with _acquired(self._semaphore, deadline):
+            request = await self._retrying(
+                lambda: self._send_stream(method, payload, deadline), deadline
+            )
+            async with request:
+                stream = JSONArrayStream(key)
+                async for chunk in request.content.iter_chunked(STREAM_CHUNK_SIZE):
+                    if deadline is not None:
+                        deadline.check()
+                    for obj in stream.feed(chunk):
+                        yield decode(obj)
+                document = stream.close()
+        if document is not None:
+            self.check_return_code(document, request.status)
+            raise CodeforcesResponseError("There is no %s in the response." % key)
+
+    async def _call(self, parse, method, deadline=None, **payload):
+        """
+        Making request and parsing its result with parse function.
+
+        If parse is None, result is returned as is.
+
+        Identical calls made at the same time share one request if single_flight is set.
+        """
+
+        async def call():
+            result = await self._make_request(method, deadline, **payload)
+            return await self._parse(parse, result)
+
+        key = (parse, self._cache_key(method, payload))
+        return await self._coalesced(key, call, deadline)
+
+    async def _call_chunked(
+        self, parse, method, handles, skip_missing=False, deadline=None, **payload
+    ):
+        """
+        Making requests for handles split into chunks and parsing merged result.
+
+        Chunks are requested concurrently, chunk which fails because of its size or
+        missing handle (if skip_missing) is bisected and requested again.
+
+        If not all chunks are received before deadline, CodeforcesTimeoutError is
+        raised with parsed result of received ones as partial.
+        """
+
+        async def call():
+            try:
+                result = await self._request_chunks(
+                    method, handles, skip_missing, payload, deadline
+                )
+            except CodeforcesTimeoutError as error:
+                if error.partial is not None:
+                    error.partial = await self._parse(parse, error.partial)
+                raise
+            return await self._parse(parse, result)
+
+        key = (parse, self._cache_key(method, payload), tuple(handles), skip_missing)
+        return await self._coalesced(key, call, deadline)
+
+    async def _request_chunks(
+        self, method, handles, skip_missing, payload, deadline=None
+    ):
+        async def fetch(chunk):
+            try:
+                return await self._fetch_chunk(
+                    method, chunk, skip_missing, payload, deadline
+                )
+            except CodeforcesTimeoutError as error:
+                return error
+
+        results = await asyncio.gather(
+            *[
+                fetch(chunk)
+                for chunk in _split_handles(handles, self.handles_chunk_size)
+            ]
+        )
+        results = _join_chunk_results(method, results)
+        if not results and method == "contest.standings":
+            # All handles are missing, so only contest and problems are needed.
+            result = await self._make_request(
+                method, deadline, **dict(payload, count="1")
+            )
+            # Result may be stored in cache, so it isn't changed.
+            results = [dict(result, rows=[])]
+        return _merge_chunks(method, results)
+
+    async def _fetch_chunk(self, method, chunk, skip_missing, payload, deadline=None):
+        """
+        Returns list of results for the chunk, several if it was bisected.
+        """
+        try:
+            return [
+                await self._make_request(
+                    method, deadline, **dict(payload, handles=_join_handles(chunk))
+                )
+            ]
+        except CodeforcesApiError as error:
+            if not _is_chunk_error(error):
+                raise
+            parts = _split_failed_chunk(chunk, error, skip_missing)
+        results = []
+        for part in parts:
+            results.extend(
+                await self._fetch_chunk(method, part, skip_missing, payload, deadline)
+            )
+        return results
+
+    async def _iter_pages(
+        self,
+        cls,
+        method,
+        payload,
+        page_size,
+        prefetch,
+        rows_key=None,
+        raw=False,
+        fields=None,
+        deadline=None,
+    ):
+        """
+        Yields objects of type cls requesting them with from and count parameters.
+
+        rows_key is the key of the list in the result if result isn't a list, raw and
+        fields are the same as for other methods.
+        """
+        decode = _decoder(cls, self.lazy, raw, fields, self._interner())
+
+        async def fetch(start):
+            page = await self._make_request(
+                method,
+                deadline,
+                **dict(payload, **{"from": str(start), "count": str(page_size)})
+            )
+            return page if rows_key is None else page[rows_key]
+
+        following = None
+        try:
+            start = 1
+            page = await fetch(start)
+            last_id = None
+            while True:
+                following = None
+                if len(page) == page_size and prefetch:
+                    following = asyncio.ensure_future(fetch(start + page_size))
+                for obj in _skip_shifted(page, last_id):
+                    yield decode(obj)
+                if len(page) < page_size:
+                    return
+                if cls is Submission and page:
+                    last_id = page[-1]["id"]
+                start += page_size
+                page = await (fetch(start) if following is None else following)
+        finally:
+            if following is not None and not following.done():
+                following.cancel()
+
+    async def _coalesced(self, key, coroutine_function, deadline=None):
+        """
+        Returns result of coroutine_function(), which is shared by identical calls if
+        single_flight is set.
+
+        Identical call which is already running is awaited until deadline.
+        """
+        if self.single_flight is None:
+            return await coroutine_function()
+        leader = not self.single_flight.running(key)
+        try:
+            return await self.single_flight.do(
+                key, coroutine_function, _remaining(deadline)
+            )
+        except CodeforcesTimeoutError:
+            raise
+        except asyncio.TimeoutError:
+            if deadline is None:
+                raise
+            if leader:
+                raise CodeforcesTimeoutError(
+                    "Deadline of the call is exceeded."
+                ) from None
+            raise CodeforcesTimeoutError(
+                "Identical call didn't finish before the deadline."
+            ) from None
+
+    async def close(self):
+        """
+        Closes the session and all pooled connections if transport was made by this
+        client, shared transport should be closed by its owner.
+        """
+        if self._owns_transport:
+            await self.transport.close_async()
+            self.transport.close()
+        self.session = None
+
+    def __enter__(self):
+        raise TypeError("Use async with for AsyncCodeforcesApi.")
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        pass
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+
+@contextlib.asynccontextmanager
+async def _acquired(semaphore, deadline):
+    """
+    Holds semaphore, CodeforcesTimeoutError is raised if it isn't acquired before
+    deadline.
+    """
+    if deadline is None:
+        await semaphore.acquire()
+    else:
+        try:
+            await asyncio.wait_for(semaphore.acquire(), deadline.remaining())
+        except asyncio.TimeoutError:
+            raise CodeforcesTimeoutError(
+                "Limit of concurrent requests doesn't allow the request before the "
+                "deadline."
+            ) from None
+    try:
+        yield
+    finally:
+        semaphore.release()
+
+
+async def _read_body(request):
+    """
+    Returns body of aiohttp response read into one bytearray.
+    """
+    body = bytearray()
+    async for chunk in request.content.iter_chunked(BODY_CHUNK_SIZE):
+        body += chunk
+    return body
+
+
+def _form_data(fields):
+    """
+    Returns fields as list of pairs, lists are sent as repeated fields.
+    """
+    data = []
+    for key, value in fields.items():
+        if isinstance(value, list):
+            data.extend((key, str(item)) for item in value)
+        else:
+            data.append((key, value))
+    return data
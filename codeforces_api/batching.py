@@ -0,0 +1,284 @@
+"""
+Batching of user_info calls made from many places.
+Copyright (C) 2021 Vadim Vergasov
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import asyncio
+import concurrent.futures
+import threading
+
+from codeforces_api.deadline import _deadline, _remaining
+from codeforces_api.exceptions import CodeforcesTimeoutError, HandleNotFoundError
+
+
+class UserInfoBatcher:
+    """
+    Collects user_info lookups which are made within delay seconds and makes one
+    user.info request for all of them.
+
+    Lookups are made from any number of threads, each of them gets its own User
+    or HandleNotFoundError if there is no user with such handle.
+    """
+
+    def __init__(self, api, delay=0.01, max_batch_size=10000, max_workers=4):
+        """
+        api is a CodeforcesApi which is used for requests.
+
+        delay is the number of seconds to wait for other lookups before the request.
+
+        max_batch_size is the maximal number of handles in one request, batch is sent
+        immediately when it's full.
+        """
+        self.api = api
+        self.delay = delay
+        self.max_batch_size = max_batch_size
+        self._lock = threading.Lock()
+        self._pending = {}
+        self._timer = None
+        self._closed = False
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers)
+
+    def load(self, handle):
+        """
+        Returns concurrent.futures.Future with User for the handle.
+
+        RuntimeError is raised if the batcher is closed.
+        """
+        key = str(handle).lower()
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("Batcher is closed.")
+            if key in self._pending:
+                return self._pending[key][1]
+            future = concurrent.futures.Future()
+            self._pending[key] = (str(handle), future)
+            if len(self._pending) >= self.max_batch_size:
+                self._dispatch()
+            elif self._timer is None:
+                self._timer = threading.Timer(self.delay, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+        return future
+
+    def get(self, handle, timeout=None):
+        """
+        Returns User for the handle, waits for the batch at most timeout seconds.
+        """
+        return self.load(handle).result(timeout)
+
+    def get_many(self, handles, timeout=None):
+        """
+        Returns list of User for the handles in the same order.
+
+        timeout (number of seconds or a Deadline) bounds waiting for all of them, if
+        some users aren't received in time, CodeforcesTimeoutError is raised with the
+        list where they are None as partial.
+        """
+        futures = [self.load(handle) for handle in handles]
+        _, not_done = concurrent.futures.wait(futures, _remaining(_deadline(timeout)))
+        if not_done:
+            raise CodeforcesTimeoutError(
+                "Not all users are received before the deadline.",
+                partial=_received(futures),
+            )
+        return [future.result() for future in futures]
+
+    def flush(self):
+        """
+        Sends collected lookups without waiting for the delay.
+        """
+        with self._lock:
+            self._dispatch()
+
+    def close(self):
+        """
+        Sends collected lookups and waits for all requests.
+        """
+        with self._lock:
+            self._closed = True
+            self._dispatch()
+        self._executor.shutdown(wait=True)
+
+    def _dispatch(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if self._pending:
+            batch = list(self._pending.values())
+            self._pending = {}
+            self._executor.submit(self._run, batch)
+
+    def _run(self, batch):
+        while batch:
+            try:
+                users = self.api.user_info([handle for handle, _ in batch])
+            except HandleNotFoundError as error:
+                batch = _reject_missing(batch, error)
+                continue
+            except BaseException as error:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(error)
+                return
+            for (_, future), user in zip(batch, users):
+                if not future.done():
+                    future.set_result(user)
+            return
+
+
+class AsyncUserInfoBatcher:
+    """
+    Collects user_info lookups which are made within delay seconds and makes one
+    user.info request for all of them with AsyncCodeforcesApi.
+
+    Each lookup gets its own User or HandleNotFoundError if there is no user with
+    such handle.
+    """
+
+    def __init__(self, api, delay=0.01, max_batch_size=10000):
+        """
+        api is an AsyncCodeforcesApi which is used for requests.
+
+        delay is the number of seconds to wait for other lookups before the request.
+
+        max_batch_size is the maximal number of handles in one request, batch is sent
+        immediately when it's full.
+        """
+        self.api = api
+        self.delay = delay
+        self.max_batch_size = max_batch_size
+        self._pending = {}
+        self._timer = None
+        self._tasks = set()
+        self._closed = False
+
+    async def load(self, handle):
+        """
+        Returns User for the handle.
+
+        RuntimeError is raised if the batcher is closed.
+        """
+        if self._closed:
+            raise RuntimeError("Batcher is closed.")
+        key = str(handle).lower()
+        if key not in self._pending:
+            future = asyncio.get_running_loop().create_future()
+            self._pending[key] = (str(handle), future)
+            if len(self._pending) >= self.max_batch_size:
+                self.flush()
+            elif self._timer is None:
+                self._timer = asyncio.get_running_loop().call_later(
+                    self.delay, self.flush
+                )
+        else:
+            future = self._pending[key][1]
+        # Cancellation of one lookup shouldn't cancel others with the same handle.
+        return await asyncio.shield(future)
+
+    async def load_many(self, handles, timeout=None):
+        """
+        Returns list of User for the handles in the same order.
+
+        timeout (number of seconds or a Deadline) bounds waiting for all of them, if
+        some users aren't received in time, CodeforcesTimeoutError is raised with the
+        list where they are None as partial.
+        """
+        if timeout is None or not handles:
+            return await asyncio.gather(*[self.load(handle) for handle in handles])
+        tasks = [asyncio.ensure_future(self.load(handle)) for handle in handles]
+        _, pending = await asyncio.wait(tasks, timeout=_deadline(timeout).remaining())
+        if pending:
+            for task in pending:
+                task.cancel()
+            raise CodeforcesTimeoutError(
+                "Not all users are received before the deadline.",
+                partial=_received(tasks),
+            )
+        return [task.result() for task in tasks]
+
+    def flush(self):
+        """
+        Sends collected lookups without waiting for the delay.
+        """
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if self._pending:
+            batch = list(self._pending.values())
+            self._pending = {}
+            task = asyncio.ensure_future(self._run(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def close(self):
+        """
+        Sends collected lookups and waits for all requests.
+        """
+        self._closed = True
+        self.flush()
+        if self._tasks:
+            await asyncio.gather(*self._tasks)
+
+    async def _run(self, batch):
+        while batch:
+            try:
+                users = await self.api.user_info([handle for handle, _ in batch])
+            except HandleNotFoundError as error:
+                batch = _reject_missing(batch, error)
+                continue
+            except Exception as error:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(error)
+                return
+            for (_, future), user in zip(batch, users):
+                if not future.done():
+                    future.set_result(user)
+            return
+
+
+def _received(futures):
+    """
+    Returns list of results of futures, None for not finished or failed ones.
+    """
+    return [
+        (
+            future.result()
+            if future.done() and not future.cancelled() and future.exception() is None
+            else None
+        )
+        for future in futures
+    ]
+
+
+def _reject_missing(batch, error):
+    """
+    Sets error for lookups of the missing handle and returns other lookups.
+    """
+    rest = []
+    missing = str(error.handle).lower()
+    for handle, future in batch:
+        if handle.lower() == missing:
+            if not future.done():
+                future.set_exception(error)
+        else:
+            rest.append((handle, future))
+    if len(rest) == len(batch):
+        # Handle from the comment doesn't match any lookup, nothing to retry.
+        for _, future in rest:
+            if not future.done():
+                future.set_exception(error)
+        return []
+    return rest
@@ -0,0 +1,254 @@
+"""
+Caches for results of API requests.
+Copyright (C) 2021 Vadim Vergasov
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import collections
+import sqlite3
+import threading
+import time
+
+from codeforces_api import json_backend
+
+# Time to live in seconds for methods, which data changes rarely.
+DEFAULT_TTLS = {
+    "blogEntry.comments": 600,
+    "blogEntry.view": 600,
+    "contest.list": 3600,
+    "problemset.problems": 3600,
+    "user.blogEntries": 600,
+    "user.ratedList": 3600,
+}
+
+# Methods which results are never cached.
+UNCACHED_METHODS = frozenset(["user.friends"])
+
+# Methods which results don't change after the end of the contest.
+CONTEST_METHODS = frozenset(
+    ["contest.hacks", "contest.ratingChanges", "contest.standings", "contest.status"]
+)
+
+
+class Cache:
+    """
+    Base class for caches.
+
+    ttls maps method name (e.g. "contest.list") to time to live in seconds,
+    default_ttl is used for other methods. 0 means that result isn't cached and
+    None means that result never expires.
+
+    Results of contest methods (standings, status, hacks and rating changes) are
+    stored for finished_ttl after the end of the contest and for live_ttl while
+    it's running. ttls are used for them if phase of the contest is unknown.
+    """
+
+    def __init__(self, ttls=None, default_ttl=0, finished_ttl=None, live_ttl=30):
+        self.ttls = dict(DEFAULT_TTLS)
+        if ttls is not None:
+            self.ttls.update(ttls)
+        self.default_ttl = default_ttl
+        self.finished_ttl = finished_ttl
+        self.live_ttl = live_ttl
+
+    def ttl(self, method):
+        """
+        Returns time to live for result of the method.
+        """
+        if method in UNCACHED_METHODS:
+            return 0
+        return self.ttls.get(method, self.default_ttl)
+
+    def cacheable(self, method):
+        """
+        Checks if results of the method can be stored in the cache.
+        """
+        if method in CONTEST_METHODS and (self.finished_ttl != 0 or self.live_ttl != 0):
+            return True
+        return self.ttl(method) != 0
+
+    def contest_ttl(self, method, phase, result):
+        """
+        Returns time to live for result of contest method, phase is Contest.phase.
+
+        Rating changes are stored as finished only when they are published.
+        """
+        if phase is None:
+            return self.ttl(method)
+        if phase == "FINISHED" and (result or method != "contest.ratingChanges"):
+            return self.finished_ttl
+        return self.live_ttl
+
+    def get(self, key):
+        """
+        Returns cached value or None if there is no fresh value.
+        This function must be overridden by subclasses.
+        """
+        raise NotImplementedError
+
+    def set(self, key, value, ttl):
+        """
+        Stores value for ttl seconds (forever if ttl is None).
+        This function must be overridden by subclasses.
+        """
+        raise NotImplementedError
+
+    def clear(self):
+        """
+        Removes all values.
+        This function must be overridden by subclasses.
+        """
+        raise NotImplementedError
+
+
+class MemoryCache(Cache):
+    """
+    LRU cache in memory of the process, which holds up to max_entries results.
+
+    Results are stored as JSON like in SQLiteCache, so every call gets its own copy
+    and changing it (e.g. raw result) doesn't change the cached one.
+    """
+
+    def __init__(
+        self,
+        ttls=None,
+        default_ttl=0,
+        finished_ttl=None,
+        live_ttl=30,
+        max_entries=256,
+    ):
+        super().__init__(ttls, default_ttl, finished_ttl, live_ttl)
+        self.max_entries = max_entries
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, expires = entry
+            if expires is not None and expires <= time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+        return json_backend.loads(value)
+
+    def set(self, key, value, ttl):
+        value = json_backend.dumps(value)
+        expires = None if ttl is None else time.time() + ttl
+        with self._lock:
+            self._entries[key] = (value, expires)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+class SQLiteCache(Cache):
+    """
+    LRU cache stored in SQLite database, so it survives restarts and can be shared
+    by processes.
+
+    Least recently used results are removed when total size of stored results
+    exceeds max_size bytes.
+    """
+
+    def __init__(
+        self,
+        path,
+        ttls=None,
+        default_ttl=0,
+        finished_ttl=None,
+        live_ttl=30,
+        max_size=512 * 1024 * 1024,
+    ):
+        super().__init__(ttls, default_ttl, finished_ttl, live_ttl)
+        self.path = path
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(
+            path, check_same_thread=False, isolation_level=None
+        )
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS results ("
+            "key TEXT PRIMARY KEY, value BLOB NOT NULL, size INTEGER NOT NULL, "
+            "expires REAL, accessed REAL NOT NULL)"
+        )
+        self._connection.execute(
+            "CREATE INDEX IF NOT EXISTS results_accessed ON results (accessed)"
+        )
+
+    def get(self, key):
+        now = time.time()
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT value, expires FROM results WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            value, expires = row
+            if expires is not None and expires <= now:
+                self._connection.execute("DELETE FROM results WHERE key = ?", (key,))
+                return None
+            self._connection.execute(
+                "UPDATE results SET accessed = ? WHERE key = ?", (now, key)
+            )
+        return json_backend.loads(value)
+
+    def set(self, key, value, ttl):
+        now = time.time()
+        value = json_backend.dumps(value)
+        expires = None if ttl is None else now + ttl
+        with self._lock:
+            self._connection.execute(
+                "REPLACE INTO results (key, value, size, expires, accessed) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (key, value, len(value), expires, now),
+            )
+            self._evict(now)
+
+    def _evict(self, now):
+        self._connection.execute(
+            "DELETE FROM results WHERE expires IS NOT NULL AND expires <= ?", (now,)
+        )
+        (total,) = self._connection.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM results"
+        ).fetchone()
+        if total <= self.max_size:
+            return
+        removed = []
+        for key, size in self._connection.execute(
+            "SELECT key, size FROM results ORDER BY accessed"
+        ).fetchall():
+            if total <= self.max_size:
+                break
+            removed.append((key,))
+            total -= size
+        self._connection.executemany("DELETE FROM results WHERE key = ?", removed)
+
+    def clear(self):
+        with self._lock:
+            self._connection.execute("DELETE FROM results")
+
+    def close(self):
+        """
+        Closes connection to the database.
+        """
+        with self._lock:
+            self._connection.close()
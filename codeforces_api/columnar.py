@@ -0,0 +1,357 @@
+"""
+Columnar results: arrays of values of every field instead of list of objects.
+Copyright (C) 2021 Vadim Vergasov
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import array
+import collections
+import pickle
+
+from codeforces_api.types import RanklistRow, RatingChange, Submission, _field_getter
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# Value of integer columns and code of string columns if value is missing, float
+# columns contain NaN instead.
+MISSING = -1
+
+# Typecodes of arrays for kinds of columns, codes of strings are stored as int.
+_TYPECODES = {"int": "q", "float": "d", "str": "i"}
+
+_NUMPY_TYPES = {"q": "int64", "d": "float64", "i": "int32"}
+
+
+class DictionaryColumn:
+    """
+    Column of strings, which is stored as array of codes (indexes in values), code
+    of missing value is MISSING.
+    """
+
+    __slots__ = ("codes", "values")
+
+    def __init__(self, codes, values):
+        self.codes = codes
+        self.values = values
+
+    def __len__(self):
+        return len(self.codes)
+
+    def __getitem__(self, index):
+        code = self.codes[index]
+        return None if code < 0 else self.values[code]
+
+    def __iter__(self):
+        values = self.values
+        for code in self.codes:
+            yield None if code < 0 else values[code]
+
+    def code(self, value):
+        """
+        Returns code of the value, None if there is no such value in the column.
+        """
+        try:
+            return self.values.index(value)
+        except ValueError:
+            return None
+
+    def mask(self, value):
+        """
+        Returns mask of rows which contain the value: numpy array of bool if codes
+        are numpy array, otherwise array.array of 0 and 1.
+        """
+        code = self.code(value)
+        if code is None:
+            code = len(self.values)
+        if numpy is not None and isinstance(self.codes, numpy.ndarray):
+            return self.codes == code
+        return array.array("b", [item == code for item in self.codes])
+
+    def counts(self, mask=None):
+        """
+        Returns dict with the number of (masked) rows for every value.
+        """
+        codes = self.codes
+        if numpy is not None and isinstance(codes, numpy.ndarray):
+            if mask is not None:
+                codes = codes[numpy.asarray(mask, dtype=bool)]
+            counts = numpy.bincount(codes[codes >= 0], minlength=len(self.values))
+            return dict(zip(self.values, counts.tolist()))
+        if mask is not None:
+            codes = [code for code, selected in zip(codes, mask) if selected]
+        counts = collections.Counter(codes)
+        return {value: counts[code] for code, value in enumerate(self.values)}
+
+    def to_numpy(self):
+        """
+        Returns the same column with codes in numpy array, buffer isn't copied.
+        """
+        return DictionaryColumn(_numpy_array(self.codes), self.values)
+
+    def __reduce_ex__(self, protocol):
+        if protocol < 5:
+            return super().__reduce_ex__(protocol)
+        return DictionaryColumn, (_out_of_band(self.codes), self.values)
+
+
+class Columns:
+    """
+    Struct of arrays: columns are available by names like dict values, len is the
+    number of rows.
+
+    Integer columns are array.array of int64, float columns are array.array of
+    float64 and string columns are DictionaryColumn. Fields of nested objects are
+    prefixed with the name of the object, e.g. problem_index.
+    """
+
+    __slots__ = ("columns", "length")
+
+    def __init__(self, columns, length):
+        self.columns = columns
+        self.length = length
+
+    def __len__(self):
+        return self.length
+
+    def __getitem__(self, name):
+        return self.columns[name]
+
+    def __contains__(self, name):
+        return name in self.columns
+
+    def __iter__(self):
+        return iter(self.columns)
+
+    def keys(self):
+        return self.columns.keys()
+
+    def items(self):
+        return self.columns.items()
+
+    def to_numpy(self):
+        """
+        Returns the same columns with numpy arrays, buffers aren't copied.
+        """
+        columns = {}
+        for name, column in self.columns.items():
+            if isinstance(column, DictionaryColumn):
+                columns[name] = column.to_numpy()
+            else:
+                columns[name] = _numpy_array(column)
+        return Columns(columns, self.length)
+
+    def __reduce_ex__(self, protocol):
+        # With pickle protocol 5 arrays are pickled as out-of-band buffers.
+        if protocol < 5:
+            return super().__reduce_ex__(protocol)
+        columns = {name: _out_of_band(column) for name, column in self.columns.items()}
+        return Columns, (columns, self.length)
+
+
+class _ArrayBuffer:
+    """
+    Wrapper of array.array which is pickled as out-of-band buffer, it's unpickled
+    as array.array.
+    """
+
+    __slots__ = ("array",)
+
+    def __init__(self, data):
+        self.array = data
+
+    def __reduce_ex__(self, protocol):
+        return _load_array, (self.array.typecode, pickle.PickleBuffer(self.array))
+
+
+def _out_of_band(column):
+    if isinstance(column, array.array):
+        return _ArrayBuffer(column)
+    return column
+
+
+def _load_array(typecode, data):
+    result = array.array(typecode)
+    result.frombytes(memoryview(data).cast("B"))
+    return result
+
+
+def _numpy_array(data):
+    if numpy is None:
+        raise ImportError(
+            "numpy is required, install it with pip install CodeforcesApiPy[numpy]"
+        )
+    if isinstance(data, numpy.ndarray):
+        return data
+    return numpy.frombuffer(data, dtype=_NUMPY_TYPES[data.typecode])
+
+
+def _joined(get):
+    return lambda obj: ";".join(get(obj))
+
+
+def _column(kind, values):
+    if kind == "str":
+        codes = {}
+        data = array.array(
+            "i",
+            [
+                MISSING if value is None else codes.setdefault(value, len(codes))
+                for value in values
+            ],
+        )
+        return DictionaryColumn(data, list(codes))
+    missing = MISSING if kind == "int" else float("nan")
+    return array.array(
+        _TYPECODES[kind], [missing if value is None else value for value in values]
+    )
+
+
+def _schema(cls, fields):
+    return tuple(
+        (field.replace(".", "_"), kind, get or _field_getter(cls, field))
+        for field, kind, get in fields
+    )
+
+
+_PARTY_HANDLES = "members.handle"
+
+_SCHEMAS = {
+    Submission: _schema(
+        Submission,
+        (
+            ("id", "int", None),
+            ("contest_id", "int", None),
+            ("creation_time_seconds", "int", None),
+            ("relative_time_seconds", "int", None),
+            ("problem.index", "str", None),
+            ("problem.name", "str", None),
+            ("problem.rating", "int", None),
+            (
+                "author.handles",
+                "str",
+                _joined(_field_getter(Submission, "author." + _PARTY_HANDLES)),
+            ),
+            ("author.participant_type", "str", None),
+            ("programming_language", "str", None),
+            ("verdict", "str", None),
+            ("testset", "str", None),
+            ("passed_test_count", "int", None),
+            ("time_consumed_millis", "int", None),
+            ("memory_consumed_bytes", "int", None),
+            ("points", "float", None),
+        ),
+    ),
+    RanklistRow: _schema(
+        RanklistRow,
+        (
+            (
+                "party.handles",
+                "str",
+                _joined(_field_getter(RanklistRow, "party." + _PARTY_HANDLES)),
+            ),
+            ("party.participant_type", "str", None),
+            ("rank", "int", None),
+            ("points", "float", None),
+            ("penalty", "int", None),
+            ("successful_hack_count", "int", None),
+            ("unsuccessful_hack_count", "int", None),
+            ("last_submission_time_seconds", "int", None),
+        ),
+    ),
+    RatingChange: _schema(
+        RatingChange,
+        (
+            ("contest_id", "int", None),
+            ("contest_name", "str", None),
+            ("handle", "str", None),
+            ("rank", "int", None),
+            ("rating_update_time_seconds", "int", None),
+            ("old_rating", "int", None),
+            ("new_rating", "int", None),
+        ),
+    ),
+}
+
+
+def _problem_results_schema(problems):
+    """
+    Returns columns of results for each problem of the standings, they are named
+    with index of the problem, e.g. points_A.
+    """
+    schema = []
+    for position, problem in enumerate(problems):
+        for name, key, kind in (
+            ("points", "points", "float"),
+            ("rejected_attempt_count", "rejectedAttemptCount", "int"),
+            ("best_submission_time_seconds", "bestSubmissionTimeSeconds", "int"),
+        ):
+            schema.append(
+                (
+                    name + "_" + problem["index"],
+                    kind,
+                    lambda row, position=position, key=key: row["problemResults"][
+                        position
+                    ].get(key),
+                )
+            )
+    return tuple(schema)
+
+
+def to_columns(cls, objs, problems=None):
+    """
+    Makes Columns from list of JSON dicts of Submission, RanklistRow or RatingChange
+    without creating objects.
+
+    problems are JSON dicts of problems of the standings, results of each problem
+    are added as separate columns for RanklistRow.
+    """
+    if cls not in _SCHEMAS:
+        raise TypeError("Columns can't be made for %s" % cls.__name__)
+    schema = _SCHEMAS[cls]
+    if cls is RanklistRow and problems:
+        schema += _problem_results_schema(problems)
+    columns = {}
+    for name, kind, get in schema:
+        columns[name] = _column(kind, map(get, objs))
+    return Columns(columns, len(objs))
+
+
+def concat_columns(parts):
+    """
+    Returns Columns with rows of all parts one after another, parts should have the
+    same columns.
+    """
+    columns = {}
+    for name, first in parts[0].items():
+        if isinstance(first, DictionaryColumn):
+            values = {}
+            codes = array.array("i")
+            for part in parts:
+                column = part[name]
+                # Codes of the part are replaced with codes in merged values.
+                mapping = [
+                    values.setdefault(value, len(values)) for value in column.values
+                ]
+                mapping.append(MISSING)
+                codes.extend(array.array("i", [mapping[code] for code in column.codes]))
+            columns[name] = DictionaryColumn(codes, list(values))
+        else:
+            data = array.array(first.typecode)
+            for part in parts:
+                data.extend(part[name])
+            columns[name] = data
+    return Columns(columns, sum(len(part) for part in parts))
@@ -0,0 +1,79 @@
+"""
+Deadlines of calls, which bound waiting for rate limit, retries and responses.
+Copyright (C) 2021 Vadim Vergasov
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import time
+
+from codeforces_api.exceptions import CodeforcesTimeoutError
+
+# HTTP clients don't accept zero timeouts, so at least this is left for a request.
+_MIN_TIMEOUT = 0.001
+
+
+class Deadline:
+    """
+    Moment by which a call should finish.
+
+    One deadline can be passed as timeout to many calls, so all of them together
+    fit into one time budget.
+    """
+
+    __slots__ = ("expires",)
+
+    def __init__(self, timeout):
+        """
+        timeout is the number of seconds from now.
+        """
+        if timeout < 0:
+            raise ValueError("timeout should be non-negative")
+        self.expires = time.monotonic() + timeout
+
+    def remaining(self):
+        """
+        Returns number of seconds left, 0 if the deadline has passed.
+        """
+        return max(0.0, self.expires - time.monotonic())
+
+    def expired(self):
+        return time.monotonic() >= self.expires
+
+    def limit(self, timeout):
+        """
+        Returns timeout in seconds (None means no timeout) shortened to the time left.
+        """
+        remaining = max(_MIN_TIMEOUT, self.remaining())
+        return remaining if timeout is None else min(timeout, remaining)
+
+    def check(self):
+        """
+        Raises CodeforcesTimeoutError if the deadline has passed.
+        """
+        if self.expired():
+            raise CodeforcesTimeoutError("Deadline of the call is exceeded.")
+
+
+def _deadline(timeout):
+    """
+    Returns Deadline for timeout argument of methods: number of seconds, Deadline or
+    None.
+    """
+    if timeout is None or isinstance(timeout, Deadline):
+        return timeout
+    return Deadline(timeout)
+
+
+def _remaining(deadline):
+    return None if deadline is None else deadline.remaining()
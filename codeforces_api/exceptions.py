@@ -0,0 +1,66 @@
+"""
+Exceptions raised for failed requests to codeforces.com.
+Copyright (C) 2021 Vadim Vergasov
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+
+class CodeforcesApiError(Exception):
+    """
+    Request to codeforces.com failed.
+
+    status_code is HTTP status of the response, comment is the comment returned by API
+    and retry_after is the value of Retry-After header in seconds (if any).
+    """
+
+    def __init__(self, *args, status_code=None, comment=None, retry_after=None):
+        super().__init__(*args)
+        self.status_code = status_code
+        self.comment = comment
+        self.retry_after = retry_after
+
+
+class HandleNotFoundError(CodeforcesApiError):
+    """
+    User with the handle doesn't exist, handle is available as attribute.
+    """
+
+    def __init__(self, *args, handle=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.handle = handle
+
+
+class CodeforcesUnavailableError(CodeforcesApiError, SystemError):
+    """
+    Codeforces is unavailable now (502 status code).
+    """
+
+
+class CodeforcesResponseError(CodeforcesApiError, ValueError):
+    """
+    Response of codeforces.com can't be parsed.
+    """
+
+
+class CodeforcesTimeoutError(CodeforcesApiError, TimeoutError):
+    """
+    Call didn't finish before its deadline.
+
+    partial is the part of the result which was received in time (e.g. users of
+    received chunks of handles) or None if there is no such part.
+    """
+
+    def __init__(self, *args, partial=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.partial = partial
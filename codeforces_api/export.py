@@ -0,0 +1,233 @@
+"""
+Export of results to NumPy structured arrays and pandas DataFrames.
+Copyright (C) 2021 Vadim Vergasov
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import array
+
+from codeforces_api import types
+from codeforces_api.columnar import MISSING, Columns, DictionaryColumn
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+try:
+    import pandas
+except ImportError:
+    pandas = None
+
+
+def to_records(results, cls=None):
+    """
+    Returns NumPy structured array with a field for every attribute of objects.
+
+    results is a list of objects, list of JSON dicts (raw result, cls is required
+    then) or Columns. Attributes of nested objects are flattened into fields with
+    prefixed names, e.g. problem_index or author_members_handle (handles are joined
+    with ";"). Missing integers and floats are NaN, missing strings are None.
+    """
+    if numpy is None:
+        raise ImportError(
+            "numpy is required, install it with pip install CodeforcesApiPy[numpy]"
+        )
+    if isinstance(results, Columns):
+        columns = {name: _column_values(column) for name, column in results.items()}
+        length = len(results)
+    else:
+        columns = {
+            name: _numpy_column(values)
+            for name, values in _collect(results, cls).items()
+        }
+        length = len(results)
+    records = numpy.empty(
+        length, dtype=[(name, column.dtype) for name, column in columns.items()]
+    )
+    for name, column in columns.items():
+        records[name] = column
+    return records
+
+
+def to_dataframe(results, cls=None):
+    """
+    Returns pandas DataFrame with a column for every attribute of objects.
+
+    results are the same as for to_records. Optional integer and boolean attributes
+    (e.g. Problem.rating) are nullable Int64 and boolean columns, string columns of
+    Columns are categorical.
+    """
+    if pandas is None:
+        raise ImportError(
+            "pandas is required, install it with pip install CodeforcesApiPy[pandas]"
+        )
+    if isinstance(results, Columns):
+        columns = {}
+        for name, column in results.items():
+            if isinstance(column, DictionaryColumn):
+                columns[name] = pandas.Categorical.from_codes(
+                    numpy.asarray(column.codes), column.values
+                )
+                continue
+            values = _numeric_values(column)
+            missing = values == MISSING
+            if values.dtype.kind == "i" and missing.any():
+                # Nullable column instead of MISSING placeholders.
+                values = pandas.arrays.IntegerArray(values, missing)
+            columns[name] = values
+        return pandas.DataFrame(columns)
+    return pandas.DataFrame(
+        {
+            name: _pandas_column(values)
+            for name, values in _collect(results, cls).items()
+        },
+        index=pandas.RangeIndex(len(results)),
+    )
+
+
+def _collect(results, cls):
+    """
+    Returns dict with list of values for every column, results are read once.
+    """
+    if cls is None:
+        if not results:
+            return {}
+        cls = type(results[0])
+    cls = getattr(cls, "_base", cls)
+    from_json = bool(results) and isinstance(results[0], dict)
+    getters = [
+        (name, _getter(steps, leaf, from_json))
+        for name, steps, leaf in _flat_fields(cls)
+    ]
+    columns = {name: [] for name, _ in getters}
+    appends = [(columns[name].append, get) for name, get in getters]
+    for obj in results:
+        for append, get in appends:
+            append(get(obj))
+    return columns
+
+
+def _flat_fields(cls, steps=()):
+    """
+    Yields (name of the column, steps, leaf) for attributes of cls.
+
+    steps are pairs of attribute and JSON key which lead to the value. leaf is None
+    for values, name of attribute and JSON key for lists of objects with one
+    attribute (they are joined) and nested class for other lists of objects.
+    """
+    for name in cls.__slots__:
+        path = steps + ((name, types._json_key(cls, name)),)
+        if name not in cls._nested:
+            yield "_".join(step[0] for step in path), path, None
+            continue
+        nested = getattr(types, cls._nested[name][0])
+        if not cls._nested[name][1]:
+            yield from _flat_fields(nested, path)
+        elif len(nested.__slots__) == 1:
+            attribute = nested.__slots__[0]
+            leaf = (attribute, types._json_key(nested, attribute))
+            yield "_".join(step[0] for step in path) + "_" + attribute, path, leaf
+        else:
+            yield "_".join(step[0] for step in path), path, nested
+
+
+def _getter(steps, leaf, from_json):
+    def get(obj):
+        for step in steps:
+            if obj is None:
+                return None
+            if from_json:
+                obj = obj.get(step[1])
+            else:
+                obj = getattr(obj, step[0], None)
+        if leaf is None or obj is None:
+            return obj
+        if isinstance(leaf, tuple):
+            if from_json:
+                return ";".join(item[leaf[1]] for item in obj)
+            return ";".join(getattr(item, leaf[0]) for item in obj)
+        if from_json:
+            return [leaf.de_json(item).to_dict() for item in obj]
+        return [item.to_dict() for item in obj]
+
+    return get
+
+
+def _kind(values):
+    """
+    Returns bool, int, float or object for the values and whether any is missing.
+    """
+    kinds = set()
+    missing = False
+    for value in values:
+        if value is None:
+            missing = True
+        else:
+            kinds.add(type(value))
+    if kinds == {bool}:
+        return bool, missing
+    if kinds == {int}:
+        return int, missing
+    if kinds and kinds <= {int, float}:
+        return float, missing
+    return object, missing
+
+
+def _numpy_column(values):
+    kind, missing = _kind(values)
+    if kind is object:
+        column = numpy.empty(len(values), dtype=object)
+        column[:] = values
+        return column
+    if kind is bool:
+        return numpy.array(values, dtype=object if missing else bool)
+    if missing or kind is float:
+        return numpy.array(
+            [numpy.nan if value is None else value for value in values],
+            dtype=numpy.float64,
+        )
+    return numpy.array(values, dtype=numpy.int64)
+
+
+def _pandas_column(values):
+    kind, missing = _kind(values)
+    if kind is int:
+        return pandas.array(values, dtype="Int64" if missing else "int64")
+    if kind is bool:
+        return pandas.array(values, dtype="boolean" if missing else "bool")
+    return _numpy_column(values)
+
+
+def _column_values(column):
+    if isinstance(column, DictionaryColumn):
+        values = numpy.empty(len(column.values) + 1, dtype=object)
+        values[: len(column.values)] = column.values
+        # Code -1 of missing values points to None at the end.
+        return values[numpy.asarray(column.codes)]
+    values = _numeric_values(column)
+    missing = values == MISSING
+    if values.dtype.kind == "i" and missing.any():
+        values = values.astype(numpy.float64)
+        values[missing] = numpy.nan
+    return values
+
+
+def _numeric_values(column):
+    """
+    Returns numpy array of integer or float column of Columns.
+    """
+    if isinstance(column, array.array):
+        return numpy.frombuffer(column, dtype=column.typecode)
+    return numpy.asarray(column)
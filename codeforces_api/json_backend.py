@@ -0,0 +1,90 @@
+"""
+JSON library which is used for decoding and encoding, the fastest installed one is
+selected by default.
+Copyright (C) 2021 Vadim Vergasov
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import importlib
+import json
+
+# Supported libraries in order of preference.
+BACKENDS = ("orjson", "ujson", "json")
+
+# All libraries raise subclasses of ValueError for invalid documents.
+DecodeError = ValueError
+
+backend = None
+
+# Decodes bytes, bytearray or str, replaced by set_json_backend.
+loads = json.loads
+
+
+def _stdlib_dumps(obj):
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _ujson_loads(data):
+    # ujson doesn't accept bytearray and memoryview.
+    if not isinstance(data, (str, bytes)):
+        data = bytes(data)
+    return _library.loads(data)
+
+
+def _ujson_dumps(obj):
+    return _library.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+
+# Encodes object to UTF-8 bytes, replaced by set_json_backend.
+dumps = _stdlib_dumps
+
+
+def set_json_backend(name=None):
+    """
+    Selects JSON library: "orjson", "ujson" or "json".
+
+    If name is None the first installed library from BACKENDS is used.
+    """
+    global backend, loads, dumps, _library
+    if name is None:
+        for candidate in BACKENDS:
+            try:
+                importlib.import_module(candidate)
+            except ImportError:
+                continue
+            name = candidate
+            break
+    if name not in BACKENDS:
+        raise ValueError("JSON backend should be one of: " + ", ".join(BACKENDS))
+    _library = importlib.import_module(name)
+    loads = _library.loads
+    if name == "orjson":
+        dumps = _library.dumps
+    elif name == "ujson":
+        loads = _ujson_loads
+        dumps = _ujson_dumps
+    else:
+        dumps = _stdlib_dumps
+    backend = name
+
+
+def get_json_backend():
+    """
+    Returns name of the selected JSON library.
+    """
+    return backend
+
+
+_library = json
+set_json_backend()
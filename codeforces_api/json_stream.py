@@ -0,0 +1,120 @@
+"""
+Incremental parser for arrays in responses of codeforces.com.
+Copyright (C) 2021 Vadim Vergasov
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import codecs
+import json
+
+from codeforces_api import json_backend
+from codeforces_api.exceptions import CodeforcesResponseError
+
+# Size of chunks which are read from the response.
+STREAM_CHUNK_SIZE = 64 * 1024
+
+_WHITESPACE = " \t\n\r"
+
+
+class JSONArrayStream:
+    """
+    Parses elements of the first array with given key in JSON document, which is
+    fed chunk by chunk. Only the current element is kept in memory.
+
+    For example key "result" is used for {"status":"OK","result":[...]} and key
+    "problems" for {"status":"OK","result":{"problems":[...],...}}.
+    """
+
+    def __init__(self, key="result"):
+        self._token = '"%s":' % key
+        self._text_decoder = codecs.getincrementaldecoder("utf-8")()
+        self._json_decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._started = False
+        self._finished = False
+
+    def feed(self, chunk):
+        """
+        Adds chunk of bytes and returns list of elements which are complete now.
+        """
+        self._buffer += self._text_decoder.decode(chunk)
+        if self._finished:
+            # Tail of the document isn't needed.
+            self._buffer = ""
+            return []
+        if not self._started and not self._start():
+            return []
+        return self._parse_elements()
+
+    def close(self):
+        """
+        Checks that document is over.
+
+        Returns parsed document if it doesn't contain the array (e.g. for FAILED
+        status), otherwise returns None.
+        """
+        self._buffer += self._text_decoder.decode(b"", final=True)
+        if self._finished:
+            return None
+        if self._started:
+            raise CodeforcesResponseError("Response is truncated.")
+        try:
+            return json_backend.loads(self._buffer)
+        except json_backend.DecodeError as error:
+            raise CodeforcesResponseError(
+                "Can't parse response: %s. Response text: %s"
+                % (str(error), self._buffer[:1000])
+            )
+
+    def _start(self):
+        position = self._buffer.find(self._token)
+        if position == -1:
+            return False
+        position += len(self._token)
+        while position < len(self._buffer) and self._buffer[position] in _WHITESPACE:
+            position += 1
+        if position == len(self._buffer):
+            return False
+        if self._buffer[position] != "[":
+            raise CodeforcesResponseError(
+                "%s is not an array in the response." % self._token[:-1]
+            )
+        self._buffer = self._buffer[position + 1 :]
+        self._started = True
+        return True
+
+    def _parse_elements(self):
+        elements = []
+        buffer = self._buffer
+        position = 0
+        while True:
+            while position < len(buffer) and buffer[position] in _WHITESPACE + ",":
+                position += 1
+            if position == len(buffer):
+                break
+            if buffer[position] == "]":
+                self._finished = True
+                position = len(buffer)
+                break
+            try:
+                element, end = self._json_decoder.raw_decode(buffer, position)
+            except json.decoder.JSONDecodeError:
+                break
+            if end == len(buffer):
+                # Number at the end of the buffer may be incomplete.
+                break
+            elements.append(element)
+            position = end
+        self._buffer = buffer[position:]
+        return elements
@@ -0,0 +1,76 @@
+"""
+Making columnar results from long lists in chunks by other processes.
+Copyright (C) 2021 Vadim Vergasov
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import warnings
+
+from codeforces_api import json_backend
+from codeforces_api.columnar import concat_columns, to_columns
+
+# Default number of objects in one chunk, shorter lists are processed in place.
+DECODE_CHUNK_SIZE = 20000
+
+
+class _DecodingPool:
+    """
+    Makes Columns from lists of JSON objects longer than chunk_size by executor
+    (usually concurrent.futures.ProcessPoolExecutor), each chunk separately.
+
+    Lists of objects are always made in process: making them again from pickle or
+    to_bytes costs more than de_json, so only columns are worth sending back.
+    """
+
+    __slots__ = ("executor", "chunk_size")
+
+    def __init__(self, executor, chunk_size=DECODE_CHUNK_SIZE):
+        if chunk_size < 1:
+            raise ValueError("decode_chunk_size should be positive")
+        self.executor = executor
+        self.chunk_size = chunk_size
+
+    def accepts(self, objs):
+        return len(objs) > self.chunk_size
+
+    def warn_in_process(self):
+        """
+        Warns that long list is decoded into objects in process, not by executor.
+        """
+        warnings.warn(
+            "decode_executor is used only for columnar results, "
+            "long list of objects is decoded in process",
+            RuntimeWarning,
+            stacklevel=2,
+        )
+
+    def to_columns(self, cls, objs, problems=None):
+        """
+        Returns the same Columns as to_columns(cls, objs, problems).
+        """
+        # Chunks are sent as JSON, which is faster to pickle than dicts.
+        futures = [
+            self.executor.submit(
+                _chunk_columns,
+                cls,
+                json_backend.dumps(objs[start : start + self.chunk_size]),
+                problems,
+            )
+            for start in range(0, len(objs), self.chunk_size)
+        ]
+        return concat_columns([future.result() for future in futures])
+
+
+def _chunk_columns(cls, data, problems):
+    return to_columns(cls, json_backend.loads(data), problems)
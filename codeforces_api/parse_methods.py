@@ -15,22 +15,33 @@ You should have received a copy of the GNU General Public License
 along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 
-import requests
 from lxml import html
 
 from codeforces_api.api_requests import CodeforcesApi
+from codeforces_api.transport import Transport
 
 
 class CodeforcesParser:
 
     session = None
+    rate_limiter = None
+    transport = None
     problem_tags = dict()
 
-    def __init__(self):
+    def __init__(self, rate_limiter=None, transport=None):
         """
         Initializing class. All we will need is a session to optimize performance.
+
+        rate_limiter is a RateLimiter, which is used for all requests to codeforces.com.
+
+        transport is a Transport, which connections, timeouts and proxies are used for
+        all requests to codeforces.com.
         """
-        self.session = requests.Session()
+        if transport is None:
+            transport = Transport()
+        self.transport = transport
+        self.session = transport.session
+        self.rate_limiter = rate_limiter
 
     def get_solution(self, contest_id, submit_id):
         """
@@ -40,6 +51,8 @@ class CodeforcesParser:
 
         submit_id is the id of submission.
         """
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire()
         solutionPage = self.session.get(
             "https://codeforces.com/contest/"
             + str(contest_id)
@@ -50,6 +63,7 @@ class CodeforcesParser:
                 "expires": "Thu, 31-Dec-37 23:55:55 GMT",
                 "path": "/",
             },
+            **self.transport.request_options()
         )
         if int(solutionPage.status_code) != 200:
             raise Exception("Returned not OK code " + str(solutionPage))
@@ -71,7 +85,9 @@ class CodeforcesParser:
         """
         # If we don't have tags we should get them.
         if self.problem_tags == dict():
-            cf_api = CodeforcesApi()
+            cf_api = CodeforcesApi(
+                rate_limiter=self.rate_limiter, transport=self.transport
+            )
             for problem in cf_api.problemset_problems()["problems"]:
                 if str(problem.contest_id) not in self.problem_tags.keys():
                     self.problem_tags[str(problem.contest_id)] = dict()
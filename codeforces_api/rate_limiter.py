@@ -0,0 +1,147 @@
+"""
+Client-side rate limiters which keep requests under the Codeforces call limit.
+Copyright (C) 2021 Vadim Vergasov
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import struct
+import threading
+import time
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+    import msvcrt
+
+
+class RateLimiter:
+    """
+    Token bucket, which can be shared by all threads and clients in the process.
+
+    By default allows 1 call per 2 seconds, as Codeforces does.
+    """
+
+    def __init__(self, calls=1, period=2.0, burst=None):
+        """
+        calls per period is the allowed rate.
+
+        burst is the number of calls which can be made at once, default is calls.
+        """
+        if calls <= 0 or period <= 0:
+            raise ValueError("calls and period should be positive")
+        self.rate = calls / period
+        self.capacity = calls if burst is None else burst
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _take(self, tokens, updated, now):
+        tokens = min(self.capacity, tokens + (now - updated) * self.rate) - 1
+        if tokens >= 0:
+            return tokens, 0.0
+        return tokens, -tokens / self.rate
+
+    def reserve(self, timeout=None):
+        """
+        Takes one token and returns how many seconds caller should wait before the call.
+
+        Tokens are taken even if they are not available yet, so callers are served in order.
+
+        If caller would have to wait more than timeout seconds, token isn't taken and
+        None is returned.
+        """
+        with self._lock:
+            now = time.monotonic()
+            tokens, delay = self._take(self._tokens, self._updated, now)
+            if timeout is not None and delay > timeout:
+                return None
+            self._tokens, self._updated = tokens, now
+        return delay
+
+    def acquire(self, timeout=None):
+        """
+        Blocks until the call is allowed.
+
+        Returns False without waiting if the call isn't allowed within timeout seconds.
+        """
+        delay = self.reserve(timeout)
+        if delay is None:
+            return False
+        if delay > 0:
+            time.sleep(delay)
+        return True
+
+
+class FileRateLimiter(RateLimiter):
+    """
+    Token bucket, which state is stored in a locked file.
+
+    All processes on the host which use the same path share the limit.
+    """
+
+    _state = struct.Struct("<dd")
+
+    def __init__(self, path, calls=1, period=2.0, burst=None):
+        """
+        path is the file for the bucket state, it will be created if needed.
+        """
+        super().__init__(calls, period, burst)
+        self.path = path
+
+    def reserve(self, timeout=None):
+        """
+        Takes one token and returns how many seconds caller should wait before the call.
+
+        Tokens are taken even if they are not available yet, so callers are served in order.
+
+        If caller would have to wait more than timeout seconds, token isn't taken and
+        None is returned.
+        """
+        with open(self.path, "a+b") as state_file:
+            _lock_file(state_file)
+            try:
+                state_file.seek(0)
+                state = state_file.read(self._state.size)
+                now = time.time()
+                if len(state) == self._state.size:
+                    tokens, updated = self._state.unpack(state)
+                else:
+                    tokens, updated = self.capacity, now
+                tokens, delay = self._take(tokens, min(updated, now), now)
+                if timeout is not None and delay > timeout:
+                    return None
+                state_file.seek(0)
+                state_file.truncate()
+                state_file.write(self._state.pack(tokens, now))
+                state_file.flush()
+            finally:
+                _unlock_file(state_file)
+        return delay
+
+
+def _lock_file(file):
+    if fcntl is not None:
+        fcntl.flock(file.fileno(), fcntl.LOCK_EX)
+    else:
+        file.seek(0)
+        msvcrt.locking(file.fileno(), msvcrt.LK_LOCK, 1)
+
+
+def _unlock_file(file):
+    if fcntl is not None:
+        fcntl.flock(file.fileno(), fcntl.LOCK_UN)
+    else:
+        file.seek(0)
+        msvcrt.locking(file.fileno(), msvcrt.LK_UNLCK, 1)
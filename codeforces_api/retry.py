@@ -0,0 +1,106 @@
+"""
+Retry policy for transient failures of codeforces.com.
+Copyright (C) 2021 Vadim Vergasov
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import asyncio
+import random
+
+import requests
+
+from codeforces_api.exceptions import CodeforcesApiError
+
+try:
+    import aiohttp
+
+    NETWORK_ERRORS = (
+        requests.ConnectionError,
+        requests.Timeout,
+        aiohttp.ClientConnectionError,
+        aiohttp.ClientPayloadError,
+        asyncio.TimeoutError,
+    )
+except ImportError:
+    NETWORK_ERRORS = (requests.ConnectionError, requests.Timeout, asyncio.TimeoutError)
+
+
+class RetryPolicy:
+    """
+    Describes which failed requests should be retried and how long to wait before it.
+
+    Delays grow exponentially: backoff_base * 2 ** (attempt - 1), but not more than
+    backoff_cap. With jitter a random delay between 0 and this value is used, so many
+    clients don't retry at the same moment. Retry-After header is always respected.
+    """
+
+    def __init__(
+        self,
+        max_attempts=5,
+        backoff_base=1.0,
+        backoff_cap=30.0,
+        jitter=True,
+        retry_statuses=(429, 500, 502, 503, 504),
+        retry_comments=("Call limit exceeded",),
+        retry_network_errors=True,
+    ):
+        """
+        max_attempts is the total number of attempts, including the first one.
+
+        retry_statuses is a collection of HTTP statuses which are retried.
+
+        retry_comments is a collection of API comments (or their beginnings) which are
+        retried regardless of HTTP status.
+
+        retry_network_errors is used for retrying connection errors and timeouts.
+        """
+        if max_attempts < 1:
+            raise ValueError("max_attempts should be at least 1")
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self.jitter = jitter
+        self.retry_statuses = frozenset(retry_statuses)
+        self.retry_comments = tuple(retry_comments)
+        self.retry_network_errors = retry_network_errors
+
+    def is_transient(self, error):
+        """
+        Checks if error is worth retrying.
+        """
+        if isinstance(error, CodeforcesApiError):
+            if error.comment is not None and error.comment.startswith(
+                self.retry_comments
+            ):
+                return True
+            return error.status_code in self.retry_statuses
+        return self.retry_network_errors and isinstance(error, NETWORK_ERRORS)
+
+    def should_retry(self, error, attempt):
+        """
+        Checks if request should be made again after attempt number attempt failed.
+        """
+        return attempt < self.max_attempts and self.is_transient(error)
+
+    def delay(self, error, attempt):
+        """
+        Returns number of seconds to wait after attempt number attempt failed.
+        """
+        delay = min(self.backoff_cap, self.backoff_base * 2 ** (attempt - 1))
+        if self.jitter:
+            delay = random.uniform(0, delay)
+        retry_after = getattr(error, "retry_after", None)
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+        return delay
@@ -0,0 +1,279 @@
+"""
+Declarative description of fields of returned objects, their constructors, de_json and
+to_dict methods are generated from it.
+Copyright (C) 2021 Vadim Vergasov
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+
+class Field:
+    """
+    Field of the object.
+
+    name is the name of the attribute, key is the key in JSON (name in camelCase by
+    default) and argument is the name of the constructor argument (name by default).
+
+    optional fields may be missing in JSON and are None then, unset fields aren't
+    set at all if they are missing. Constructor arguments of optional fields at the
+    end have None as default value, has_default overrides this.
+
+    nested is the name of the class of the object in the field, many is set if
+    field contains a list of them.
+
+    intern is set for strings which repeat in responses, they are shared when
+    objects are decoded with an interner.
+    """
+
+    __slots__ = (
+        "name",
+        "key",
+        "argument",
+        "optional",
+        "unset",
+        "has_default",
+        "nested",
+        "many",
+        "intern",
+    )
+
+    def __init__(
+        self,
+        name,
+        key=None,
+        argument=None,
+        optional=False,
+        unset=False,
+        has_default=None,
+        nested=None,
+        many=False,
+        intern=False,
+    ):
+        self.name = name
+        self.key = key if key is not None else _camel_case(name)
+        self.argument = argument if argument is not None else name
+        self.optional = optional or unset
+        self.unset = unset
+        self.has_default = has_default
+        self.nested = nested
+        self.many = many
+        self.intern = intern
+
+
+def slots(schema):
+    """
+    Returns __slots__ for the class with given schema.
+    """
+    return tuple(field.name for field in schema)
+
+
+def generate(cls, namespace):
+    """
+    Adds metadata and __init__, de_json, to_dict and __reduce__ (if they aren't
+    defined by the class) generated from cls._schema, namespace is used for nested
+    classes. _from_row makes object from tuple of values of fields without calling
+    the constructor.
+    """
+    cls._renamed = {
+        field.name: field.key
+        for field in cls._schema
+        if field.key != _camel_case(field.name)
+    }
+    cls._nested = {
+        field.name: (field.nested, field.many)
+        for field in cls._schema
+        if field.nested is not None
+    }
+    cls._unset_if_missing = tuple(field.name for field in cls._schema if field.unset)
+    if "__init__" not in cls.__dict__:
+        cls.__init__ = _compile(cls, "__init__", _init_source(cls._schema), {})
+    if "de_json" not in cls.__dict__:
+        globals_ = {"new": object.__new__, "intern_key": cls._intern_key}
+        for field in cls._schema:
+            if field.nested is not None:
+                globals_[field.nested] = namespace[field.nested]
+        cls.de_json = classmethod(
+            _compile(cls, "de_json", _de_json_source(cls), globals_)
+        )
+    if "to_dict" not in cls.__dict__:
+        cls.to_dict = _compile(cls, "to_dict", _to_dict_source(cls._schema), {})
+    cls._from_row = classmethod(
+        _compile(
+            cls, "_from_row", _from_row_source(cls._schema), {"new": object.__new__}
+        )
+    )
+    if "__reduce__" not in cls.__dict__:
+        cls.__reduce__ = _compile(
+            cls, "__reduce__", _reduce_source(cls._schema), {"restore": restore}
+        )
+
+
+def restore(cls, values, missing=()):
+    """
+    Returns object of cls with values of fields in schema order, it's used for
+    unpickling. Unset fields in missing are deleted.
+    """
+    obj = cls._from_row(values)
+    for name in missing:
+        delattr(obj, name)
+    return obj
+
+
+def _camel_case(name):
+    first, *rest = name.split("_")
+    return first + "".join(part.capitalize() for part in rest)
+
+
+def _compile(cls, name, source, globals_):
+    code = compile(source, "<%s.%s>" % (cls.__name__, name), "exec")
+    exec(code, globals_)
+    function = globals_[name]
+    function.__qualname__ = "%s.%s" % (cls.__name__, name)
+    function.__module__ = cls.__module__
+    return function
+
+
+def _init_source(schema):
+    # Arguments have default value if field is optional and all following have it.
+    defaults = []
+    default = True
+    for field in reversed(schema):
+        if field.has_default is not None:
+            default = field.has_default
+        else:
+            default = default and field.optional
+        defaults.append(default)
+    defaults.reverse()
+    arguments = [
+        field.argument + ("=None" if default else "")
+        for field, default in zip(schema, defaults)
+    ]
+    lines = ["def __init__(self, %s):" % ", ".join(arguments)]
+    for field in schema:
+        lines.append("    self.%s = %s" % (field.name, field.argument))
+    return "\n".join(lines) + "\n"
+
+
+def _value_source(field):
+    if field.optional:
+        value = "obj.get(%r)" % field.key
+    else:
+        value = "obj[%r]" % field.key
+    if field.nested is None:
+        return value
+    decode = "%s.de_json" % field.nested
+    if not field.many:
+        return "%s(%s, interner)" % (decode, value)
+    source = "[%s(item, interner) for item in obj[%r]]" % (decode, field.key)
+    if field.optional:
+        source = "None if obj.get(%r) is None else %s" % (field.key, source)
+    return source
+
+
+def _de_json_source(cls):
+    lines = [
+        "def de_json(cls, json_string, interner=None):",
+        "    if json_string is None:",
+        "        return None",
+        "    if type(json_string) is dict:",
+        "        obj = json_string",
+        "    else:",
+        "        obj = cls.check_json(json_string)",
+    ]
+    if cls._intern_key is not None:
+        lines += [
+            "    if interner is not None:",
+            "        key = (cls, intern_key(obj))",
+            "        self = interner.objects.get(key)",
+            "        if self is not None:",
+            "            return self",
+        ]
+    lines.append("    self = new(cls)")
+    for field in cls._schema:
+        assignment = "self.%s = %s" % (field.name, _value_source(field))
+        if field.unset:
+            lines.append("    if %r in obj:" % field.key)
+            lines.append("        " + assignment)
+        else:
+            lines.append("    " + assignment)
+    interned = [field.name for field in cls._schema if field.intern]
+    if interned or cls._intern_key is not None:
+        lines.append("    if interner is not None:")
+        for name in interned:
+            lines.append("        self.%s = interner.value(self.%s)" % (name, name))
+        if cls._intern_key is not None:
+            lines.append("        interner.objects[key] = self")
+    lines.append("    return self")
+    return "\n".join(lines) + "\n"
+
+
+def _to_dict_source(schema):
+    lines = ["def to_dict(self):", "    dictionary = {"]
+    unset = []
+    for field in schema:
+        if field.unset:
+            unset.append(field)
+            continue
+        value = "self.%s" % field.name
+        if field.nested is not None:
+            if field.many:
+                value = "[item.to_dict() for item in self.%s]" % field.name
+            else:
+                value = "self.%s.to_dict()" % field.name
+            if field.optional:
+                value = "None if self.%s is None else %s" % (field.name, value)
+        lines.append("        %r: %s," % (field.name, value))
+    lines.append("    }")
+    for field in unset:
+        value = "self.%s" % field.name
+        if field.nested is not None:
+            value += ".to_dict()"
+        lines.append("    if hasattr(self, %r):" % field.name)
+        lines.append("        dictionary[%r] = %s" % (field.name, value))
+    lines.append("    return dictionary")
+    return "\n".join(lines) + "\n"
+
+
+def _from_row_source(schema):
+    targets = ", ".join("self.%s" % field.name for field in schema)
+    lines = [
+        "def _from_row(cls, row):",
+        "    self = new(cls)",
+        "    %s, = row" % targets,
+        "    return self",
+    ]
+    return "\n".join(lines) + "\n"
+
+
+def _reduce_source(schema):
+    # Values are pickled as a tuple instead of dict of slots.
+    values = []
+    for field in schema:
+        if field.unset:
+            values.append("getattr(self, %r, None)" % field.name)
+        else:
+            values.append("self.%s" % field.name)
+    lines = [
+        "def __reduce__(self):",
+        "    values = (%s,)" % ", ".join(values),
+    ]
+    unset = tuple(field.name for field in schema if field.unset)
+    if unset:
+        lines += [
+            "    missing = tuple(name for name in %r if not hasattr(self, name))"
+            % (unset,),
+            "    if missing:",
+            "        return restore, (type(self), values, missing)",
+        ]
+    lines.append("    return restore, (type(self), values)")
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,320 @@
+"""
+Compact binary serialization and pickling of returned objects and lists of them.
+Copyright (C) 2021 Vadim Vergasov
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+Format: magic, length of the header and the header (JSON with string table and
+description of columns), then buffers of columns in little-endian byte order.
+Objects of each class are stored once in a table of columns (one per field),
+fields with nested objects contain indexes in the table of their class, so shared
+objects stay shared after loading.
+"""
+
+import array
+import functools
+import itertools
+import pickle
+import struct
+import sys
+
+from codeforces_api import json_backend, types
+
+_MAGIC = b"CFB\x01"
+
+_LENGTH = struct.Struct("<I")
+
+_TYPECODES = {"int": "q", "float": "d", "str": "i", "bool": "b", "object": "i"}
+
+_INT64 = (-(2**63), 2**63 - 1)
+
+# Value of attributes which aren't set (see schema.Field.unset).
+_UNSET = object()
+
+# Codes of None and unset value in object columns by id.
+_SPECIAL_CODES = {id(None): -1, id(_UNSET): -2}
+
+
+def to_bytes(results):
+    """
+    Returns bytes with the object or list of objects of one type, they are loaded
+    back with from_bytes.
+    """
+    many = isinstance(results, list)
+    objs = results if many else [results]
+    if not objs:
+        return _pack({"root": None, "many": True, "strings": [], "tables": []}, [])
+    cls = _model(objs[0])
+    if any(_model(obj) is not cls for obj in objs):
+        raise TypeError("All objects should have the same type")
+    tables = {}
+    _gather(cls, objs, tables)
+    strings = {}
+    buffers = []
+    header = {
+        "root": cls.__name__,
+        "many": many,
+        "tables": [
+            _encode_table(table_cls, tables, strings, buffers)
+            for table_cls in _order(cls)
+            if table_cls in tables
+        ],
+    }
+    header["strings"] = list(strings)
+    buffers.append(_array("i", [tables[cls][1][id(obj)] for obj in objs]))
+    return _pack(header, buffers)
+
+
+def from_bytes(data):
+    """
+    Returns the object or list of objects stored with to_bytes.
+    """
+    data = memoryview(data)
+    if data[: len(_MAGIC)] != _MAGIC:
+        raise ValueError("Data isn't made by to_bytes")
+    offset = len(_MAGIC) + _LENGTH.size
+    (length,) = _LENGTH.unpack_from(data, len(_MAGIC))
+    header = json_backend.loads(bytes(data[offset : offset + length]))
+    reader = _Reader(data, offset + length)
+    if header["root"] is None:
+        return []
+    # Index -1 of string and object tables is None.
+    strings = header["strings"] + [None]
+    tables = {}
+    for table in header["tables"]:
+        cls = getattr(types, table["class"])
+        tables[cls.__name__] = _decode_table(cls, table, strings, tables, reader)
+    root = tables[header["root"]]
+    objs = [root[code] for code in reader.read("i", None)]
+    return objs if header["many"] else objs[0]
+
+
+def to_pickle(results):
+    """
+    Returns pickle of results (pickle protocol 5) and list of out-of-band buffers of
+    Columns and NumPy arrays, which can be sent without copying, e.g. to processes.
+
+    Objects are pickled as tuples of values and shared nested objects are pickled
+    once.
+    """
+    buffers = []
+    data = pickle.dumps(results, protocol=5, buffer_callback=buffers.append)
+    return data, buffers
+
+
+def from_pickle(data, buffers=()):
+    """
+    Returns results pickled with to_pickle, buffers should be in the same order.
+    """
+    return pickle.loads(data, buffers=buffers)
+
+
+def _model(obj):
+    cls = type(obj)
+    cls = getattr(cls, "_base", cls)
+    if not isinstance(obj, types.JSONDeserializable) or not cls._schema:
+        raise TypeError("%s can't be serialized" % cls.__name__)
+    return cls
+
+
+@functools.lru_cache(maxsize=None)
+def _order(cls):
+    """
+    Returns cls and classes of its nested objects, each class goes after all
+    classes of its nested objects.
+    """
+    order = []
+    for field in cls._schema:
+        if field.nested is not None:
+            for nested in _order(getattr(types, field.nested)):
+                if nested not in order:
+                    order.append(nested)
+    order.append(cls)
+    return tuple(order)
+
+
+def _gather(cls, objs, tables):
+    """
+    Adds objects and all nested objects to tables: list of objects of each class and
+    their indexes by id.
+    """
+    table, indexes = tables.setdefault(cls, ([], dict(_SPECIAL_CODES)))
+    added = []
+    for obj in objs:
+        if id(obj) not in indexes:
+            indexes[id(obj)] = len(table)
+            table.append(obj)
+            added.append(obj)
+    for field in cls._schema:
+        if field.nested is None:
+            continue
+        nested = [getattr(obj, field.name, None) for obj in added]
+        if field.many:
+            nested = [item for items in nested if items is not None for item in items]
+        else:
+            nested = [item for item in nested if item is not None]
+        if nested:
+            _gather(getattr(types, field.nested), nested, tables)
+
+
+def _encode_table(cls, tables, strings, buffers):
+    objs = tables[cls][0]
+    columns = []
+    for field in cls._schema:
+        if field.unset:
+            values = [getattr(obj, field.name, _UNSET) for obj in objs]
+        else:
+            values = [getattr(obj, field.name) for obj in objs]
+        if field.nested is None:
+            columns.append(_encode_values(values, strings, buffers))
+            continue
+        indexes = tables.get(getattr(types, field.nested), (None, _SPECIAL_CODES))[1]
+        if not field.many:
+            buffers.append(_array("i", [indexes[id(obj)] for obj in values]))
+            columns.append({"kind": "object"})
+            continue
+        lengths = [-1 if items is None else len(items) for items in values]
+        codes = [indexes[id(obj)] for items in values if items for obj in items]
+        buffers.append(_array("i", lengths))
+        buffers.append(_array("i", codes))
+        columns.append({"kind": "objects"})
+    return {"class": cls.__name__, "count": len(objs), "columns": columns}
+
+
+def _encode_values(values, strings, buffers):
+    """
+    Returns description of the column with values and adds its buffers, kind of the
+    column depends on types of values.
+    """
+    kinds = set(map(type, values))
+    nulls = type(None) in kinds
+    kinds.discard(type(None))
+    if not kinds:
+        return {"kind": "null"}
+    kind = kinds.pop().__name__ if len(kinds) == 1 else None
+    if kind == "int":
+        present = [value for value in values if value is not None]
+        if min(present) < _INT64[0] or max(present) > _INT64[1]:
+            kind = None
+    if kind == "str":
+        add = strings.setdefault
+        codes = [-1 if value is None else add(value, len(strings)) for value in values]
+        buffers.append(_array("i", codes))
+        return {"kind": kind}
+    if kind == "bool":
+        codes = [-1 if value is None else value for value in values]
+        buffers.append(_array("b", codes))
+        return {"kind": kind}
+    if kind in ("int", "float"):
+        if nulls:
+            buffers.append(_array("b", [value is None for value in values]))
+            values = [0 if value is None else value for value in values]
+        buffers.append(_array(_TYPECODES[kind], values))
+        return {"kind": kind, "nulls": nulls}
+    return {"kind": "json", "values": values}
+
+
+def _decode_table(cls, table, strings, tables, reader):
+    count = table["count"]
+    columns = []
+    for field, column in zip(cls._schema, table["columns"]):
+        kind = column["kind"]
+        if kind == "null":
+            columns.append(itertools.repeat(None, count))
+        elif kind == "json":
+            columns.append(column["values"])
+        elif kind == "str":
+            columns.append(map(strings.__getitem__, reader.read("i", count)))
+        elif kind == "bool":
+            columns.append(
+                map((False, True, None).__getitem__, reader.read("b", count))
+            )
+        elif kind in ("int", "float"):
+            nulls = reader.read("b", count) if column["nulls"] else None
+            values = reader.read(_TYPECODES[kind], count)
+            if nulls is not None:
+                values = [None if null else value for null, value in zip(nulls, values)]
+            columns.append(values)
+        else:
+            # Index -2 is unset object and -1 is None.
+            nested = tables.get(field.nested, []) + [_UNSET, None]
+            if kind == "object":
+                columns.append(map(nested.__getitem__, reader.read("i", count)))
+            else:
+                lengths = reader.read("i", count)
+                codes = reader.read("i", None)
+                columns.append(_split(lengths, [nested[code] for code in codes]))
+    objs = list(map(cls._from_row, zip(*columns)))
+    for field in cls._schema:
+        if field.unset:
+            for obj in objs:
+                if getattr(obj, field.name) is _UNSET:
+                    delattr(obj, field.name)
+    return objs
+
+
+def _split(lengths, items):
+    start = 0
+    lists = []
+    for length in lengths:
+        if length < 0:
+            lists.append(None)
+            continue
+        lists.append(items[start : start + length])
+        start += length
+    return lists
+
+
+def _array(typecode, values):
+    data = array.array(typecode, values)
+    if sys.byteorder == "big":
+        data.byteswap()
+    return data
+
+
+def _pack(header, buffers):
+    header = json_backend.dumps(header)
+    parts = [_MAGIC, _LENGTH.pack(len(header)), header]
+    for buffer in buffers:
+        parts.append(_LENGTH.pack(len(buffer)))
+        parts.append(buffer.tobytes())
+    return b"".join(parts)
+
+
+class _Reader:
+    """
+    Reads buffers of columns one after another, each one is prefixed with the number
+    of items.
+    """
+
+    __slots__ = ("data", "offset")
+
+    def __init__(self, data, offset):
+        self.data = data
+        self.offset = offset
+
+    def read(self, typecode, count):
+        """
+        Returns list of values of the next buffer, count is checked if it's known.
+        """
+        (length,) = _LENGTH.unpack_from(self.data, self.offset)
+        self.offset += _LENGTH.size
+        data = array.array(typecode)
+        end = self.offset + length * data.itemsize
+        if end > len(self.data) or (count is not None and length != count):
+            raise ValueError("Data is truncated or corrupted")
+        data.frombytes(self.data[self.offset : end])
+        self.offset = end
+        if sys.byteorder == "big":
+            data.byteswap()
+        return data.tolist()
@@ -0,0 +1,115 @@
+"""
+Coalescing of identical calls which are made at the same time.
+Copyright (C) 2021 Vadim Vergasov
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import asyncio
+import concurrent.futures
+import threading
+
+
+class SingleFlight:
+    """
+    Runs only one call for each key at a time, threads which make the same call
+    while it's running wait for it and get the same result (or exception).
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+
+    def do(self, key, function, timeout=None):
+        """
+        Returns result of function() shared between all callers with the same key.
+
+        Callers which wait for the running call wait at most timeout seconds, then
+        concurrent.futures.TimeoutError is raised.
+        """
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = concurrent.futures.Future()
+                self._calls[key] = future
+        if not leader:
+            return future.result(timeout)
+        try:
+            result = function()
+        except BaseException as error:
+            future.set_exception(error)
+            raise
+        else:
+            future.set_result(result)
+        finally:
+            with self._lock:
+                del self._calls[key]
+        return result
+
+
+class AsyncSingleFlight:
+    """
+    Runs only one call for each key at a time, coroutines which make the same call
+    while it's running await it and get the same result (or exception).
+    """
+
+    def __init__(self):
+        self._calls = {}
+
+    def running(self, key):
+        """
+        Checks if the call with the key is running, so do() would await it.
+        """
+        return key in self._calls
+
+    async def do(self, key, coroutine_function, timeout=None):
+        """
+        Returns result of await coroutine_function() shared between all callers with
+        the same key. Cancelling one of the callers doesn't cancel the call.
+
+        Callers wait at most timeout seconds, then asyncio.TimeoutError is raised.
+        The call is cancelled if no other callers wait for it.
+        """
+        call = self._calls.get(key)
+        if call is None:
+            call = _Call(asyncio.ensure_future(coroutine_function()))
+            self._calls[key] = call
+            call.task.add_done_callback(lambda _: self._forget(key, call))
+        call.waiters += 1
+        try:
+            return await asyncio.wait_for(asyncio.shield(call.task), timeout)
+        except asyncio.TimeoutError:
+            if call.waiters == 1 and not call.task.done():
+                call.task.cancel()
+                # New callers shouldn't await the cancelled call.
+                self._forget(key, call)
+            raise
+        finally:
+            call.waiters -= 1
+
+    def _forget(self, key, call):
+        if self._calls.get(key) is call:
+            del self._calls[key]
+
+
+class _Call:
+    """
+    Running call of AsyncSingleFlight and number of callers which wait for it.
+    """
+
+    __slots__ = ("task", "waiters")
+
+    def __init__(self, task):
+        self.task = task
+        self.waiters = 0
@@ -0,0 +1,146 @@
+"""
+HTTP connection pool and settings, which can be shared between clients.
+Copyright (C) 2021 Vadim Vergasov
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+
+class Transport:
+    """
+    Pooled connections to codeforces.com with timeouts and proxies.
+
+    One transport can be passed to many CodeforcesApi, AsyncCodeforcesApi and
+    CodeforcesParser instances, so they share its connections. Clients which are
+    created without transport make their own one with default settings.
+    """
+
+    def __init__(
+        self,
+        pool_connections=10,
+        pool_maxsize=10,
+        pool_block=False,
+        keep_alive=True,
+        connect_timeout=10.0,
+        read_timeout=60.0,
+        proxies=None,
+    ):
+        """
+        pool_connections is the number of hosts which connections are kept and
+        pool_maxsize is the maximal number of kept connections to one host (and the
+        limit of connections of aiohttp session). With pool_block requests wait for
+        a free connection instead of opening a new one, which isn't kept.
+
+        keep_alive=False closes connections after each request.
+
+        connect_timeout and read_timeout are in seconds, read_timeout limits waiting
+        for every part of the response, not the whole response. None disables the
+        timeout.
+
+        proxies is a dict like {"https": "http://proxy:3128"}, aiohttp uses only the
+        "https" one.
+        """
+        self.pool_maxsize = pool_maxsize
+        self.keep_alive = keep_alive
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.proxies = dict(proxies or {})
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        if not keep_alive:
+            self.session.headers["Connection"] = "close"
+        self._async_session = None
+
+    def request_options(self, deadline=None):
+        """
+        Returns keyword arguments for requests.Session.request: timeout and proxies
+        (they are passed to each request, so environment doesn't override them).
+
+        Timeouts are shortened to the time left before deadline (a Deadline).
+        """
+        connect_timeout, read_timeout = self.connect_timeout, self.read_timeout
+        if deadline is not None:
+            connect_timeout = deadline.limit(connect_timeout)
+            read_timeout = deadline.limit(read_timeout)
+        options = {"timeout": (connect_timeout, read_timeout)}
+        if self.proxies:
+            options["proxies"] = self.proxies
+        return options
+
+    def async_request_options(self, deadline=None):
+        """
+        Returns keyword arguments for aiohttp.ClientSession.request.
+
+        With deadline (a Deadline) the whole request, including reading the body,
+        should finish in the time left before it.
+        """
+        if deadline is None:
+            timeout = aiohttp.ClientTimeout(
+                sock_connect=self.connect_timeout, sock_read=self.read_timeout
+            )
+        else:
+            timeout = aiohttp.ClientTimeout(
+                total=deadline.limit(None),
+                sock_connect=deadline.limit(self.connect_timeout),
+                sock_read=deadline.limit(self.read_timeout),
+            )
+        options = {"timeout": timeout}
+        if "https" in self.proxies:
+            options["proxy"] = self.proxies["https"]
+        return options
+
+    def async_session(self):
+        """
+        Returns aiohttp session, which is created on the first call, so it should be
+        called inside of the running event loop.
+        """
+        if aiohttp is None:
+            raise ImportError(
+                "aiohttp is required for asyncio, "
+                "install it with: pip install CodeforcesApiPy[async]"
+            )
+        if self._async_session is None or self._async_session.closed:
+            self._async_session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=self.pool_maxsize, force_close=not self.keep_alive
+                )
+            )
+        return self._async_session
+
+    def close(self):
+        """
+        Closes pooled connections of requests session.
+        """
+        self.session.close()
+
+    async def close_async(self):
+        """
+        Closes aiohttp session.
+        """
+        if self._async_session is not None:
+            await self._async_session.close()
+            self._async_session = None
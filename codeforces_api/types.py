@@ -16,7 +16,11 @@ along with this program.  If not, see <https://www.gnu.org/licenses/>.
 Source of inspiration: https://github.com/eternnoir/pyTelegramBotAPI/blob/master/telebot/types.py
 """
 
-import json
+import collections
+import functools
+
+from codeforces_api import json_backend
+from codeforces_api.schema import Field, generate, slots
 
 
 class Dictionaryable(object):
@@ -25,6 +29,8 @@ class Dictionaryable(object):
     All subclasses of this class must override to_dict.
     """
 
+    __slots__ = ()
+
     def to_dict(self):
         """
         Returns a DICT with class field values
@@ -38,8 +44,29 @@ class JSONDeserializable(object):
     """
     Subclasses of this class are guaranteed to be able to be created from a json-style dict or json formatted string.
     All subclasses of this class must override de_json.
+    Fields are stored in __slots__ instead of per-instance __dict__.
     """
 
+    __slots__ = ()
+
+    # Fields in order of constructor arguments, __init__, de_json and to_dict are
+    # generated from them if the class doesn't define its own.
+    _schema = ()
+
+    # Attributes which have different names in JSON, other attributes are named
+    # in camelCase there.
+    _renamed = {}
+
+    # Attributes which contain objects: name of the class and whether it's a list.
+    _nested = {}
+
+    # Attributes which aren't set when they are missing in JSON.
+    _unset_if_missing = ()
+
+    # Function which returns key of equal objects in JSON dict, they are shared when
+    # decoded with an interner.
+    _intern_key = None
+
     @classmethod
     def from_json(cls, json_string):
         """
@@ -53,836 +80,460 @@ class JSONDeserializable(object):
     def check_json(json_type):
         """
         Checks whether json_type is a dict or a string. If it is already a dict, it is returned as-is.
-        If it is not, it is converted to a dict by means of json.loads(json_type)
+        If it is not, it is converted to a dict by means of json_backend.loads(json_type)
         :param json_type:
         :return:
         """
         if isinstance(json_type, dict):
             return json_type
-        if isinstance(json_type, str):
-            return json.loads(json_type)
+        if isinstance(json_type, (str, bytes)):
+            return json_backend.loads(json_type)
         raise ValueError("json_type should be a json dict or string.")
 
     def __str__(self):
         d = {}
-        for x, y in self.__dict__.items():
-            if hasattr(y, "__dict__"):
-                d[x] = y.__dict__
+        for x, y in _fields(self).items():
+            if isinstance(y, JSONDeserializable):
+                d[x] = _fields(y)
             else:
                 d[x] = y
         return str(d)
 
 
-class User(JSONDeserializable, Dictionaryable):
-    @classmethod
-    def de_json(cls, json_string):
-        if json_string is None:
-            return None
-        obj = cls.check_json(json_string)
-        handle = obj["handle"]
-        email = obj.get("email")
-        vk_id = obj.get("vkId")
-        open_id = obj.get("openId")
-        first_name = obj.get("firstName")
-        last_name = obj.get("lastName")
-        country = obj.get("country")
-        city = obj.get("city")
-        organization = obj.get("organization")
-        contribution = obj["contribution"]
-        rank = obj.get("rank")
-        rating = obj.get("rating")
-        max_rank = obj.get("maxRank")
-        max_rating = obj.get("maxRating")
-        last_online = obj["lastOnlineTimeSeconds"]
-        registration_time_seconds = obj["registrationTimeSeconds"]
-        friend_of_count = obj["friendOfCount"]
-        avatar = obj["avatar"]
-        title_photo = obj["titlePhoto"]
-        return cls(
-            handle,
-            email,
-            contribution,
-            last_online,
-            registration_time_seconds,
-            friend_of_count,
-            avatar,
-            title_photo,
-            vk_id,
-            open_id,
-            first_name,
-            last_name,
-            country,
-            city,
-            organization,
-            rank,
-            rating,
-            max_rank,
-            max_rating,
-        )
+def _fields(obj):
+    """
+    Returns dict with values of all set slots of the object.
+    """
+    fields = {}
+    for cls in type(obj).__mro__:
+        for name in getattr(cls, "__slots__", ()):
+            if not name.startswith("_") and hasattr(obj, name):
+                fields[name] = getattr(obj, name)
+    return fields
 
-    def __init__(
-        self,
-        handle,
-        email,
-        contribution,
-        last_online,
-        registration_time_seconds,
-        friend_of_count,
-        avatar,
-        title_photo,
-        vk_id=None,
-        open_id=None,
-        first_name=None,
-        last_name=None,
-        country=None,
-        city=None,
-        organization=None,
-        rank=None,
-        rating=None,
-        max_rank=None,
-        max_rating=None,
-    ):
-        self.handle = handle
-        self.email = email
-        self.vk_id = vk_id
-        self.open_id = open_id
-        self.first_name = first_name
-        self.last_name = last_name
-        self.country = country
-        self.city = city
-        self.organization = organization
-        self.contribution = contribution
-        self.rank = rank
-        self.rating = rating
-        self.max_rank = max_rank
-        self.max_rating = max_rating
-        self.last_online = last_online
-        self.registration_time_seconds = registration_time_seconds
-        self.friend_of_count = friend_of_count
-        self.avatar = avatar
-        self.title_photo = title_photo
 
-    def to_dict(self):
-        return {
-            "handle": self.handle,
-            "email": self.email,
-            "vk_id": self.vk_id,
-            "open_id": self.open_id,
-            "first_name": self.first_name,
-            "last_name": self.last_name,
-            "country": self.country,
-            "city": self.city,
-            "organization": self.organization,
-            "contribution": self.contribution,
-            "rank": self.rank,
-            "rating": self.rating,
-            "max_rank": self.max_rank,
-            "max_rating": self.max_rating,
-            "last_online": self.last_online,
-            "registration_time_seconds": self.registration_time_seconds,
-            "friend_of_count": self.friend_of_count,
-            "avatar": self.avatar,
-            "title_photo": self.title_photo,
-        }
+class User(JSONDeserializable, Dictionaryable):
+    _schema = (
+        Field("handle"),
+        Field("email", optional=True),
+        Field("contribution"),
+        Field("last_online", key="lastOnlineTimeSeconds"),
+        Field("registration_time_seconds"),
+        Field("friend_of_count"),
+        Field("avatar"),
+        Field("title_photo"),
+        Field("vk_id", optional=True),
+        Field("open_id", optional=True),
+        Field("first_name", optional=True),
+        Field("last_name", optional=True),
+        Field("country", optional=True),
+        Field("city", optional=True),
+        Field("organization", optional=True),
+        Field("rank", optional=True),
+        Field("rating", optional=True),
+        Field("max_rank", optional=True),
+        Field("max_rating", optional=True),
+    )
+    __slots__ = slots(_schema)
 
 
 class BlogEntry(JSONDeserializable, Dictionaryable):
-    @classmethod
-    def de_json(cls, json_string):
-        if json_string is None:
-            return None
-        obj = cls.check_json(json_string)
-        identifier = obj["id"]
-        original_locale = obj["originalLocale"]
-        creation_time_seconds = obj["creationTimeSeconds"]
-        author_handle = obj["authorHandle"]
-        title = obj["title"]
-        locale = obj["locale"]
-        modification_time_seconds = obj["modificationTimeSeconds"]
-        allow_view_history = obj["allowViewHistory"]
-        tags = obj["tags"]
-        rating = obj["rating"]
-        content = obj.get("content")
-        return cls(
-            identifier,
-            original_locale,
-            creation_time_seconds,
-            author_handle,
-            title,
-            locale,
-            modification_time_seconds,
-            allow_view_history,
-            tags,
-            rating,
-            content,
-        )
-
-    def __init__(
-        self,
-        identifier,
-        original_locale,
-        creation_time_seconds,
-        author_handle,
-        title,
-        locale,
-        modification_time_seconds,
-        allow_view_history,
-        tags,
-        rating,
-        content=None,
-    ):
-        self.id = identifier
-        self.original_locale = original_locale
-        self.creation_time_seconds = creation_time_seconds
-        self.author_handle = author_handle
-        self.title = title
-        self.locale = locale
-        self.modification_time_seconds = modification_time_seconds
-        self.allow_view_history = allow_view_history
-        self.tags = tags
-        self.rating = rating
-        self.content = content
-
-    def to_dict(self):
-        return {
-            "id": self.id,
-            "original_locale": self.original_locale,
-            "creation_time_seconds": self.creation_time_seconds,
-            "author_handle": self.author_handle,
-            "title": self.title,
-            "locale": self.locale,
-            "modification_time_seconds": self.modification_time_seconds,
-            "allow_view_history": self.allow_view_history,
-            "tags": self.tags,
-            "rating": self.rating,
-            "content": self.content,
-        }
+    _schema = (
+        Field("id", argument="identifier"),
+        Field("original_locale"),
+        Field("creation_time_seconds"),
+        Field("author_handle"),
+        Field("title"),
+        Field("locale"),
+        Field("modification_time_seconds"),
+        Field("allow_view_history"),
+        Field("tags"),
+        Field("rating"),
+        Field("content", optional=True),
+    )
+    __slots__ = slots(_schema)
 
 
 class Comment(JSONDeserializable, Dictionaryable):
-    @classmethod
-    def de_json(cls, json_string):
-        if json_string is None:
-            return None
-        obj = cls.check_json(json_string)
-        identifier = obj["id"]
-        creation_time_seconds = obj["creationTimeSeconds"]
-        commentator_handle = obj["commentatorHandle"]
-        locale = obj["locale"]
-        text = obj["text"]
-        rating = obj["rating"]
-        parent_comment_id = obj.get("parentCommentId")
-        return cls(
-            identifier,
-            creation_time_seconds,
-            commentator_handle,
-            locale,
-            text,
-            rating,
-            parent_comment_id,
-        )
-
-    def __init__(
-        self,
-        identifier,
-        creation_time_seconds,
-        commentator_handle,
-        locale,
-        text,
-        rating,
-        parent_comment_id=None,
-    ):
-        self.id = identifier
-        self.creation_time_seconds = creation_time_seconds
-        self.commentator_handle = commentator_handle
-        self.locale = locale
-        self.text = text
-        self.rating = rating
-        self.parent_comment_id = parent_comment_id
-
-    def to_dict(self):
-        return {
-            "id": self.id,
-            "creation_time_seconds": self.creation_time_seconds,
-            "commentator_handle": self.commentator_handle,
-            "locale": self.locale,
-            "text": self.text,
-            "rating": self.rating,
-            "parent_comment_id": self.parent_comment_id,
-        }
+    _schema = (
+        Field("id", argument="identifier"),
+        Field("creation_time_seconds"),
+        Field("commentator_handle"),
+        Field("locale"),
+        Field("text"),
+        Field("rating"),
+        Field("parent_comment_id", optional=True),
+    )
+    __slots__ = slots(_schema)
 
 
 class RecentAction(JSONDeserializable, Dictionaryable):
-    @classmethod
-    def de_json(cls, json_string):
-        if json_string is None:
-            return None
-        obj = cls.check_json(json_string)
-        time_seconds = obj["timeSeconds"]
-        opts = dict()
-        if "blogEntry" in obj:
-            opts["blog_entry"] = BlogEntry.de_json(obj["blogEntry"])
-        if "comment" in obj:
-            opts["comment"] = Comment.de_json(obj["comment"])
-        return cls(time_seconds, opts)
+    _schema = (
+        Field("time_seconds"),
+        Field("blog_entry", unset=True, nested="BlogEntry"),
+        Field("comment", unset=True, nested="Comment"),
+    )
+    __slots__ = slots(_schema)
 
     def __init__(self, time_seconds, options):
         self.time_seconds = time_seconds
         for key in options:
             setattr(self, key, options[key])
 
-    def to_dict(self):
-        dictionary = {"time_seconds": self.time_seconds}
-        if "blog_entry" in self.__dict__.keys():
-            dictionary["blog_entry"] = self.blog_entry.to_dict()
-        if "comment" in self.__dict__.keys():
-            dictionary["comment"] = self.blog_entry.to_dict()
-        return dictionary
-
 
 class RatingChange(JSONDeserializable, Dictionaryable):
-    @classmethod
-    def de_json(cls, json_string):
-        if json_string is None:
-            return None
-        obj = cls.check_json(json_string)
-        contest_id = obj["contestId"]
-        contest_name = obj["contestName"]
-        handle = obj["handle"]
-        rank = obj["rank"]
-        rating_update_time_seconds = obj["ratingUpdateTimeSeconds"]
-        old_rating = obj["oldRating"]
-        new_rating = obj["newRating"]
-        return cls(
-            contest_id,
-            contest_name,
-            handle,
-            rank,
-            rating_update_time_seconds,
-            old_rating,
-            new_rating,
-        )
+    _schema = (
+        Field("contest_id"),
+        Field("contest_name"),
+        Field("handle"),
+        Field("rank"),
+        Field("rating_update_time_seconds"),
+        Field("old_rating"),
+        Field("new_rating"),
+    )
+    __slots__ = slots(_schema)
 
-    def __init__(
-        self,
-        contest_id,
-        contest_name,
-        handle,
-        rank,
-        rating_update_time_seconds,
-        old_rating,
-        new_rating,
-    ):
-        self.contest_id = contest_id
-        self.contest_name = contest_name
-        self.handle = handle
-        self.rank = rank
-        self.rating_update_time_seconds = rating_update_time_seconds
-        self.old_rating = old_rating
-        self.new_rating = new_rating
 
-    def to_dict(self):
-        return {
-            "contest_id": self.contest_id,
-            "contest_name": self.contest_name,
-            "handle": self.handle,
-            "rank": self.rank,
-            "rating_update_time_seconds": self.rating_update_time_seconds,
-            "old_rating": self.old_rating,
-            "new_rating": self.new_rating,
-        }
+class Contest(JSONDeserializable, Dictionaryable):
+    _schema = (
+        Field("id", argument="identifier"),
+        Field("name"),
+        Field("contest_type", key="type"),
+        Field("phase"),
+        Field("frozen"),
+        Field("duration_seconds", has_default=True),
+        Field("start_time_seconds", optional=True),
+        Field("relative_time_seconds", optional=True),
+        Field("prepared_by", optional=True),
+        Field("website_url", optional=True),
+        Field("description", optional=True),
+        Field("difficulty", optional=True),
+        Field("kind", optional=True),
+        Field("icpc_region", optional=True),
+        Field("country", optional=True),
+        Field("city", optional=True),
+        Field("season", optional=True),
+    )
+    __slots__ = slots(_schema)
 
 
-class Contest(JSONDeserializable, Dictionaryable):
-    @classmethod
-    def de_json(cls, json_string):
-        if json_string is None:
-            return None
-        obj = cls.check_json(json_string)
-        identifier = obj["id"]
-        name = obj["name"]
-        contest_type = obj["type"]
-        phase = obj["phase"]
-        frozen = obj["frozen"]
-        duration_seconds = obj["durationSeconds"]
-        start_time_seconds = obj.get("startTimeSeconds")
-        relative_time_seconds = obj.get("relativeTimeSeconds")
-        prepared_by = obj.get("preparedBy")
-        website_url = obj.get("websiteUrl")
-        description = obj.get("description")
-        difficulty = obj.get("difficulty")
-        kind = obj.get("kind")
-        icpc_region = obj.get("icpcRegion")
-        country = obj.get("country")
-        city = obj.get("city")
-        season = obj.get("season")
-        return cls(
-            identifier,
-            name,
-            contest_type,
-            phase,
-            frozen,
-            duration_seconds,
-            start_time_seconds,
-            relative_time_seconds,
-            prepared_by,
-            website_url,
-            description,
-            difficulty,
-            kind,
-            icpc_region,
-            country,
-            city,
-            season,
+class Party(JSONDeserializable, Dictionaryable):
+    _schema = (
+        Field("members", nested="Member", many=True),
+        Field("participant_type", intern=True),
+        Field("ghost"),
+        Field("team_id", optional=True),
+        Field("contest_id", optional=True),
+        Field("room", optional=True),
+        Field("start_time_seconds", optional=True),
+    )
+    __slots__ = slots(_schema)
+
+    @staticmethod
+    def _intern_key(obj):
+        return (
+            tuple(member["handle"] for member in obj["members"]),
+            obj["participantType"],
+            obj["ghost"],
+            obj.get("teamId"),
+            obj.get("contestId"),
+            obj.get("room"),
+            obj.get("startTimeSeconds"),
         )
 
-    def __init__(
-        self,
-        identifier,
-        name,
-        contest_type,
-        phase,
-        frozen,
-        duration_seconds=None,
-        start_time_seconds=None,
-        relative_time_seconds=None,
-        prepared_by=None,
-        website_url=None,
-        description=None,
-        difficulty=None,
-        kind=None,
-        icpc_region=None,
-        country=None,
-        city=None,
-        season=None,
-    ):
-        self.id = identifier
-        self.name = name
-        self.contest_type = contest_type
-        self.phase = phase
-        self.frozen = frozen
-        self.duration_seconds = duration_seconds
-        self.start_time_seconds = start_time_seconds
-        self.relative_time_seconds = relative_time_seconds
-        self.prepared_by = prepared_by
-        self.website_url = website_url
-        self.description = description
-        self.difficulty = difficulty
-        self.kind = kind
-        self.icpc_region = icpc_region
-        self.country = country
-        self.city = city
-        self.season = season
 
-    def to_dict(self):
-        return {
-            "id": self.id,
-            "name": self.name,
-            "contest_type": self.contest_type,
-            "phase": self.phase,
-            "frozen": self.frozen,
-            "duration_seconds": self.duration_seconds,
-            "start_time_seconds": self.start_time_seconds,
-            "relative_time_seconds": self.relative_time_seconds,
-            "prepared_by": self.prepared_by,
-            "website_url": self.website_url,
-            "description": self.description,
-            "difficulty": self.difficulty,
-            "kind": self.kind,
-            "icpc_region": self.icpc_region,
-            "country": self.country,
-            "city": self.city,
-            "season": self.season,
-        }
+class Member(JSONDeserializable, Dictionaryable):
+    _schema = (Field("handle"),)
+    __slots__ = slots(_schema)
 
+    @staticmethod
+    def _intern_key(obj):
+        return obj["handle"]
 
-class Party(JSONDeserializable, Dictionaryable):
-    @classmethod
-    def de_json(cls, json_string):
-        if json_string is None:
-            return None
-        obj = cls.check_json(json_string)
-        members = list()
-        for member in obj["members"]:
-            members.append(Member.de_json(member))
-        participant_type = obj["participantType"]
-        ghost = obj["ghost"]
-        team_id = obj.get("teamId")
-        contest_id = obj.get("contestId")
-        room = obj.get("room")
-        start_time_seconds = obj.get("startTimeSeconds")
-        return cls(
-            members,
-            participant_type,
-            ghost,
-            team_id,
-            contest_id,
-            room,
-            start_time_seconds,
-        )
 
-    def __init__(
-        self,
-        members,
-        participant_type,
-        ghost,
-        team_id=None,
-        contest_id=None,
-        room=None,
-        start_time_seconds=None,
-    ):
-        self.members = members
-        self.participant_type = participant_type
-        self.ghost = ghost
-        self.team_id = team_id
-        self.contest_id = contest_id
-        self.room = room
-        self.start_time_seconds = start_time_seconds
+class Problem(JSONDeserializable, Dictionaryable):
+    _schema = (
+        Field("index"),
+        Field("name"),
+        Field("problem_type", key="type"),
+        Field("contest_id", optional=True),
+        Field("problemset_name", optional=True),
+        Field("points", optional=True),
+        Field("rating", optional=True),
+        Field("tags", optional=True, intern=True),
+    )
+    __slots__ = slots(_schema)
 
-    def to_dict(self):
-        return {
-            "members": [member.to_dict() for member in self.members],
-            "participant_type": self.participant_type,
-            "ghost": self.ghost,
-            "team_id": self.team_id,
-            "contest_id": self.contest_id,
-            "room": self.room,
-            "start_time_seconds": self.start_time_seconds,
-        }
+    @staticmethod
+    def _intern_key(obj):
+        return (obj.get("contestId"), obj.get("problemsetName"), obj["index"])
 
 
-class Member(JSONDeserializable, Dictionaryable):
-    @classmethod
-    def de_json(cls, json_string):
-        if json_string is None:
-            return None
-        obj = cls.check_json(json_string)
-        handle = obj["handle"]
-        return cls(handle)
+class ProblemStatistic(JSONDeserializable, Dictionaryable):
+    _schema = (
+        Field("index"),
+        Field("solved_count"),
+        Field("contest_id", optional=True),
+    )
+    __slots__ = slots(_schema)
 
-    def __init__(self, handle):
-        self.handle = handle
 
-    def to_dict(self):
-        return {"handle": self.handle}
+class Submission(JSONDeserializable, Dictionaryable):
+    _schema = (
+        Field("id", argument="identifier"),
+        Field("creation_time_seconds"),
+        Field("relative_time_seconds"),
+        Field("problem", nested="Problem"),
+        Field("author", nested="Party"),
+        Field("programming_language", intern=True),
+        Field("testset", intern=True),
+        Field("passed_test_count"),
+        Field("time_consumed_millis"),
+        Field("memory_consumed_bytes"),
+        Field("contest_id", optional=True),
+        Field("verdict", optional=True, intern=True),
+        Field("points", optional=True),
+    )
+    __slots__ = slots(_schema)
 
 
-class Problem(JSONDeserializable, Dictionaryable):
-    @classmethod
-    def de_json(cls, json_string):
-        if json_string is None:
-            return None
-        obj = cls.check_json(json_string)
-        index = obj["index"]
-        name = obj["name"]
-        problem_type = obj["type"]
-        contest_id = obj.get("contestId")
-        problemset_name = obj.get("problemsetName")
-        points = obj.get("points")
-        rating = obj.get("rating")
-        tags = obj.get("tags")
-        return cls(
-            index, name, problem_type, contest_id, problemset_name, points, rating, tags
-        )
+class Hack(JSONDeserializable, Dictionaryable):
+    _schema = (
+        Field("id", argument="identifier"),
+        Field("creation_time_seconds"),
+        Field("hacker", nested="Party"),
+        Field("defender", nested="Party"),
+        Field("problem", nested="Problem"),
+        Field("verdict", optional=True, intern=True),
+        Field("test", optional=True),
+        Field("judge_protocol", optional=True),
+    )
+    __slots__ = slots(_schema)
 
-    def __init__(
-        self,
-        index,
-        name,
-        problem_type,
-        contest_id=None,
-        problemset_name=None,
-        points=None,
-        rating=None,
-        tags=None,
-    ):
-        self.index = index
-        self.name = name
-        self.problem_type = problem_type
-        self.contest_id = contest_id
-        self.problemset_name = problemset_name
-        self.points = points
-        self.rating = rating
-        self.tags = tags
 
-    def to_dict(self):
-        return {
-            "index": self.index,
-            "name": self.name,
-            "problem_type": self.problem_type,
-            "contest_id": self.contest_id,
-            "problemset_name": self.problemset_name,
-            "points": self.points,
-            "rating": self.rating,
-            "tags": self.tags,
-        }
+class RanklistRow(JSONDeserializable, Dictionaryable):
+    _schema = (
+        Field("party", nested="Party"),
+        Field("rank"),
+        Field("points"),
+        Field("penalty"),
+        Field("successful_hack_count"),
+        Field("unsuccessful_hack_count"),
+        Field("problem_results", nested="ProblemResult", many=True),
+        Field("last_submission_time_seconds", optional=True),
+    )
+    __slots__ = slots(_schema)
 
 
-class ProblemStatistic(JSONDeserializable, Dictionaryable):
-    @classmethod
-    def de_json(cls, json_string):
-        if json_string is None:
-            return None
-        obj = cls.check_json(json_string)
-        index = obj["index"]
-        solved_count = obj["solvedCount"]
-        contest_id = obj.get("contestId")
-        return cls(index, solved_count, contest_id)
-
-    def __init__(self, index, solved_count, contest_id=None):
-        self.index = index
-        self.solved_count = solved_count
-        self.contest_id = contest_id
+class ProblemResult(JSONDeserializable, Dictionaryable):
+    _schema = (
+        Field("points"),
+        Field("rejected_attempt_count"),
+        Field("problem_type", key="type"),
+        Field("best_submission_time_seconds", optional=True),
+        Field("penalty", optional=True),
+    )
+    __slots__ = slots(_schema)
+
+
+for _cls in (
+    User,
+    BlogEntry,
+    Comment,
+    RecentAction,
+    RatingChange,
+    Contest,
+    Party,
+    Member,
+    Problem,
+    ProblemStatistic,
+    Submission,
+    Hack,
+    RanklistRow,
+    ProblemResult,
+):
+    generate(_cls, globals())
+del _cls
+
+
+class _Interner:
+    """
+    Keeps canonical instances of objects and strings which repeat in one response:
+    Problem per contest and index, Member per handle, equal Party and values of
+    fields like verdict or programming_language.
+    """
 
-    def to_dict(self):
-        return {
-            "index": self.index,
-            "solved_count": self.solved_count,
-            "contest_id": self.contest_id,
-        }
+    __slots__ = ("objects", "strings")
 
+    def __init__(self):
+        self.objects = {}
+        self.strings = {}
 
-class Submission(JSONDeserializable, Dictionaryable):
-    @classmethod
-    def de_json(cls, json_string):
-        if json_string is None:
+    def value(self, value):
+        """
+        Returns canonical string equal to value, strings in lists are replaced.
+        """
+        if value is None:
             return None
-        obj = cls.check_json(json_string)
-        identifier = obj["id"]
-        creation_time_seconds = obj["creationTimeSeconds"]
-        relative_time_seconds = obj["relativeTimeSeconds"]
-        problem = Problem.de_json(obj["problem"])
-        author = Party.de_json(obj["author"])
-        programming_language = obj["programmingLanguage"]
-        testset = obj["testset"]
-        passed_test_count = obj["passedTestCount"]
-        time_consumed_millis = obj["timeConsumedMillis"]
-        memory_consumed_bytes = obj["memoryConsumedBytes"]
-        contest_id = obj.get("contestId")
-        verdict = obj.get("verdict")
-        points = obj.get("points")
-        return cls(
-            identifier,
-            creation_time_seconds,
-            relative_time_seconds,
-            problem,
-            author,
-            programming_language,
-            testset,
-            passed_test_count,
-            time_consumed_millis,
-            memory_consumed_bytes,
-            contest_id,
-            verdict,
-            points,
-        )
+        if isinstance(value, list):
+            return [self.strings.setdefault(item, item) for item in value]
+        return self.strings.setdefault(value, value)
 
-    def __init__(
-        self,
-        identifier,
-        creation_time_seconds,
-        relative_time_seconds,
-        problem,
-        author,
-        programming_language,
-        testset,
-        passed_test_count,
-        time_consumed_millis,
-        memory_consumed_bytes,
-        contest_id=None,
-        verdict=None,
-        points=None,
-    ):
-        self.id = identifier
-        self.creation_time_seconds = creation_time_seconds
-        self.relative_time_seconds = relative_time_seconds
-        self.problem = problem
-        self.author = author
-        self.programming_language = programming_language
-        self.testset = testset
-        self.passed_test_count = passed_test_count
-        self.time_consumed_millis = time_consumed_millis
-        self.memory_consumed_bytes = memory_consumed_bytes
-        self.contest_id = contest_id
-        self.verdict = verdict
-        self.points = points
 
-    def to_dict(self):
-        return {
-            "id": self.id,
-            "creation_time_seconds": self.creation_time_seconds,
-            "relative_time_seconds": self.relative_time_seconds,
-            "problem": self.problem.to_dict(),
-            "author": self.author.to_dict(),
-            "programming_language": self.programming_language,
-            "testset": self.testset,
-            "passed_test_count": self.passed_test_count,
-            "time_consumed_millis": self.time_consumed_millis,
-            "memory_consumed_bytes": self.memory_consumed_bytes,
-            "contest_id": self.contest_id,
-            "verdict": self.verdict,
-            "points": self.points,
-        }
+class _LazyField:
+    """
+    Attribute of lazy object which is read from JSON dict on every access.
+    """
 
+    __slots__ = ("key",)
 
-class Hack(JSONDeserializable, Dictionaryable):
-    @classmethod
-    def de_json(cls, json_string):
-        if json_string is None:
-            return None
-        obj = cls.check_json(json_string)
-        identifier = obj["id"]
-        creation_time_seconds = obj["creationTimeSeconds"]
-        hacker = Party.de_json(obj["hacker"])
-        defender = Party.de_json(obj["defender"])
-        problem = Problem.de_json(obj["problem"])
-        verdict = obj.get("verdict")
-        test = obj.get("test")
-        judge_protocol = obj.get("judgeProtocol")
-        return cls(
-            identifier,
-            creation_time_seconds,
-            hacker,
-            defender,
-            problem,
-            verdict,
-            test,
-            judge_protocol,
-        )
+    def __init__(self, key):
+        self.key = key
 
-    def __init__(
-        self,
-        identifier,
-        creation_time_seconds,
-        hacker,
-        defender,
-        problem,
-        verdict=None,
-        test=None,
-        judge_protocol=None,
-    ):
-        self.id = identifier
-        self.creation_time_seconds = creation_time_seconds
-        self.hacker = hacker
-        self.defender = defender
-        self.problem = problem
-        self.verdict = verdict
-        self.test = test
-        self.judge_protocol = judge_protocol
+    def __get__(self, obj, owner=None):
+        if obj is None:
+            return self
+        return obj._json.get(self.key)
 
-    def to_dict(self):
-        return {
-            "id": self.id,
-            "creation_time_seconds": self.creation_time_seconds,
-            "hacker": self.hacker.to_dict(),
-            "defender": self.defender.to_dict(),
-            "problem": self.problem.to_dict(),
-            "verdict": self.verdict,
-            "test": self.test,
-            "judge_protocol": self.judge_protocol,
-        }
+    def __set__(self, obj, value):
+        # JSON dict may be shared with cache, so it's copied instead of changed.
+        json_dict = dict(obj._json)
+        json_dict[self.key] = value
+        obj._json = json_dict
 
 
-class RanklistRow(JSONDeserializable, Dictionaryable):
-    @classmethod
-    def de_json(cls, json_string):
+class _LazyObjectField:
+    """
+    Attribute of lazy object which contains objects, they are decoded on the first
+    access and kept in the slot of the attribute.
+    """
+
+    __slots__ = ("name", "slot", "key", "decode", "unset_if_missing")
+
+    def __init__(self, name, slot, key, decode, unset_if_missing):
+        self.name = name
+        self.slot = slot
+        self.key = key
+        self.decode = decode
+        self.unset_if_missing = unset_if_missing
+
+    def __get__(self, obj, owner=None):
+        if obj is None:
+            return self
+        try:
+            return self.slot.__get__(obj, owner)
+        except AttributeError:
+            pass
+        json_dict = obj._json
+        if self.key in json_dict:
+            value = self.decode(json_dict[self.key])
+        elif self.unset_if_missing:
+            raise AttributeError(self.name)
+        else:
+            value = None
+        self.slot.__set__(obj, value)
+        return value
+
+    def __set__(self, obj, value):
+        self.slot.__set__(obj, value)
+
+    def __delete__(self, obj):
+        self.slot.__delete__(obj)
+
+
+def _json_key(cls, name):
+    if name in cls._renamed:
+        return cls._renamed[name]
+    first, *rest = name.split("_")
+    return first + "".join(part.capitalize() for part in rest)
+
+
+def _lazy_decoder(class_name, many):
+    de_json = _lazy_type(globals()[class_name]).de_json
+    if many:
+        return lambda objs: [de_json(obj) for obj in objs]
+    return de_json
+
+
+def _load_lazy(cls, json_dict):
+    return _lazy_type(cls).de_json(json_dict)
+
+
+@functools.lru_cache(maxsize=None)
+def _lazy_type(cls):
+    """
+    Returns subclass of cls which keeps JSON dict and reads attributes from it when
+    they are accessed, nested objects are decoded (lazily too) on the first access.
+    """
+    namespace = {
+        "__slots__": ("_json",),
+        "__doc__": "Lazy %s, attributes are decoded on access." % cls.__name__,
+        "__reduce__": lambda self: (_load_lazy, (cls, self._json)),
+        "_base": cls,
+    }
+    for name in cls.__slots__:
+        if name in cls._nested:
+            namespace[name] = _LazyObjectField(
+                name,
+                cls.__dict__[name],
+                _json_key(cls, name),
+                _lazy_decoder(*cls._nested[name]),
+                name in cls._unset_if_missing,
+            )
+        else:
+            namespace[name] = _LazyField(_json_key(cls, name))
+    lazy_cls = type("Lazy" + cls.__name__, (cls,), namespace)
+    new = object.__new__
+    set_json = lazy_cls.__dict__["_json"].__set__
+    check_json = cls.check_json
+
+    def de_json(json_string):
         if json_string is None:
             return None
-        obj = cls.check_json(json_string)
-        party = Party.de_json(obj["party"])
-        rank = obj["rank"]
-        points = obj["points"]
-        penalty = obj["penalty"]
-        successful_hack_count = obj["successfulHackCount"]
-        unsuccessful_hack_count = obj["unsuccessfulHackCount"]
-        problem_results = list()
-        for problem_result in obj["problemResults"]:
-            problem_results.append(ProblemResult.de_json(problem_result))
-        last_submission_time_seconds = obj.get("lastSubmissionTimeSeconds")
-        return cls(
-            party,
-            rank,
-            points,
-            penalty,
-            successful_hack_count,
-            unsuccessful_hack_count,
-            problem_results,
-            last_submission_time_seconds,
-        )
-
-    def __init__(
-        self,
-        party,
-        rank,
-        points,
-        penalty,
-        successful_hack_count,
-        unsuccessful_hack_count,
-        problem_results,
-        last_submission_time_seconds=None,
-    ):
-        self.party = party
-        self.rank = rank
-        self.points = points
-        self.penalty = penalty
-        self.successful_hack_count = successful_hack_count
-        self.unsuccessful_hack_count = unsuccessful_hack_count
-        self.problem_results = problem_results
-        self.last_submission_time_seconds = last_submission_time_seconds
+        if type(json_string) is not dict:
+            json_string = check_json(json_string)
+        obj = new(lazy_cls)
+        set_json(obj, json_string)
+        return obj
 
-    def to_dict(self):
-        return {
-            "party": self.party.to_dict(),
-            "rank": self.rank,
-            "points": self.points,
-            "penalty": self.penalty,
-            "successful_hack_count": self.successful_hack_count,
-            "unsuccessful_hack_count": self.unsuccessful_hack_count,
-            "problem_results": [
-                problem_result.to_dict() for problem_result in self.problem_results
-            ],
-            "last_submission_time_seconds": self.last_submission_time_seconds,
-        }
+    lazy_cls.de_json = staticmethod(de_json)
+    return lazy_cls
 
 
-class ProblemResult(JSONDeserializable, Dictionaryable):
-    @classmethod
-    def de_json(cls, json_string):
-        if json_string is None:
-            return None
-        obj = cls.check_json(json_string)
-        points = obj["points"]
-        rejected_attempt_count = obj["rejectedAttemptCount"]
-        problem_type = obj["type"]
-        best_submission_time_seconds = obj.get("bestSubmissionTimeSeconds")
-        penalty = obj.get("penalty")
-        return cls(
-            points,
-            rejected_attempt_count,
-            problem_type,
-            best_submission_time_seconds,
-            penalty,
-        )
+def _field_getter(cls, path):
+    """
+    Returns function which gets attribute of cls with given path (names separated by
+    dots) from JSON dict, list is returned for attributes of lists of objects.
+    """
+    name, _, rest = path.partition(".")
+    if name not in cls.__slots__:
+        raise ValueError("%s has no attribute %s" % (cls.__name__, name))
+    key = _json_key(cls, name)
+    if name not in cls._nested:
+        if rest:
+            raise ValueError("%s.%s isn't an object" % (cls.__name__, name))
+        return lambda json_dict: json_dict.get(key)
+    nested_cls = globals()[cls._nested[name][0]]
+    many = cls._nested[name][1]
+    get = nested_cls.de_json if not rest else _field_getter(nested_cls, rest)
+    if many:
+        return lambda json_dict: [get(obj) for obj in json_dict.get(key, ())]
+    return lambda json_dict: None if key not in json_dict else get(json_dict[key])
+
+
+@functools.lru_cache(maxsize=None)
+def _projection(cls, fields):
+    """
+    Returns function which makes named tuple with given attributes of cls from JSON
+    dict, dots in names of nested attributes are replaced with underscores.
+    """
+    getters = tuple(_field_getter(cls, field) for field in fields)
+    row = collections.namedtuple(
+        cls.__name__, [field.replace(".", "_") for field in fields]
+    )
+    make = row._make
 
-    def __init__(
-        self,
-        points,
-        rejected_attempt_count,
-        problem_type,
-        best_submission_time_seconds=None,
-        penalty=None,
-    ):
-        self.points = points
-        self.penalty = penalty
-        self.rejected_attempt_count = rejected_attempt_count
-        self.problem_type = problem_type
-        self.best_submission_time_seconds = best_submission_time_seconds
+    def project(json_dict):
+        return make([get(json_dict) for get in getters])
 
-    def to_dict(self):
-        return {
-            "points": self.points,
-            "penalty": self.penalty,
-            "rejected_attempt_count": self.rejected_attempt_count,
-            "problem_type": self.problem_type,
-            "best_submission_time_seconds": self.best_submission_time_seconds,
-        }
+    return project
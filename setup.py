@@ -30,5 +30,11 @@ setup(
     ],
     keywords="codeforces api python",
     install_requires=["requests", "lxml"],
+    extras_require={
+        "async": ["aiohttp"],
+        "json": ["orjson"],
+        "numpy": ["numpy"],
+        "pandas": ["pandas"],
+    },
     python_requires=">=3.8",
 )
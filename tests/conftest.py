@@ -2,8 +2,13 @@
 Config file for tests
 """
 
+import asyncio
+import json
+
 import pytest
 
+from codeforces_api import AsyncCodeforcesApi, CodeforcesApi
+
 
 def pytest_addoption(parser):
     parser.addoption(
@@ -64,3 +69,274 @@ def check_user():
         assert isinstance(user.title_photo, str)
 
     return check
+
+
+class FakeResponse:
+    def __init__(self, status_code=200, body=None, headers=None):
+        self.status_code = status_code
+        if not isinstance(body, bytes):
+            body = json.dumps(body).encode("utf-8")
+        self.content = body
+        self.headers = headers or {}
+
+    def iter_content(self, chunk_size=1):
+        for start in range(0, len(self.content), chunk_size):
+            yield self.content[start : start + chunk_size]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        pass
+
+
+class FakeSession:
+    """
+    Session which returns prepared responses instead of making requests.
+
+    responses is a list of FakeResponse or a function, which gets method name and data.
+    """
+
+    def __init__(self, responses):
+        self.responses = responses
+        self.calls = []
+
+    def request(self, http_method, url, data=None, **kwargs):
+        method = url.rsplit("/", 1)[1]
+        self.calls.append((method, data))
+        if callable(self.responses):
+            return self.responses(method, data)
+        return self.responses.pop(0)
+
+
+class RecordingSession(FakeSession):
+    """
+    FakeSession which keeps keyword arguments of the last request as options.
+    """
+
+    def request(self, http_method, url, data=None, **kwargs):
+        self.options = kwargs
+        return super().request(http_method, url, data, **kwargs)
+
+
+@pytest.fixture
+def fake_api():
+    def make(responses, **kwargs):
+        api = CodeforcesApi(**kwargs)
+        api.session = FakeSession(responses)
+        return api
+
+    return make
+
+
+class FakeAsyncResponse:
+    """
+    aiohttp response with body of FakeResponse, it's also its own content stream.
+    """
+
+    def __init__(self, response):
+        self.status = response.status_code
+        self.headers = response.headers
+        self.content = self
+        self.body = response.content
+
+    async def iter_chunked(self, chunk_size):
+        for start in range(0, len(self.body), chunk_size):
+            yield self.body[start : start + chunk_size]
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        pass
+
+
+class FakeAsyncRequest:
+    """
+    Result of aiohttp session.request, which is awaited or used with async with.
+    """
+
+    def __init__(self, coroutine):
+        self.coroutine = coroutine
+
+    def __await__(self):
+        return self.coroutine.__await__()
+
+    async def __aenter__(self):
+        return await self.coroutine
+
+    async def __aexit__(self, *args):
+        pass
+
+
+class FakeAsyncSession(FakeSession):
+    """
+    aiohttp session which returns prepared responses after delay seconds.
+
+    delay is a number or a function, which gets method name and data. Total timeout
+    of the request is respected like aiohttp does.
+    """
+
+    closed = False
+
+    def __init__(self, responses, delay=0):
+        super().__init__(responses)
+        self.delay = delay
+
+    def request(self, http_method, url, data=None, timeout=None, **kwargs):
+        return FakeAsyncRequest(self.respond(http_method, url, dict(data), timeout))
+
+    async def respond(self, http_method, url, data, timeout):
+        delay = self.delay
+        if callable(delay):
+            delay = delay(url.rsplit("/", 1)[1], data)
+        total = getattr(timeout, "total", None)
+        if total is not None and delay > total:
+            await asyncio.sleep(total)
+            raise asyncio.TimeoutError()
+        await asyncio.sleep(delay)
+        return FakeAsyncResponse(super().request(http_method, url, data))
+
+
+@pytest.fixture
+def fake_async_api():
+    """
+    Makes AsyncCodeforcesApi with FakeAsyncSession, it should be called inside of
+    the running event loop.
+    """
+
+    def make(responses, delay=0, **kwargs):
+        api = AsyncCodeforcesApi(**kwargs)
+        api.session = FakeAsyncSession(responses, delay)
+        api._semaphore = asyncio.Semaphore(api.max_concurrency)
+        return api
+
+    return make
+
+
+def ok(result):
+    return FakeResponse(body={"status": "OK", "result": result})
+
+
+def user(handle):
+    return {
+        "handle": handle,
+        "contribution": 0,
+        "lastOnlineTimeSeconds": 1,
+        "registrationTimeSeconds": 1,
+        "friendOfCount": 0,
+        "avatar": "",
+        "titlePhoto": "",
+    }
+
+
+def submission(identifier):
+    return {
+        "id": identifier,
+        "creationTimeSeconds": 0,
+        "relativeTimeSeconds": 0,
+        "problem": {"index": "A", "name": "", "type": "PROGRAMMING"},
+        "author": {"members": [], "participantType": "PRACTICE", "ghost": False},
+        "programmingLanguage": "",
+        "testset": "TESTS",
+        "passedTestCount": 0,
+        "timeConsumedMillis": 0,
+        "memoryConsumedBytes": 0,
+    }
+
+
+@pytest.fixture
+def call_limit():
+    return FakeResponse(
+        503,
+        {"status": "FAILED", "comment": "Call limit exceeded"},
+        {"Retry-After": "0"},
+    )
+
+
+@pytest.fixture
+def respond():
+    """
+    Responds to user.info, users with handles starting with "missing" don't exist.
+    """
+
+    def respond(method, data):
+        handles = [handle for handle in data["handles"].split(";") if handle]
+        for handle in handles:
+            if handle.startswith("missing"):
+                return FakeResponse(
+                    400,
+                    {
+                        "status": "FAILED",
+                        "comment": "handles: User with handle %s not found" % handle,
+                    },
+                )
+        return ok([user(handle) for handle in handles])
+
+    return respond
+
+
+@pytest.fixture
+def standings(respond):
+    """
+    Responds to contest.standings with a row for each handle (or one row without
+    handles), missing handles are reported like user.info does.
+    """
+
+    def standings(method, data):
+        handles = [handle for handle in data.get("handles", "x").split(";") if handle]
+        if any(handle.startswith("missing") for handle in handles):
+            return respond(method, data)
+        rows = [
+            {
+                "party": {
+                    "members": [{"handle": handle}],
+                    "participantType": "CONTESTANT",
+                    "ghost": False,
+                },
+                "rank": 1,
+                "points": 0.0,
+                "penalty": 0,
+                "successfulHackCount": 0,
+                "unsuccessfulHackCount": 0,
+                "problemResults": [],
+            }
+            for handle in handles
+        ]
+        contest = {"id": 1, "name": "", "type": "CF", "phase": "FINISHED"}
+        contest.update(frozen=False, durationSeconds=7200)
+        return ok({"contest": contest, "problems": [], "rows": rows})
+
+    return standings
+
+
+@pytest.fixture
+def pages():
+    """
+    Makes responder which returns requested page of submissions.
+    """
+
+    def make(submissions):
+        def respond(method, data):
+            start = int(data["from"]) - 1
+            return ok(submissions[start : start + int(data["count"])])
+
+        return respond
+
+    return make
+
+
+@pytest.fixture
+def submissions():
+    """
+    Submissions with different verdicts, problems and points.
+    """
+    return [
+        dict(submission(1), verdict="OK"),
+        dict(
+            submission(2),
+            verdict="WRONG_ANSWER",
+            problem={"index": "B", "name": "", "type": "PROGRAMMING"},
+        ),
+        dict(submission(3), points=10.5),
+    ]
@@ -0,0 +1,42 @@
+"""
+Testing requests to api with asyncio.
+"""
+
+import asyncio
+
+import pytest
+
+from codeforces_api import AsyncCodeforcesApi
+
+pytest.importorskip("aiohttp")
+
+
+def run(coroutine_function):
+    async def wrapper():
+        async with AsyncCodeforcesApi() as api:
+            return await coroutine_function(api)
+
+    return asyncio.run(wrapper())
+
+
+def test_blog_entry_view():
+    blog_entry = run(lambda api: api.blog_entry_view(74291))
+    assert blog_entry.author_handle == "VadVergasov"
+    assert blog_entry.id == 74291
+
+
+def test_user_info(check_user):
+    users = run(lambda api: api.user_info(["VadVergasov"]))
+    assert users[0].handle == "VadVergasov"
+    check_user(users[0])
+
+
+def test_concurrent_requests():
+    async def requests(api):
+        return await asyncio.gather(
+            api.user_rating("VadVergasov"), api.user_info(["tourist"])
+        )
+
+    rating_changes, users = run(requests)
+    assert rating_changes[0].handle == "VadVergasov"
+    assert users[0].handle == "tourist"
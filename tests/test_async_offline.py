@@ -0,0 +1,224 @@
+"""
+Testing AsyncCodeforcesApi with fake aiohttp session.
+"""
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from codeforces_api import (
+    AsyncUserInfoBatcher,
+    CodeforcesTimeoutError,
+    HandleNotFoundError,
+    RetryPolicy,
+)
+from conftest import FakeResponse, ok, submission
+
+pytest.importorskip("aiohttp")
+
+
+def test_retries(fake_async_api, call_limit):
+    async def main():
+        api = fake_async_api(
+            [FakeResponse(502, b"<html>"), call_limit, ok([])],
+            retry_policy=RetryPolicy(backoff_base=0),
+        )
+        assert await api.contest_list() == []
+        assert len(api.session.calls) == 3
+
+    asyncio.run(main())
+
+
+def test_user_info_chunks(fake_async_api, respond):
+    async def main():
+        api = fake_async_api(respond, handles_chunk_size=3)
+        handles = ["user%d" % i for i in range(10)]
+        users = await api.user_info(handles)
+        assert [user.handle for user in users] == handles
+        assert len(api.session.calls) == 4
+        users = await api.user_info(["a", "missing1", "b"], skip_missing=True)
+        assert [user.handle for user in users] == ["a", "b"]
+        with pytest.raises(HandleNotFoundError):
+            await api.user_info(["a", "missing1"])
+
+    asyncio.run(main())
+
+
+@pytest.mark.parametrize("status", [200, 413])
+def test_rejected_chunk_is_bisected(fake_async_api, status, respond):
+    def reject(method, data):
+        if data["handles"].count(";") > 2:
+            return FakeResponse(status, b"<html>Request is too large</html>")
+        return respond(method, data)
+
+    async def main():
+        api = fake_async_api(reject)
+        handles = ["user%d" % i for i in range(7)]
+        users = await api.user_info(handles)
+        assert [user.handle for user in users] == handles
+
+    asyncio.run(main())
+
+
+def test_standings_with_missing_handles(fake_async_api, standings):
+    async def main():
+        api = fake_async_api(standings, handles_chunk_size=2)
+        result = await api.contest_standings(
+            1, handles=["a", "missing1", "b"], skip_missing=True
+        )
+        assert [row.party.members[0].handle for row in result["rows"]] == ["a", "b"]
+
+    asyncio.run(main())
+
+
+def test_iter_user_status(fake_async_api, pages):
+    submissions = [submission(identifier) for identifier in range(25, 0, -1)]
+
+    async def main():
+        for prefetch in (True, False):
+            api = fake_async_api(pages(submissions))
+            iterator = api.iter_user_status("a", page_size=10, prefetch=prefetch)
+            identifiers = [obj.id async for obj in iterator]
+            assert identifiers == list(range(25, 0, -1))
+            assert len(api.session.calls) == 3
+
+    asyncio.run(main())
+
+
+def test_stream_user_status(fake_async_api):
+    submissions = [submission(identifier) for identifier in range(3)]
+
+    async def main():
+        api = fake_async_api([ok(submissions)])
+        stream = api.stream_user_status("a", raw=True)
+        assert [obj async for obj in stream] == submissions
+
+    asyncio.run(main())
+
+
+def test_single_flight(fake_async_api):
+    async def main():
+        api = fake_async_api([ok([])], delay=0.1, single_flight=True)
+        results = await asyncio.gather(*[api.contest_hacks(1) for _ in range(5)])
+        assert len(api.session.calls) == 1
+        assert all(result is results[0] for result in results)
+
+    asyncio.run(main())
+
+
+def test_single_flight_leader_timeout(fake_async_api):
+    async def main():
+        api = fake_async_api([ok([])], delay=10, single_flight=True)
+        with pytest.raises(CodeforcesTimeoutError) as error:
+            await api.contest_hacks(1, timeout=0.05)
+        assert str(error.value) == "Deadline of the call is exceeded."
+        assert not api.single_flight._calls
+
+    asyncio.run(main())
+
+
+def test_batcher(fake_async_api, respond):
+    async def main():
+        api = fake_async_api(respond)
+        batcher = AsyncUserInfoBatcher(api, delay=0.01)
+        first, second, missing = await asyncio.gather(
+            batcher.load("a"),
+            batcher.load("b"),
+            batcher.load("missing1"),
+            return_exceptions=True,
+        )
+        assert (first.handle, second.handle) == ("a", "b")
+        assert isinstance(missing, HandleNotFoundError)
+        assert len(api.session.calls) == 2
+        await batcher.close()
+        with pytest.raises(RuntimeError):
+            await batcher.load("c")
+
+    asyncio.run(main())
+
+
+def test_semaphore_deadline(fake_async_api):
+    async def main():
+        api = fake_async_api(lambda method, data: ok([]), delay=0.3, max_concurrency=1)
+        first, second = await asyncio.gather(
+            api.contest_list(),
+            api.contest_list(timeout=0.1),
+            return_exceptions=True,
+        )
+        assert first == []
+        assert isinstance(second, CodeforcesTimeoutError)
+        assert "concurrent requests" in str(second)
+        assert len(api.session.calls) == 1
+
+    asyncio.run(main())
+
+
+def test_partial_chunks(fake_async_api, respond):
+    def delay(method, data):
+        return 1 if "user4;" in data["handles"] else 0
+
+    async def main():
+        api = fake_async_api(respond, delay=delay, handles_chunk_size=3)
+        handles = ["user%d" % i for i in range(9)]
+        with pytest.raises(CodeforcesTimeoutError) as error:
+            await api.user_info(handles, timeout=0.1)
+        assert [user.handle for user in error.value.partial] == [
+            "user0",
+            "user1",
+            "user2",
+            "user6",
+            "user7",
+            "user8",
+        ]
+
+    asyncio.run(main())
+
+
+def test_sync_with_is_rejected(fake_async_api):
+    async def main():
+        api = fake_async_api([])
+        with pytest.raises(TypeError):
+            with api:
+                pass
+        async with api:
+            pass
+        assert api.session is None
+
+    asyncio.run(main())
+
+
+class WaitingExecutor(ThreadPoolExecutor):
+    """
+    Makes chunks only after started is set.
+    """
+
+    def __init__(self):
+        super().__init__(2)
+        self.started = threading.Event()
+
+    def submit(self, function, *args):
+        return super().submit(self._wait_and_run, function, *args)
+
+    def _wait_and_run(self, function, *args):
+        assert self.started.wait(5)
+        return function(*args)
+
+
+def test_pooled_decoding_doesnt_block_loop(fake_async_api, submissions):
+    async def main():
+        executor = WaitingExecutor()
+        api = fake_async_api(
+            [ok(submissions)], decode_executor=executor, decode_chunk_size=1
+        )
+
+        async def other():
+            await asyncio.sleep(0.01)
+            executor.started.set()
+
+        columns, _ = await asyncio.gather(api.contest_status(1, columnar=True), other())
+        assert list(columns["id"]) == [1, 2, 3]
+        executor.shutdown()
+
+    asyncio.run(main())
@@ -0,0 +1,55 @@
+"""
+Testing batching of user_info calls.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from codeforces_api import HandleNotFoundError, UserInfoBatcher
+
+
+def test_lookups_are_batched(fake_api, respond):
+    api = fake_api(respond)
+    batcher = UserInfoBatcher(api, delay=10)
+    handles = ["user%d" % i for i in range(50)] + ["user1"]
+    with ThreadPoolExecutor(len(handles)) as executor:
+        futures = list(executor.map(batcher.load, handles))
+    assert api.session.calls == []
+    batcher.flush()
+    users = [future.result(timeout=5) for future in futures]
+    batcher.close()
+    assert [user.handle for user in users] == handles
+    assert len(api.session.calls) == 1
+
+
+def test_missing_handles(fake_api, respond):
+    api = fake_api(respond)
+    batcher = UserInfoBatcher(api, delay=10)
+    futures = [batcher.load(handle) for handle in ["a", "missing1", "b", "missing2"]]
+    batcher.close()
+    assert futures[0].result().handle == "a"
+    assert futures[2].result().handle == "b"
+    for future, handle in ((futures[1], "missing1"), (futures[3], "missing2")):
+        with pytest.raises(HandleNotFoundError) as error:
+            future.result()
+        assert error.value.handle == handle
+    assert len(api.session.calls) == 3
+
+
+def test_max_batch_size(fake_api, respond):
+    api = fake_api(respond)
+    batcher = UserInfoBatcher(api, delay=60, max_batch_size=10)
+    users = batcher.get_many(["user%d" % i for i in range(20)], timeout=5)
+    batcher.close()
+    assert len(users) == 20
+    assert len(api.session.calls) == 2
+
+
+def test_load_after_close(fake_api, respond):
+    batcher = UserInfoBatcher(fake_api(respond), delay=10)
+    future = batcher.load("a")
+    batcher.close()
+    assert future.result(timeout=5).handle == "a"
+    with pytest.raises(RuntimeError):
+        batcher.load("b")
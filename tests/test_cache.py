@@ -0,0 +1,109 @@
+"""
+Testing caches of results.
+"""
+
+import time
+
+from codeforces_api import MemoryCache, SQLiteCache
+from conftest import FakeResponse, ok
+
+CONTEST = {
+    "id": 1,
+    "name": "Codeforces Beta Round 1",
+    "type": "CF",
+    "phase": "FINISHED",
+    "frozen": False,
+    "durationSeconds": 7200,
+}
+
+
+def test_cached_request(fake_api):
+    api = fake_api([ok([CONTEST])], cache=MemoryCache())
+    assert api.contest_list()[0].name == CONTEST["name"]
+    assert api.contest_list()[0].name == CONTEST["name"]
+    assert len(api.session.calls) == 1
+
+
+def test_raw_result_is_copied(fake_api):
+    api = fake_api([ok([CONTEST])], cache=MemoryCache())
+    api.contest_list(raw=True).append("changed")
+    contests = api.contest_list(raw=True)
+    contests[0]["name"] = "changed"
+    assert api.contest_list(raw=True) == [CONTEST]
+    assert len(api.session.calls) == 1
+
+
+def test_uncached_methods(fake_api):
+    api = fake_api([ok([]), ok([])], cache=MemoryCache())
+    api.recent_actions()
+    api.recent_actions()
+    assert len(api.session.calls) == 2
+
+
+def test_cache_key_contains_parameters(fake_api):
+    api = fake_api(lambda method, data: ok([]), cache=MemoryCache())
+    api.contest_list(gym=True)
+    api.contest_list(gym=False)
+    api.contest_list(gym=True)
+    assert len(api.session.calls) == 2
+
+
+def test_memory_cache_lru():
+    cache = MemoryCache(max_entries=2)
+    cache.set("a", 1, None)
+    cache.set("b", 2, None)
+    assert cache.get("a") == 1
+    cache.set("c", 3, None)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    cache.set("d", 4, 0.01)
+    time.sleep(0.02)
+    assert cache.get("d") is None
+
+
+def test_sqlite_cache(tmp_path):
+    path = str(tmp_path / "cache.sqlite")
+    cache = SQLiteCache(path, max_size=30)
+    cache.set("a", [1, 2, 3], None)
+    cache.set("b", {"x": "y" * 10}, 60)
+    cache.close()
+    cache = SQLiteCache(path, max_size=30)
+    assert cache.get("a") == [1, 2, 3]
+    cache.set("c", "z" * 10, None)
+    assert cache.get("b") is None
+    assert cache.get("a") == [1, 2, 3]
+    assert cache.ttl("user.friends") == 0
+
+
+def test_finished_contest_is_cached(fake_api):
+    running = dict(CONTEST, id=2, phase="CODING")
+
+    def respond(method, data):
+        if method == "contest.list":
+            return ok([CONTEST, running])
+        return ok([])
+
+    api = fake_api(respond, cache=MemoryCache(live_ttl=0))
+    for _ in range(2):
+        api.contest_hacks(1)
+        api.contest_hacks(2)
+        api.contest_rating_changes(1)
+    methods = [method for method, data in api.session.calls]
+    assert methods.count("contest.list") == 1
+    assert methods.count("contest.hacks") == 3
+    assert methods.count("contest.ratingChanges") == 2
+
+
+def test_failed_phase_lookup(fake_api):
+    def respond(method, data):
+        if method == "contest.list":
+            return FakeResponse(
+                503, {"status": "FAILED", "comment": "Call limit exceeded"}
+            )
+        return ok([])
+
+    api = fake_api(respond, cache=MemoryCache(default_ttl=60))
+    assert api.contest_hacks(1) == []
+    assert api.contest_hacks(1) == []
+    methods = [method for method, data in api.session.calls]
+    assert methods == ["contest.hacks", "contest.list"]
@@ -0,0 +1,76 @@
+"""
+Testing splitting of long handle lists into chunks.
+"""
+
+import pytest
+
+from codeforces_api import CodeforcesApiError, HandleNotFoundError, MemoryCache
+from conftest import FakeResponse
+
+
+def test_user_info_chunks(fake_api, respond):
+    api = fake_api(respond, handles_chunk_size=3)
+    handles = ["user%d" % i for i in range(10)]
+    assert [user.handle for user in api.user_info(handles)] == handles
+    assert len(api.session.calls) == 4
+
+
+def test_oversized_chunk_is_bisected(fake_api, respond):
+    def choke(method, data):
+        if data["handles"].count(";") > 2:
+            return FakeResponse(200, b"<html>Too many users</html>")
+        return respond(method, data)
+
+    api = fake_api(choke)
+    handles = ["user%d" % i for i in range(7)]
+    assert [user.handle for user in api.user_info(handles)] == handles
+
+
+@pytest.mark.parametrize("status", [400, 413, 414])
+def test_rejected_chunk_is_bisected(fake_api, status, respond):
+    def reject(method, data):
+        if data["handles"].count(";") > 2:
+            return FakeResponse(status, b"<html>Request is too large</html>")
+        return respond(method, data)
+
+    api = fake_api(reject)
+    handles = ["user%d" % i for i in range(7)]
+    assert [user.handle for user in api.user_info(handles)] == handles
+
+
+def test_other_errors_are_not_bisected(fake_api):
+    not_found = FakeResponse(
+        400, {"status": "FAILED", "comment": "contestId: Contest with id 1 not found"}
+    )
+    api = fake_api([not_found])
+    with pytest.raises(CodeforcesApiError) as error:
+        api.contest_standings(1, handles=["a", "b"])
+    assert error.value.status_code == 400
+    assert len(api.session.calls) == 1
+
+
+def test_skip_missing(fake_api, respond):
+    api = fake_api(respond, handles_chunk_size=2)
+    handles = ["a", "missing1", "b", "c", "missing2"]
+    with pytest.raises(HandleNotFoundError):
+        api.user_info(handles)
+    users = api.user_info(handles, skip_missing=True)
+    assert [user.handle for user in users] == ["a", "b", "c"]
+
+
+def test_contest_standings_chunks(fake_api, standings):
+    api = fake_api(standings, handles_chunk_size=2)
+    handles = ["a", "b", "c"]
+    result = api.contest_standings(1, handles=handles)
+    assert result["contest"].id == 1
+    assert [row.party.members[0].handle for row in result["rows"]] == handles
+    assert len(api.session.calls) == 2
+
+
+def test_all_handles_missing_with_cache(fake_api, standings):
+    api = fake_api(standings, cache=MemoryCache())
+    result = api.contest_standings(1, handles=["missing1"], skip_missing=True)
+    assert result["contest"].id == 1
+    assert result["rows"] == []
+    assert len(api.contest_standings(1, count=1)["rows"]) == 1
+    assert len(api.session.calls) == 2
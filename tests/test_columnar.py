@@ -0,0 +1,95 @@
+"""
+Testing columnar results.
+"""
+
+import math
+
+import pytest
+
+from codeforces_api import Columns, DictionaryColumn
+from codeforces_api.columnar import MISSING
+from conftest import ok
+
+RATING_CHANGE = {
+    "contestId": 1,
+    "contestName": "Codeforces Beta Round 1",
+    "handle": "tourist",
+    "rank": 1,
+    "ratingUpdateTimeSeconds": 0,
+    "oldRating": 1500,
+    "newRating": 1700,
+}
+
+
+def test_submissions(fake_api, submissions):
+    api = fake_api([ok(submissions)])
+    columns = api.contest_status(1, columnar=True)
+    assert isinstance(columns, Columns)
+    assert len(columns) == 3
+    assert list(columns["id"]) == [1, 2, 3]
+    assert columns["id"].typecode == "q"
+    assert list(columns["contest_id"]) == [MISSING] * 3
+    verdict = columns["verdict"]
+    assert isinstance(verdict, DictionaryColumn)
+    assert list(verdict) == ["OK", "WRONG_ANSWER", None]
+    assert list(verdict.codes) == [0, 1, MISSING]
+    assert math.isnan(columns["points"][0]) and columns["points"][2] == 10.5
+    assert columns["problem_index"].counts(verdict.mask("OK")) == {"A": 1, "B": 0}
+    assert columns["problem_index"].counts() == {"A": 2, "B": 1}
+    assert list(verdict.mask("TESTING")) == [0, 0, 0]
+
+
+def test_numpy(fake_api, submissions):
+    numpy = pytest.importorskip("numpy")
+    api = fake_api([ok(submissions)])
+    columns = api.contest_status(1, columnar=True).to_numpy()
+    assert columns["id"].dtype == numpy.int64
+    accepted = columns["verdict"].mask("OK")
+    assert accepted.tolist() == [True, False, False]
+    assert columns["problem_index"].counts(accepted) == {"A": 1, "B": 0}
+    assert columns["author_handles"].counts() == {"": 3}
+
+
+def test_rating_changes(fake_api):
+    api = fake_api([ok([RATING_CHANGE, dict(RATING_CHANGE, handle="Petr")])])
+    columns = api.contest_rating_changes(1, columnar=True)
+    assert list(columns["handle"]) == ["tourist", "Petr"]
+    assert list(columns["new_rating"]) == [1700, 1700]
+
+
+def test_standings(fake_api):
+    row = {
+        "party": {
+            "members": [{"handle": "a"}, {"handle": "b"}],
+            "participantType": "CONTESTANT",
+            "ghost": False,
+        },
+        "rank": 1,
+        "points": 2.0,
+        "penalty": 30,
+        "successfulHackCount": 0,
+        "unsuccessfulHackCount": 0,
+        "problemResults": [
+            {"points": 1.0, "rejectedAttemptCount": 0, "type": "FINAL"},
+            {"points": 0.0, "rejectedAttemptCount": 2, "type": "FINAL"},
+        ],
+    }
+    contest = {
+        "id": 1,
+        "name": "",
+        "type": "ICPC",
+        "phase": "FINISHED",
+        "frozen": False,
+        "durationSeconds": 0,
+    }
+    problems = [
+        {"index": "A", "name": "", "type": "PROGRAMMING"},
+        {"index": "B", "name": "", "type": "PROGRAMMING"},
+    ]
+    api = fake_api([ok({"contest": contest, "problems": problems, "rows": [row]})])
+    result = api.contest_standings(1, columnar=True)
+    rows = result["rows"]
+    assert result["problems"][1].index == "B"
+    assert list(rows["party_handles"]) == ["a;b"]
+    assert list(rows["rejected_attempt_count_B"]) == [2]
+    assert list(rows["best_submission_time_seconds_A"]) == [MISSING]
@@ -0,0 +1,90 @@
+"""
+Testing deadlines of calls.
+"""
+
+import time
+
+import pytest
+
+from codeforces_api import (
+    CodeforcesTimeoutError,
+    Deadline,
+    RateLimiter,
+    RetryPolicy,
+    UserInfoBatcher,
+)
+from conftest import FakeResponse, RecordingSession, ok
+
+
+def test_reserve_with_timeout():
+    limiter = RateLimiter(calls=1, period=10)
+    assert limiter.reserve(timeout=1) == 0.0
+    assert limiter.reserve(timeout=1) is None
+    assert not limiter.acquire(timeout=1)
+    assert 9 < limiter.reserve() <= 10
+
+
+def test_rate_limit_wait_beyond_deadline(fake_api):
+    api = fake_api([ok([]), ok([])], rate_limiter=RateLimiter(calls=1, period=10))
+    api.contest_list()
+    start = time.monotonic()
+    with pytest.raises(CodeforcesTimeoutError):
+        api.contest_list(timeout=1)
+    assert time.monotonic() - start < 0.5
+    assert len(api.session.calls) == 1
+
+
+def test_retry_beyond_deadline(fake_api):
+    call_limit = FakeResponse(
+        503,
+        {"status": "FAILED", "comment": "Call limit exceeded"},
+        {"Retry-After": "5"},
+    )
+    api = fake_api([call_limit, ok([])], retry_policy=RetryPolicy())
+    with pytest.raises(CodeforcesTimeoutError) as error:
+        api.contest_list(timeout=1)
+    assert error.value.__cause__.comment == "Call limit exceeded"
+    assert len(api.session.calls) == 1
+
+
+def test_http_timeouts_are_shortened(fake_api):
+    api = fake_api([])
+    api.session = RecordingSession([ok([])])
+    api.contest_list(timeout=2)
+    assert all(0 < timeout <= 2 for timeout in api.session.options["timeout"])
+
+
+def test_shared_budget(fake_api):
+    api = fake_api([ok([])])
+    budget = Deadline(0)
+    with pytest.raises(CodeforcesTimeoutError):
+        api.user_rating("tourist", timeout=budget)
+    assert api.session.calls == []
+
+
+def test_partial_chunks(fake_api, respond):
+    def slow(method, data):
+        if "user4;" in data["handles"]:
+            time.sleep(0.3)
+        return respond(method, data)
+
+    api = fake_api(slow, handles_chunk_size=3)
+    handles = ["user%d" % i for i in range(9)]
+    with pytest.raises(CodeforcesTimeoutError) as error:
+        api.user_info(handles, timeout=0.15)
+    assert [user.handle for user in error.value.partial] == [
+        "user0",
+        "user1",
+        "user2",
+        "user6",
+        "user7",
+        "user8",
+    ]
+
+
+def test_batcher_budget(fake_api, respond):
+    batcher = UserInfoBatcher(fake_api(respond), delay=10)
+    with pytest.raises(CodeforcesTimeoutError) as error:
+        batcher.get_many(["a", "b"], timeout=0.01)
+    assert error.value.partial == [None, None]
+    batcher.close()
@@ -0,0 +1,75 @@
+"""
+Testing export to NumPy and pandas.
+"""
+
+import math
+
+import pytest
+
+from codeforces_api import Submission, User, to_dataframe, to_records
+from codeforces_api.types import _lazy_type
+from conftest import ok, submission, user
+
+numpy = pytest.importorskip("numpy")
+
+SUBMISSIONS = [
+    dict(
+        submission(1),
+        verdict="OK",
+        author=dict(
+            submission(1)["author"], members=[{"handle": "a"}, {"handle": "b"}]
+        ),
+    ),
+    dict(submission(2), problem=dict(submission(2)["problem"], rating=1500)),
+]
+
+
+def test_records_from_objects_and_json():
+    objects = [Submission.de_json(obj) for obj in SUBMISSIONS]
+    lazy = [_lazy_type(Submission).de_json(obj) for obj in SUBMISSIONS]
+    for records in (
+        to_records(objects),
+        to_records(SUBMISSIONS, Submission),
+        to_records(lazy),
+    ):
+        assert records["id"].tolist() == [1, 2]
+        assert records["id"].dtype == numpy.int64
+        assert records["problem_index"].tolist() == ["A", "A"]
+        assert records["author_members_handle"].tolist() == ["a;b", ""]
+        assert records["verdict"].tolist() == ["OK", None]
+        assert math.isnan(records["problem_rating"][0])
+        assert records["problem_rating"][1] == 1500
+        assert records["author_ghost"].dtype == bool
+
+
+def test_dataframe():
+    pandas = pytest.importorskip("pandas")
+    frame = to_dataframe(SUBMISSIONS, Submission)
+    assert list(frame["id"]) == [1, 2]
+    assert str(frame["problem_rating"].dtype) == "Int64"
+    assert frame["problem_rating"].isna().tolist() == [True, False]
+    assert frame["verdict"].isna().tolist() == [False, True]
+    users = to_dataframe([User.de_json(user("tourist"))])
+    assert users["handle"][0] == "tourist"
+    assert len(to_dataframe([])) == 0
+    assert isinstance(frame, pandas.DataFrame)
+
+
+def test_columns(fake_api):
+    pytest.importorskip("pandas")
+    api = fake_api([ok(SUBMISSIONS)])
+    columns = api.contest_status(1, columnar=True)
+    records = to_records(columns)
+    assert records["verdict"].tolist() == ["OK", None]
+    assert records["id"].tolist() == [1, 2]
+    frame = to_dataframe(columns)
+    assert frame["verdict"].cat.categories.tolist() == ["OK"]
+    assert frame["verdict"].isna().tolist() == [False, True]
+    assert math.isnan(records["problem_rating"][0])
+    assert records["problem_rating"][1] == 1500
+    assert str(frame["problem_rating"].dtype) == "Int64"
+    assert frame["problem_rating"].isna().tolist() == [True, False]
+    assert frame["problem_rating"][1] == 1500
+    assert frame["id"].dtype == numpy.int64
+    numpy_frame = to_dataframe(columns.to_numpy())
+    assert numpy_frame["problem_rating"].isna().tolist() == [True, False]
@@ -0,0 +1,82 @@
+"""
+Testing selection of JSON library.
+"""
+
+import pytest
+
+from codeforces_api import get_json_backend, set_json_backend
+from codeforces_api import CodeforcesResponseError, json_backend
+from codeforces_api.api_request_maker import (
+    ERROR_SNIPPET_SIZE,
+    CodeforcesApiRequestMaker,
+)
+from codeforces_api.json_backend import BACKENDS
+from conftest import FakeResponse, ok
+
+
+def installed():
+    names = []
+    for name in BACKENDS:
+        try:
+            set_json_backend(name)
+        except ImportError:
+            continue
+        names.append(name)
+    set_json_backend()
+    return names
+
+
+@pytest.mark.parametrize("name", installed())
+def test_round_trip(name):
+    try:
+        set_json_backend(name)
+        assert get_json_backend() == name
+        document = {"status": "OK", "result": [{"handle": "Ёлка", "rating": 1.5}]}
+        data = json_backend.dumps(document)
+        assert isinstance(data, bytes)
+        assert json_backend.loads(data) == document
+        assert json_backend.loads(data.decode("utf-8")) == document
+        assert json_backend.loads(bytearray(data)) == document
+        assert (
+            CodeforcesApiRequestMaker().parse_response(200, data) == document["result"]
+        )
+    finally:
+        set_json_backend()
+
+
+def test_stdlib_is_always_available():
+    try:
+        set_json_backend("json")
+        assert json_backend.loads(b'{"a": [1]}') == {"a": [1]}
+    finally:
+        set_json_backend()
+    assert get_json_backend() == installed()[0]
+
+
+def test_unknown_backend():
+    with pytest.raises(ValueError):
+        set_json_backend("yaml")
+
+
+def test_api_uses_backend(fake_api):
+    try:
+        set_json_backend("json")
+        api = fake_api([ok([])])
+        assert api.contest_list() == []
+    finally:
+        set_json_backend()
+
+
+def test_response_is_read_once():
+    body = json_backend.dumps({"status": "OK", "result": [1, 2]})
+    response = FakeResponse(body=body)
+    response.iter_content = lambda chunk_size: [body[:5], body[5:]]
+    assert CodeforcesApiRequestMaker().get_response(response) == [1, 2]
+
+
+def test_error_contains_bounded_snippet():
+    body = b"<html>" + b"x" * ERROR_SNIPPET_SIZE * 4
+    with pytest.raises(CodeforcesResponseError) as error:
+        CodeforcesApiRequestMaker().parse_response(200, bytearray(body))
+    assert "<html>" in str(error.value)
+    assert len(str(error.value)) < ERROR_SNIPPET_SIZE * 2
@@ -0,0 +1,56 @@
+"""
+Testing incremental parsing of responses.
+"""
+
+import json
+
+import pytest
+
+from codeforces_api import CodeforcesApiError
+from codeforces_api.json_stream import JSONArrayStream
+from conftest import FakeResponse, ok, user
+
+DOCUMENT = {
+    "status": "OK",
+    "result": {
+        "problems": [{"name": "Ёлка", "points": 1000.5}, 17, [1, 2], "A, ]"],
+        "problemStatistics": [{"index": "A"}],
+    },
+}
+
+
+def parse(document, key, chunk_size):
+    body = json.dumps(document, ensure_ascii=False).encode("utf-8")
+    stream = JSONArrayStream(key)
+    elements = []
+    for start in range(0, len(body), chunk_size):
+        elements.extend(stream.feed(body[start : start + chunk_size]))
+    return elements, stream.close()
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 7, 1000])
+def test_elements(chunk_size):
+    elements, document = parse(DOCUMENT, "problems", chunk_size)
+    assert elements == DOCUMENT["result"]["problems"]
+    assert document is None
+
+
+def test_document_without_array():
+    failed = {"status": "FAILED", "comment": "Call limit exceeded"}
+    assert parse(failed, "result", 3) == ([], failed)
+
+
+def test_stream_user_rated_list(fake_api):
+    users = [user("user%d" % i) for i in range(100)]
+    api = fake_api([ok(users)])
+    assert [user.handle for user in api.stream_user_rated_list()] == [
+        user["handle"] for user in users
+    ]
+
+
+def test_stream_failed(fake_api):
+    failed = {"status": "FAILED", "comment": "contestId: Contest not found"}
+    api = fake_api([FakeResponse(400, failed)])
+    with pytest.raises(CodeforcesApiError) as error:
+        list(api.stream_contest_status(0))
+    assert error.value.comment == failed["comment"]
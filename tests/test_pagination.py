@@ -0,0 +1,28 @@
+"""
+Testing iterating over results page by page.
+"""
+
+from conftest import submission
+
+
+def test_iter_user_status(fake_api, pages):
+    submissions = [submission(identifier) for identifier in range(25, 0, -1)]
+    for prefetch in (True, False):
+        api = fake_api(pages(submissions))
+        identifiers = [
+            submission.id
+            for submission in api.iter_user_status("a", page_size=10, prefetch=prefetch)
+        ]
+        assert identifiers == list(range(25, 0, -1))
+        assert len(api.session.calls) == 3
+
+
+def test_shifted_pages_are_skipped(fake_api, pages):
+    submissions = [submission(identifier) for identifier in range(20, 0, -1)]
+    api = fake_api(pages(submissions))
+    iterator = api.iter_contest_status(1, page_size=10, prefetch=False)
+    first = [next(iterator).id for _ in range(10)]
+    submissions.insert(0, submission(21))
+    rest = [submission.id for submission in iterator]
+    assert first + rest == list(range(20, 0, -1))
+    assert api.session.calls[0][1]["from"] == "1"
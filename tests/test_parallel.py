@@ -0,0 +1,49 @@
+"""
+Testing making columnar results by other processes.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from codeforces_api import Columns
+from codeforces_api.columnar import concat_columns, to_columns
+from codeforces_api.types import Submission
+from conftest import ok
+
+
+class FailingExecutor:
+    def submit(self, *args):
+        raise AssertionError("Executor shouldn't be used")
+
+
+@pytest.fixture(scope="module")
+def executor():
+    with ProcessPoolExecutor(2) as executor:
+        yield executor
+
+
+def test_columns(fake_api, executor, submissions):
+    api = fake_api([ok(submissions)], decode_executor=executor, decode_chunk_size=1)
+    columns = api.contest_status(1, columnar=True)
+    assert isinstance(columns, Columns)
+    assert len(columns) == 3
+    assert list(columns["id"]) == [1, 2, 3]
+    assert list(columns["verdict"]) == ["OK", "WRONG_ANSWER", None]
+    assert list(columns["problem_index"]) == ["A", "B", "A"]
+
+
+def test_short_results_and_objects_stay_in_process(fake_api, submissions):
+    api = fake_api([ok(submissions)] * 2, decode_executor=FailingExecutor())
+    assert len(api.contest_status(1, columnar=True)) == 3
+    api._decoding_pool.chunk_size = 1
+    with pytest.warns(RuntimeWarning, match="decode_executor"):
+        assert [obj.id for obj in api.contest_status(1)] == [1, 2, 3]
+
+
+def test_concat_columns(submissions):
+    parts = [to_columns(Submission, [obj]) for obj in submissions]
+    columns = concat_columns(parts)
+    expected = to_columns(Submission, submissions)
+    for name in expected:
+        assert repr(list(columns[name])) == repr(list(expected[name]))
@@ -0,0 +1,96 @@
+"""
+Testing raw results and projections of fields.
+"""
+
+import pytest
+
+from conftest import ok, submission, user
+
+SUBMISSION = dict(
+    submission(1),
+    verdict="OK",
+    author={
+        "members": [{"handle": "tourist"}, {"handle": "Petr"}],
+        "participantType": "CONTESTANT",
+        "ghost": False,
+    },
+)
+
+
+def test_raw(fake_api):
+    api = fake_api([ok([SUBMISSION])])
+    assert api.contest_status(1, raw=True) == [SUBMISSION]
+
+
+def test_fields(fake_api):
+    api = fake_api([ok([SUBMISSION])])
+    fields = ["id", "problem.index", "verdict", "author.members.handle"]
+    (result,) = api.contest_status(1, fields=fields)
+    assert result == (1, "A", "OK", ["tourist", "Petr"])
+    assert result.problem_index == "A"
+    assert result.author_members_handle == ["tourist", "Petr"]
+
+
+def test_fields_of_nested_object(fake_api):
+    api = fake_api([ok([SUBMISSION])])
+    (result,) = api.contest_status(1, fields=["problem", "contest_id"])
+    assert result.problem.to_dict() == {
+        "index": "A",
+        "name": "",
+        "problem_type": "PROGRAMMING",
+        "contest_id": None,
+        "problemset_name": None,
+        "points": None,
+        "rating": None,
+        "tags": None,
+    }
+    assert result.contest_id is None
+
+
+def test_unknown_field(fake_api):
+    api = fake_api([ok([SUBMISSION])])
+    with pytest.raises(ValueError):
+        api.contest_status(1, fields=["problem.unknown"])
+    with pytest.raises(ValueError):
+        api.contest_status(1, fields=["verdict.name"])
+
+
+def test_fields_of_chunked_call(fake_api):
+    api = fake_api(
+        lambda method, data: ok([user(h) for h in data["handles"].split(";") if h]),
+        handles_chunk_size=1,
+    )
+    result = api.user_info(["a", "b"], fields="handle")
+    assert [row.handle for row in result] == ["a", "b"]
+
+
+def test_fields_of_standings(fake_api):
+    row = {
+        "party": SUBMISSION["author"],
+        "rank": 1,
+        "points": 1.0,
+        "penalty": 0,
+        "successfulHackCount": 0,
+        "unsuccessfulHackCount": 0,
+        "problemResults": [],
+    }
+    contest = {
+        "id": 1,
+        "name": "",
+        "type": "CF",
+        "phase": "FINISHED",
+        "frozen": False,
+        "durationSeconds": 0,
+    }
+    api = fake_api([ok({"contest": contest, "problems": [], "rows": [row]})])
+    result = api.contest_standings(1, fields=["rank", "party.members.handle"])
+    assert result["contest"].id == 1
+    assert result["rows"] == [(1, ["tourist", "Petr"])]
+
+
+def test_fields_of_pages(fake_api, pages):
+    api = fake_api(pages([submission(i) for i in range(5, 0, -1)]))
+    result = api.iter_user_status("tourist", page_size=2, fields=["id"], raw=False)
+    assert [row.id for row in result] == [5, 4, 3, 2, 1]
+    result = api.iter_user_status("tourist", page_size=2, raw=True)
+    assert [row["id"] for row in result] == [5, 4, 3, 2, 1]
@@ -0,0 +1,42 @@
+"""
+Testing rate limiters.
+"""
+
+import threading
+
+from codeforces_api import FileRateLimiter, RateLimiter
+
+
+def test_rate_limiter_burst():
+    limiter = RateLimiter(calls=5, period=1)
+    delays = [limiter.reserve() for _ in range(7)]
+    assert delays[:5] == [0.0] * 5
+    assert 0.15 < delays[5] <= 0.2
+    assert 0.35 < delays[6] <= 0.4
+
+
+def test_rate_limiter_threads():
+    limiter = RateLimiter(calls=1, period=2)
+    delays = []
+
+    def reserve():
+        delays.append(limiter.reserve())
+
+    threads = [threading.Thread(target=reserve) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    delays.sort()
+    assert delays[0] == 0.0
+    for previous, current in zip(delays, delays[1:]):
+        assert 1.9 < current - previous <= 2.0
+
+
+def test_file_rate_limiter_is_shared(tmp_path):
+    path = str(tmp_path / "limit")
+    first = FileRateLimiter(path, calls=1, period=2)
+    second = FileRateLimiter(path, calls=1, period=2)
+    assert first.reserve() == 0.0
+    assert 1.9 < second.reserve() <= 2.0
+    assert 3.9 < first.reserve() <= 4.0
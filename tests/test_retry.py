@@ -0,0 +1,48 @@
+"""
+Testing retries of failed requests.
+"""
+
+import pytest
+
+from codeforces_api import CodeforcesApiError, RetryPolicy
+from conftest import FakeResponse, ok
+
+
+def test_transient_errors_are_retried(fake_api, call_limit):
+    api = fake_api(
+        [FakeResponse(502, b"<html>"), call_limit, ok([])],
+        retry_policy=RetryPolicy(backoff_base=0),
+    )
+    assert api.contest_list() == []
+    assert len(api.session.calls) == 3
+
+
+def test_max_attempts(fake_api, call_limit):
+    api = fake_api(
+        [call_limit, call_limit, ok([])],
+        retry_policy=RetryPolicy(max_attempts=2, backoff_base=0),
+    )
+    with pytest.raises(CodeforcesApiError) as error:
+        api.contest_list()
+    assert error.value.comment == "Call limit exceeded"
+    assert len(api.session.calls) == 2
+
+
+def test_permanent_errors_are_not_retried(fake_api):
+    not_found = FakeResponse(
+        400, {"status": "FAILED", "comment": "handles: User with handle a not found"}
+    )
+    api = fake_api([not_found, ok([])], retry_policy=RetryPolicy(backoff_base=0))
+    with pytest.raises(CodeforcesApiError) as error:
+        api.user_info(["a"])
+    assert error.value.status_code == 400
+    assert len(api.session.calls) == 1
+
+
+def test_delay():
+    policy = RetryPolicy(backoff_base=1, backoff_cap=5, jitter=False)
+    error = CodeforcesApiError(status_code=503)
+    assert [policy.delay(error, attempt) for attempt in range(1, 5)] == [1, 2, 4, 5]
+    assert policy.delay(CodeforcesApiError(retry_after=10), 1) == 10
+    jittered = RetryPolicy(backoff_base=1, backoff_cap=5)
+    assert 0 <= jittered.delay(error, 3) <= 4
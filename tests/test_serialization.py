@@ -0,0 +1,82 @@
+"""
+Testing binary serialization of returned objects.
+"""
+
+import pickle
+
+import pytest
+
+from codeforces_api.columnar import to_columns
+from codeforces_api.serialization import from_bytes, from_pickle, to_bytes, to_pickle
+from codeforces_api.types import (
+    Member,
+    Party,
+    RanklistRow,
+    RecentAction,
+    Submission,
+    _Interner,
+    _lazy_type,
+)
+from conftest import submission
+
+
+def test_round_trip():
+    submissions = [Submission.de_json(submission(index)) for index in range(5)]
+    submissions[1].verdict = None
+    submissions[2].points = 1.5
+    result = from_bytes(to_bytes(submissions))
+    assert [obj.to_dict() for obj in result] == [obj.to_dict() for obj in submissions]
+    assert from_bytes(to_bytes(submissions[0])).to_dict() == submissions[0].to_dict()
+    assert from_bytes(to_bytes([])) == []
+
+
+def test_shared_objects_stay_shared():
+    interner = _Interner()
+    submissions = [Submission.de_json(submission(1), interner) for _ in range(3)]
+    result = from_bytes(to_bytes(submissions))
+    assert result[0].problem is result[2].problem
+    assert result[0].author is result[1].author
+    assert result[0] is not result[1]
+
+
+def test_nested_lists_and_unset_fields():
+    row = RanklistRow(
+        Party([Member("a"), Member("b")], "CONTESTANT", False), 1, 0.0, 0, 0, 0, []
+    )
+    assert from_bytes(to_bytes(row)).to_dict() == row.to_dict()
+    action = from_bytes(to_bytes(RecentAction(1, {})))
+    assert action.time_seconds == 1
+    assert not hasattr(action, "comment")
+
+
+def test_lazy_objects_and_errors():
+    lazy = _lazy_type(Submission).de_json(submission(1))
+    assert from_bytes(to_bytes(lazy)).to_dict() == lazy.to_dict()
+    with pytest.raises(TypeError):
+        to_bytes([lazy, Member("a")])
+    with pytest.raises(ValueError):
+        from_bytes(b"data")
+    with pytest.raises(ValueError):
+        from_bytes(to_bytes(lazy)[:-3])
+
+
+def test_pickle_is_compact():
+    interner = _Interner()
+    submissions = [Submission.de_json(submission(1), interner) for _ in range(3)]
+    data = pickle.dumps(submissions)
+    assert b"creation_time_seconds" not in data
+    result = pickle.loads(data)
+    assert [obj.to_dict() for obj in result] == [obj.to_dict() for obj in submissions]
+    assert result[0].problem is result[2].problem
+    action = pickle.loads(pickle.dumps(RecentAction(1, {})))
+    assert not hasattr(action, "comment")
+
+
+def test_pickle_columns_out_of_band():
+    columns = to_columns(Submission, [submission(index) for index in range(5)])
+    data, buffers = to_pickle(columns)
+    assert buffers
+    result = from_pickle(data, [buffer.raw() for buffer in buffers])
+    assert list(result["id"]) == list(range(5))
+    assert list(result["testset"]) == ["TESTS"] * 5
+    assert list(pickle.loads(pickle.dumps(columns))["id"]) == list(range(5))
@@ -0,0 +1,55 @@
+"""
+Testing signing of requests.
+"""
+
+import hashlib
+import urllib
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from codeforces_api.api_request_maker import CodeforcesApiRequestMaker
+
+
+def check_signature(data, method, secret):
+    fields = {key: value for key, value in data.items() if key != "apiSig"}
+    rand = data["apiSig"][:6]
+    signature = "%s/%s?%s#%s" % (
+        rand,
+        method,
+        urllib.parse.urlencode(sorted(fields.items()), safe=";"),
+        secret,
+    )
+    assert data["apiSig"] == rand + hashlib.sha512(signature.encode()).hexdigest()
+    return rand
+
+
+def test_concurrent_requests_have_own_nonces():
+    maker = CodeforcesApiRequestMaker("key", "secret")
+
+    def sign(index):
+        data = maker.generate_request("user.friends", onlyOnline=str(index))["data"]
+        return check_signature(data, "user.friends", "secret")
+
+    with ThreadPoolExecutor(8) as executor:
+        nonces = list(executor.map(sign, range(200)))
+    assert len(set(nonces)) > 150
+    assert all(100000 <= int(nonce) <= 999999 for nonce in nonces)
+
+
+def test_specified_random_number():
+    maker = CodeforcesApiRequestMaker("key", "secret", random_number=123456)
+    data = maker.generate_request("user.friends")["data"]
+    assert check_signature(data, "user.friends", "secret") == "123456"
+    maker.renew_rand(654321)
+    data = maker.generate_request("user.friends")["data"]
+    assert check_signature(data, "user.friends", "secret") == "654321"
+    with pytest.raises(Exception):
+        maker.renew_rand(12)
+    with pytest.raises(Exception):
+        CodeforcesApiRequestMaker("key", "secret", random_number=1234567)
+
+
+def test_anonymous_requests_are_not_signed():
+    data = CodeforcesApiRequestMaker().generate_request("user.info", handles="a;")
+    assert data["data"] == {"handles": "a;"}
@@ -0,0 +1,92 @@
+"""
+Testing coalescing of identical calls.
+"""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from codeforces_api.single_flight import AsyncSingleFlight, SingleFlight
+from conftest import ok
+
+
+def test_identical_calls_share_request(fake_api):
+    def respond(method, data):
+        time.sleep(0.2)
+        return ok([])
+
+    api = fake_api(respond, single_flight=True)
+    with ThreadPoolExecutor(8) as executor:
+        results = list(executor.map(lambda _: api.contest_hacks(1), range(8)))
+    assert len(api.session.calls) == 1
+    assert all(result is results[0] for result in results)
+    api.contest_hacks(1)
+    api.contest_hacks(2)
+    assert len(api.session.calls) == 3
+
+
+def test_exception_is_shared():
+    single_flight = SingleFlight()
+    started = threading.Event()
+    calls = []
+
+    def fail():
+        calls.append(1)
+        started.set()
+        time.sleep(0.1)
+        raise ValueError("failed")
+
+    def follower():
+        started.wait()
+        return single_flight.do("key", fail)
+
+    with ThreadPoolExecutor(2) as executor:
+        leader = executor.submit(single_flight.do, "key", fail)
+        waiting = executor.submit(follower)
+        for future in (leader, waiting):
+            with pytest.raises(ValueError):
+                future.result()
+    assert len(calls) == 1
+
+
+def test_async_leader_timeout_cancels_call():
+    single_flight = AsyncSingleFlight()
+    cancelled = []
+
+    async def slow():
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+
+    async def main():
+        with pytest.raises(asyncio.TimeoutError):
+            await single_flight.do("key", slow, timeout=0.01)
+        assert not single_flight.running("key")
+        await asyncio.sleep(0)
+
+    asyncio.run(main())
+    assert cancelled == [True]
+
+
+def test_async_call_continues_for_followers():
+    single_flight = AsyncSingleFlight()
+
+    async def slow():
+        await asyncio.sleep(0.1)
+        return 1
+
+    async def main():
+        leader = asyncio.ensure_future(single_flight.do("key", slow, timeout=0.01))
+        await asyncio.sleep(0)
+        assert single_flight.running("key")
+        follower = single_flight.do("key", slow, timeout=1)
+        assert await follower == 1
+        with pytest.raises(asyncio.TimeoutError):
+            await leader
+
+    asyncio.run(main())
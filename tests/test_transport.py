@@ -0,0 +1,51 @@
+"""
+Testing shared transport.
+"""
+
+from codeforces_api import CodeforcesApi, CodeforcesParser, Transport
+
+from conftest import RecordingSession, ok
+
+
+def test_timeouts_and_proxies_are_passed():
+    transport = Transport(
+        connect_timeout=3, read_timeout=7, proxies={"https": "http://proxy:3128"}
+    )
+    api = CodeforcesApi(transport=transport)
+    api.session = RecordingSession([ok([])])
+    api.contest_list()
+    assert api.session.options["timeout"] == (3, 7)
+    assert api.session.options["proxies"] == {"https": "http://proxy:3128"}
+    assert api.session.options["stream"]
+
+
+def test_pool_settings():
+    transport = Transport(pool_connections=2, pool_maxsize=30, pool_block=True)
+    adapter = transport.session.get_adapter("https://codeforces.com/api/")
+    assert adapter._pool_connections == 2
+    assert adapter._pool_maxsize == 30
+    assert adapter._pool_block
+    assert transport.session.headers["Connection"] == "keep-alive"
+    transport = Transport(keep_alive=False)
+    assert transport.session.headers["Connection"] == "close"
+
+
+def test_clients_share_transport():
+    transport = Transport()
+    first = CodeforcesApi(transport=transport)
+    second = CodeforcesApi("key", "secret", transport=transport)
+    parser = CodeforcesParser(transport=transport)
+    assert first.session is second.session is parser.session is transport.session
+    assert CodeforcesApi().session is not transport.session
+
+
+def test_shared_transport_isnt_closed_by_client():
+    closed = []
+    transport = Transport()
+    transport.close = lambda: closed.append(True)
+    with CodeforcesApi(transport=transport):
+        pass
+    assert closed == []
+    with CodeforcesApi() as api:
+        api.transport.close = lambda: closed.append(True)
+    assert closed == [True]
@@ -0,0 +1,131 @@
+"""
+Testing representation of returned objects.
+"""
+
+import pickle
+
+import pytest
+
+from codeforces_api.types import (
+    BlogEntry,
+    Comment,
+    Member,
+    Party,
+    Problem,
+    RecentAction,
+    Submission,
+    _Interner,
+    _lazy_type,
+)
+from conftest import ok, submission
+
+COMMENT = {
+    "id": 1,
+    "creationTimeSeconds": 0,
+    "commentatorHandle": "tourist",
+    "locale": "en",
+    "text": "text",
+    "rating": 5,
+}
+
+AUTHOR = {
+    "members": [{"handle": "tourist"}],
+    "participantType": "CONTESTANT",
+    "ghost": False,
+}
+
+
+def test_objects_have_no_dict():
+    result = Submission.de_json(submission(1))
+    for obj in (result, result.problem, result.author):
+        assert not hasattr(obj, "__dict__")
+    with pytest.raises(AttributeError):
+        result.unknown = 1
+
+
+def test_to_dict_and_str():
+    result = Submission.de_json(submission(1))
+    assert result.to_dict()["problem"]["index"] == "A"
+    assert "'id': 1" in str(result)
+    assert "'index': 'A'" in str(result)
+    party = Party([Member("tourist")], "CONTESTANT", False)
+    assert party.to_dict()["members"] == [{"handle": "tourist"}]
+
+
+def test_pickle():
+    result = pickle.loads(pickle.dumps(Submission.de_json(submission(1))))
+    assert result.to_dict() == Submission.de_json(submission(1)).to_dict()
+
+
+def test_recent_action():
+    action = RecentAction.de_json({"timeSeconds": 1, "comment": COMMENT})
+    assert not hasattr(action, "blog_entry")
+    assert action.to_dict() == {
+        "time_seconds": 1,
+        "comment": Comment.de_json(COMMENT).to_dict(),
+    }
+    assert isinstance(action.comment, Comment)
+    assert not isinstance(action.comment, BlogEntry)
+
+
+def test_lazy_client(fake_api):
+    document = dict(submission(1), verdict="OK")
+    api = fake_api([ok([document])], lazy=True)
+    result = api.user_status("tourist")[0]
+    assert isinstance(result, Submission)
+    assert result.verdict == "OK"
+    with pytest.raises(AttributeError):
+        # Nested objects aren't decoded until they are accessed.
+        Submission.__dict__["problem"].__get__(result)
+    assert result.problem.problem_type == "PROGRAMMING"
+    assert result.problem is result.problem
+    assert result.to_dict() == Submission.de_json(document).to_dict()
+    assert str(result) == str(Submission.de_json(document))
+
+
+def test_lazy_objects():
+    document = submission(1)
+    result = _lazy_type(Submission).de_json(document)
+    result.verdict = "OK"
+    assert result.verdict == "OK"
+    assert "verdict" not in document
+    copy = pickle.loads(pickle.dumps(result))
+    assert copy.to_dict() == result.to_dict()
+    action = _lazy_type(RecentAction).de_json({"timeSeconds": 1, "comment": COMMENT})
+    assert not hasattr(action, "blog_entry")
+    assert action.to_dict() == RecentAction.de_json(action._json).to_dict()
+
+
+def test_interning(fake_api):
+    documents = [dict(submission(i), verdict="OK", author=AUTHOR) for i in range(3)]
+    api = fake_api([ok(documents), ok(documents)], intern=True)
+    first, second, third = api.contest_status(1)
+    assert first.problem is second.problem is third.problem
+    assert first.author is second.author
+    assert first.author.members[0] is second.author.members[0]
+    assert first.verdict is second.verdict
+    assert first.to_dict() == Submission.de_json(documents[0]).to_dict()
+    api.intern = False
+    first, second, _ = api.contest_status(1)
+    assert first.problem is not second.problem
+
+
+def test_interned_parties_differ():
+    interner = _Interner()
+    party = dict(AUTHOR, startTimeSeconds=1)
+    first = Party.de_json(AUTHOR, interner)
+    assert Party.de_json(party, interner) is not first
+    assert Party.de_json(party, interner).members[0] is first.members[0]
+
+
+def test_generated_methods():
+    problem = Problem.de_json(submission(1)["problem"])
+    assert problem.problem_type == submission(1)["problem"]["type"]
+    assert Problem("A", "name", "PROGRAMMING").tags is None
+    result = Submission.de_json(submission(1))
+    arguments = {
+        field.argument: getattr(result, field.name) for field in Submission._schema
+    }
+    assert Submission(**arguments).to_dict() == result.to_dict()
+    with pytest.raises(KeyError):
+        Member.de_json({})